@@ -1,31 +1,60 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+# Unused here (HTTP goes through metered_get); kept because
+# tests/test_runtime_contract.py patches backtest_engine.requests.get.
 import requests
 import pandas as pd
 import numpy as np
-import statsmodels.api as sm
-from datetime import datetime
-import sys
-import io
-import matplotlib.pyplot as plt
+from datetime import date, datetime
+from functools import partial
+from src.core.bootstrap_intervals import (
+    BootstrapIntervalEngine,
+    residual_bootstrap_draws,
+)
+from src.core.linalg_kernels import add_intercept, ols, ridge
+from src.core.model_snapshot import load_snapshot, save_snapshot
+from src.core.pipeline_graph import PipelineGraph
+from src.core.runtime import cache_dir, ensure_utf8_stdout, fred_observations_url
+from src.core.tracing import propagate, span, traced
+from src.data_utils.http_metrics import metered_get, record_fallback
 from src.data_utils.statcan_fetcher import StatCanDataFetcher
+from src.data_utils.vintage_store import (
+    REALTIME_END,
+    REALTIME_START,
+    VintageSeries,
+    VintageStore,
+)
+from src.engine.gdp_nowcast_engine import canada_guardrail
 
-if sys.stdout.encoding != "utf-8":
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
 
-FRED_API_KEY = os.getenv("FRED_API_KEY")
+# Indicators that enter the panel in first differences rather than log growth.
+DIFFERENCED = {"UNRATE", "LRHUTTTTCAM156S", "NFCI", "T10Y2Y", "CPALTT01CAM659N", "DEXCAUS"}
 
 
 class BacktestEngine:
     """GDP Nowcast backtest using expanding window OLS."""
 
     def __init__(self):
-        self.fred_url = "https://api.stlouisfed.org/fred/series/observations"
+        self.fred_url = fred_observations_url()
+        self.fred_api_key = os.getenv("FRED_API_KEY")
         self.calibration_alpha = 5.0
         self.max_abs_adjustment = 0.35
         self.min_calibration_history = 8
         self.calibration_validation_window = 6
         self.calibration_min_gain = 0.01
         self.backtest_as_of_day = 105
+        # First observation pulled with its vintages, and FRED's page size.
+        self.vintage_observation_start = "1985-01-01"
+        self.vintage_page_limit = 100000
+        # Stored vintages; None means cache_dir("vintages").
+        self.vintage_cache_directory = None
+        self.interval_engine = BootstrapIntervalEngine(
+            n_boot=1000, chunk_size=250, budget_seconds=0.25, levels=(0.05, 0.95)
+        )
+        # Memoised per-quarter backtest graph per country.
+        self._pipelines = {}
+        self._pipelines_lock = threading.Lock()
         self.countries = {
             "US": {
                 "gdp_id": "GDPC1",
@@ -89,26 +118,114 @@ class BacktestEngine:
 
     def fetch_fred(self, series_id, limit=1000):
         """Helper to fetch historical data from FRED."""
-        if not FRED_API_KEY:
-            return pd.DataFrame()
-
-        params = {
-            "series_id": series_id,
-            "api_key": FRED_API_KEY,
-            "file_type": "json",
-            "sort_order": "desc",
-            "limit": limit,
+        with span("fetch", f"FRED {series_id}", limit=limit):
+            if not self.fred_api_key:
+                return pd.DataFrame()
+
+            params = {
+                "series_id": series_id,
+                "api_key": self.fred_api_key,
+                "file_type": "json",
+                "sort_order": "desc",
+                "limit": limit,
+            }
+            try:
+                response = metered_get("fred", self.fred_url, params=params, timeout=15)
+                response.raise_for_status()
+                data = response.json()
+                df = pd.DataFrame(data["observations"])
+                df["date"] = pd.to_datetime(df["date"])
+                df["value"] = pd.to_numeric(df["value"], errors="coerce")
+                return df.dropna().set_index("date")[["value"]].sort_index()
+            except Exception as e:
+                return pd.DataFrame()
+
+    def fetch_vintages(self, series_id, realtime_start=REALTIME_START):
+        """ALFRED vintages of a series from ``realtime_start`` on, or None."""
+        with span("fetch", f"ALFRED {series_id}"):
+            if not self.fred_api_key:
+                return None
+
+            records = []
+            try:
+                while True:
+                    params = {
+                        "series_id": series_id,
+                        "api_key": self.fred_api_key,
+                        "file_type": "json",
+                        "realtime_start": realtime_start,
+                        "realtime_end": REALTIME_END,
+                        "observation_start": self.vintage_observation_start,
+                        "limit": self.vintage_page_limit,
+                        "offset": len(records),
+                    }
+                    response = metered_get("fred", self.fred_url, params=params, timeout=30)
+                    response.raise_for_status()
+                    data = response.json()
+                    page = data["observations"]
+                    records.extend(page)
+                    if not page or len(records) >= int(data.get("count", 0)):
+                        break
+                return VintageSeries.from_records(records, series_id)
+            except Exception:
+                return None
+
+    def _vintage_path(self, series_id):
+        directory = self.vintage_cache_directory or cache_dir("vintages")
+        return os.path.join(directory, f"{series_id}.json")
+
+    def cached_vintages(self, series_id):
+        """Stored vintages of a series, topped up with those published since.
+
+        Only the real-time window after the newest stored vintage is
+        requested; the full history is fetched when nothing is stored yet.
+        If the top-up fails, the stored vintages are used as they are.
+        """
+        path = self._vintage_path(series_id)
+        fingerprints = {
+            "source": self.fred_url,
+            "observation_start": self.vintage_observation_start,
         }
-        try:
-            response = requests.get(self.fred_url, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            df = pd.DataFrame(data["observations"])
-            df["date"] = pd.to_datetime(df["date"])
-            df["value"] = pd.to_numeric(df["value"], errors="coerce")
-            return df.dropna().set_index("date")[["value"]].sort_index()
-        except Exception as e:
-            return pd.DataFrame()
+        snapshot = load_snapshot(path, "vintages")
+        stored = None
+        if snapshot and snapshot["fingerprints"] == fingerprints:
+            stored = VintageSeries.from_state(snapshot["state"], series_id)
+
+        if stored is None or not len(stored):
+            vintages = self.fetch_vintages(series_id)
+        else:
+            since = stored.newest_vintage + np.timedelta64(1, "D")
+            # FRED rejects real-time dates after today.
+            if since > np.datetime64(date.today(), "D"):
+                return stored
+            newer = self.fetch_vintages(series_id, realtime_start=str(since))
+            if newer is None:
+                record_fallback(series_id, "stored_vintages")
+                return stored
+            vintages = stored.update(newer, since)
+            if np.array_equal(vintages.keys, stored.keys) and np.array_equal(
+                vintages.realtime_end, stored.realtime_end
+            ):
+                return stored
+
+        if vintages is not None and len(vintages):
+            save_snapshot(path, "vintages", fingerprints, vintages.to_state())
+        return vintages
+
+    def load_vintages(self, country_code):
+        """VintageStore of the GDP series and the core indicators of a country.
+
+        The series are loaded concurrently, each from its stored vintages
+        plus those published since (see ``cached_vintages``).
+        """
+        config = self.countries[country_code]
+        series_ids = [config["gdp_id"], *config["indicators"]]
+        store = VintageStore()
+        with ThreadPoolExecutor(max_workers=len(series_ids)) as pool:
+            for vintages in pool.map(propagate(self.cached_vintages), series_ids):
+                if vintages is not None:
+                    store.add(vintages)
+        return store
 
     def nowcast_missing(self, series):
         """AR(1) logic to fill the ragged edge of indicators."""
@@ -121,8 +238,14 @@ class BacktestEngine:
             series.iloc[-1] = mu + phi * (clean_series.iloc[-1] - mu)
         return series
 
-    def prepare_data(self, country_code):
-        """Fetches and transforms data for a specific country."""
+    @traced("transform", "prepare data")
+    def prepare_data(self, country_code, real_time=False):
+        """Fetches and transforms data for a specific country.
+
+        With ``real_time`` the bundle also carries the ALFRED vintages of GDP
+        and the core indicators, which make the expanding-window backtest
+        real-time.
+        """
         config = self.countries[country_code]
         statcan = StatCanDataFetcher()
 
@@ -131,12 +254,7 @@ class BacktestEngine:
             print(f"  [ERROR] Could not fetch GDP for {country_code}")
             return None
 
-        gdp_series = df_gdp.iloc[:, 0]
-        gdp_growth = (
-            (np.log(gdp_series.resample("QS").mean()).diff() * 100)
-            .dropna()
-            .rename("GDP")
-        )
+        gdp_growth = self._gdp_growth(df_gdp.iloc[:, 0])
 
         def load_indicators(indicators):
             loaded = {}
@@ -149,19 +267,7 @@ class BacktestEngine:
                 if df.empty:
                     print(f"  [WARN] Failed to fetch indicator: {name} ({sid})")
                     continue
-
-                series = df.iloc[:, 0]
-                if sid in {
-                    "UNRATE",
-                    "LRHUTTTTCAM156S",
-                    "NFCI",
-                    "T10Y2Y",
-                    "CPALTT01CAM659N",
-                    "DEXCAUS",
-                }:
-                    loaded[name] = series.diff()
-                else:
-                    loaded[name] = np.log(series).diff() * 100
+                loaded[name] = self._indicator_growth(sid, df.iloc[:, 0])
             return loaded
 
         m_data = load_indicators(config["indicators"])
@@ -171,22 +277,53 @@ class BacktestEngine:
             print(f"  [ERROR] Insufficient indicators for {country_code}")
             return None
 
-        df_m = (
-            pd.concat(m_data.values(), axis=1, keys=m_data.keys()).resample("MS").last()
+        df_m = self._monthly_panel(m_data)
+        df_aux = self._monthly_panel(aux_data) if aux_data else pd.DataFrame()
+
+        bundle = {"gdp": gdp_growth, "indicators": df_m, "aux_indicators": df_aux}
+        if real_time:
+            bundle["vintages"] = self.load_vintages(country_code)
+        return bundle
+
+    @staticmethod
+    def _gdp_growth(gdp_series):
+        """Quarterly GDP growth (log-difference, percent) from GDP levels."""
+        return (
+            (np.log(gdp_series.resample("QS").mean()).diff() * 100)
+            .dropna()
+            .rename("GDP")
         )
-        df_m = df_m.dropna(how="all").iloc[1:]
-
-        df_aux = pd.DataFrame()
-        if aux_data:
-            df_aux = (
-                pd.concat(aux_data.values(), axis=1, keys=aux_data.keys())
-                .resample("MS")
-                .last()
-            )
-            df_aux = df_aux.dropna(how="all").iloc[1:]
 
-        return {"gdp": gdp_growth, "indicators": df_m, "aux_indicators": df_aux}
+    @staticmethod
+    def _indicator_growth(sid, series):
+        if sid in DIFFERENCED:
+            return series.diff()
+        return np.log(series).diff() * 100
+
+    @staticmethod
+    def _monthly_panel(data):
+        """Month-start panel of transformed indicators, first month dropped."""
+        df = pd.concat(data.values(), axis=1, keys=data.keys()).resample("MS").last()
+        return df.dropna(how="all").iloc[1:]
+
+    def _real_time_panel(self, country_code, vintages, as_of):
+        """(indicator panel, GDP growth) as published on ``as_of``, or None.
+
+        Returns None unless GDP and at least two indicators have vintages.
+        """
+        config = self.countries[country_code]
+        published = vintages.as_of(as_of, [config["gdp_id"], *config["indicators"]])
+        gdp = published.get(config["gdp_id"])
+        m_data = {
+            name: self._indicator_growth(sid, published[sid].to_pandas())
+            for sid, name in config["indicators"].items()
+            if len(published.get(sid, ())) > 1
+        }
+        if gdp is None or len(gdp) < 2 or len(m_data) < 2:
+            return None
+        return self._monthly_panel(m_data), self._gdp_growth(gdp.to_pandas())
 
+    @traced("factor", "principal component")
     def _extract_factor(self, df_m):
         """SVD factor extraction."""
         df_std = (df_m - df_m.mean()) / df_m.std()
@@ -195,6 +332,171 @@ class BacktestEngine:
         factor = U[:, 0] * S[0]
         return pd.Series(factor, index=df_m.index)
 
+    @traced("regression", "bridge OLS")
+    def _bridge_nowcast(self, country_code, factor_m, gdp_growth, date):
+        """OLS bridge fitted on quarters before ``date``, evaluated at ``date``."""
+        factor_q = factor_m.resample("QS").mean()
+        combined = pd.concat([gdp_growth, factor_q], axis=1).dropna()
+        combined.columns = ["GDP", "Factor"]
+
+        train = combined.loc[combined.index < date]
+        if len(train) < 20:
+            return None
+        if date not in factor_q.index or pd.isna(factor_q.loc[date]):
+            return None
+
+        current = float(factor_q.loc[date])
+        beta = ols(
+            add_intercept(train["Factor"].to_numpy(dtype=float)),
+            train["GDP"].to_numpy(dtype=float),
+        )
+        pred = beta[0] + beta[1] * current
+
+        pred = canada_guardrail(country_code, pred)
+
+        return {"pred": float(pred), "train": train, "factor": current}
+
+    @staticmethod
+    def _release_calendar(df_m, release_lags, start, end):
+        """Release events (date, indicator, reference month) in (start, end]."""
+        events = []
+        for col in df_m.columns:
+            observed = df_m[col].dropna().index
+            released = observed + pd.offsets.MonthEnd(0) + pd.to_timedelta(
+                release_lags.get(col, 30), unit="D"
+            )
+            for ref_month, release_date in zip(observed, released):
+                if start < release_date <= end:
+                    events.append((release_date, col, ref_month))
+        events.sort()
+        return events
+
+    def run_release_timeline(self, country_code, quarter=None, data_bundle=None):
+        """Replay every indicator release inside a quarter and track the nowcast.
+
+        The as-of panel, its ragged-edge fill and the standardisation moments
+        are carried from one release to the next; only the columns touched by
+        a release are recomputed before the factor and bridge are refitted.
+        """
+        if data_bundle is None:
+            data_bundle = self.prepare_data(country_code)
+        if data_bundle is None:
+            return None
+
+        gdp_growth = data_bundle["gdp"]
+        df_m_all = data_bundle["indicators"]
+        release_lags = self.countries[country_code].get("release_lags", {})
+
+        if quarter is None:
+            quarter = df_m_all.index[-1]
+        target = pd.Timestamp(quarter).to_period("Q").start_time
+        window_end = target + pd.Timedelta(days=self.backtest_as_of_day)
+
+        panel = self._filter_by_release_lag(df_m_all, target, release_lags)
+        panel = panel.reindex(df_m_all.index)
+        filled = {}
+        moments = {}
+        state = {"end": panel.dropna(how="all").index.max()}
+
+        def refresh(col):
+            column = panel[col].loc[: state["end"]].copy()
+            if column.notna().sum() < 12:
+                filled.pop(col, None)
+                moments.pop(col, None)
+                return
+            filled[col] = self.nowcast_missing(column)
+            moments[col] = (filled[col].mean(), filled[col].std())
+
+        def nowcast():
+            cols = [col for col in df_m_all.columns if col in filled]
+            if len(cols) < 2:
+                return None
+            df_m = pd.concat([filled[col] for col in cols], axis=1, keys=cols)
+            df_m = df_m.dropna(how="all")
+            mu = pd.Series({col: moments[col][0] for col in cols})
+            sd = pd.Series({col: moments[col][1] for col in cols})
+            X = ((df_m - mu) / sd).ffill().bfill().values
+            U, S, Vt = np.linalg.svd(X, full_matrices=False)
+            factor_m = pd.Series(U[:, 0] * S[0], index=df_m.index)
+            return self._bridge_nowcast(country_code, factor_m, gdp_growth, target)
+
+        for col in df_m_all.columns:
+            refresh(col)
+
+        rows = []
+        initial = nowcast()
+        previous = initial["pred"] if initial else np.nan
+        rows.append(
+            {
+                "Release_Date": target,
+                "Indicators": "Quarter start",
+                "Reference_Months": "",
+                "Nowcast": previous,
+                "Revision": np.nan,
+            }
+        )
+
+        events = self._release_calendar(df_m_all, release_lags, target, window_end)
+        by_date = {}
+        for release_date, col, ref_month in events:
+            by_date.setdefault(release_date, []).append((col, ref_month))
+
+        for release_date, released in by_date.items():
+            touched = set()
+            for col, ref_month in released:
+                panel.loc[ref_month, col] = df_m_all.loc[ref_month, col]
+                touched.add(col)
+            newest = max(ref for _, ref in released)
+            if pd.isna(state["end"]) or newest > state["end"]:
+                # A new month extends the ragged edge for every column.
+                state["end"] = newest
+                stale = df_m_all.columns
+            else:
+                stale = touched
+            for col in stale:
+                refresh(col)
+
+            bridge = nowcast()
+            value = bridge["pred"] if bridge else np.nan
+            rows.append(
+                {
+                    "Release_Date": release_date,
+                    "Indicators": ", ".join(sorted(touched)),
+                    "Reference_Months": ", ".join(
+                        sorted({ref.strftime("%Y-%m") for _, ref in released})
+                    ),
+                    "Nowcast": value,
+                    "Revision": value - previous,
+                }
+            )
+            previous = value
+
+        timeline = pd.DataFrame(rows)
+        timeline.attrs["target_quarter"] = self._format_quarter(target)
+        timeline.attrs["actual"] = (
+            float(gdp_growth.loc[target]) if target in gdp_growth.index else None
+        )
+        return timeline
+
+    def format_timeline_report(self, country, timeline):
+        if timeline is None or timeline.empty:
+            return f"  [ERROR] Insufficient data for {country} release timeline."
+
+        lines = [
+            f"  Nowcast Release Timeline: {country} {timeline.attrs.get('target_quarter', '')}",
+            f"    {'Release':<12}{'Nowcast':>9}{'Revision':>10}  Indicators",
+        ]
+        for row in timeline.itertuples(index=False):
+            revision = "" if pd.isna(row.Revision) else f"{row.Revision:+.2f}"
+            nowcast = "n/a" if pd.isna(row.Nowcast) else f"{row.Nowcast:.2f}%"
+            lines.append(
+                f"    {row.Release_Date:%Y-%m-%d}  {nowcast:>9}{revision:>10}  {row.Indicators}"
+            )
+        actual = timeline.attrs.get("actual")
+        if actual is not None:
+            lines.append(f"    Actual (latest vintage): {actual:.2f}%")
+        return "\n".join(lines)
+
     @staticmethod
     def _quarterly_feature_frame(df_m):
         """Monthly indicator features aligned to quarterly GDP dates."""
@@ -236,17 +538,14 @@ class BacktestEngine:
 
         x_std = (x_hist - mu) / sd
         x_std = np.nan_to_num(x_std, nan=0.0)
-        x = np.column_stack([np.ones(len(x_std)), x_std])
-
-        penalty = np.eye(x.shape[1]) * alpha
-        penalty[0, 0] = 0.0
-        beta = np.linalg.solve(x.T @ x + penalty, x.T @ y_hist)
+        beta = ridge(add_intercept(x_std), y_hist, alpha)
 
         x_current = current[usable_cols].to_numpy(dtype=float)
         x_current = np.nan_to_num((x_current - mu) / sd, nan=0.0)
         return float(np.r_[1.0, x_current] @ beta)
 
     @staticmethod
+    @traced("calibration", "mixed-frequency calibration")
     def _apply_mixed_frequency_calibration(
         df_res,
         min_history=8,
@@ -269,6 +568,8 @@ class BacktestEngine:
                 "Predicted",
                 "Residual",
                 "Train_Mean",
+                "PI_Lower",
+                "PI_Upper",
                 "ML_Adjustment",
                 "ML_Calibrated",
             }
@@ -345,88 +646,190 @@ class BacktestEngine:
     def _rmse(actual, predicted):
         return float(np.sqrt(((actual - predicted) ** 2).mean()))
 
-    def run_expanding_window(self, country_code, skip_covid=False):
-        """Runs the expanding window backtest from 2016-Q1 onwards."""
-        data_bundle = self.prepare_data(country_code)
-        if data_bundle is None:
+    @staticmethod
+    def _interval_coverage(df_res, nominal):
+        """Empirical hit rate and width of the bootstrap prediction intervals."""
+        sample = df_res.dropna(subset=["PI_Lower", "PI_Upper"])
+        if sample.empty:
             return None
+        inside = (sample["Actual"] >= sample["PI_Lower"]) & (
+            sample["Actual"] <= sample["PI_Upper"]
+        )
+        return {
+            "n": int(len(sample)),
+            "nominal": round(float(nominal), 6),
+            "empirical": float(inside.mean()),
+            "mean_width": float((sample["PI_Upper"] - sample["PI_Lower"]).mean()),
+            "below": float((sample["Actual"] < sample["PI_Lower"]).mean()),
+            "above": float((sample["Actual"] > sample["PI_Upper"]).mean()),
+        }
 
-        gdp_growth = data_bundle["gdp"]
-        df_m_all = data_bundle["indicators"]
-        df_aux_all = data_bundle.get("aux_indicators", pd.DataFrame())
+    def _as_of_inputs(
+        self, country_code, date, gdp_growth, df_m_all, df_aux_all, vintages
+    ):
+        """Indicator and feature panels as released by the as-of date of ``date``.
+
+        With vintages, the indicators and the GDP training history are the
+        values actually published on the as-of date. Otherwise today's
+        revised data are masked by the configured release lags. ``actual`` is
+        always the latest estimate of the quarter, which scores the nowcast.
+        """
         release_lags = self.countries[country_code].get("release_lags", {})
+        as_of = date + pd.Timedelta(days=self.backtest_as_of_day)
+        real_time = None
+        if vintages:
+            real_time = self._real_time_panel(country_code, vintages, as_of)
+        if real_time is None:
+            df_m = self._filter_by_release_lag(df_m_all, as_of, release_lags)
+            gdp_train = gdp_growth.loc[:date]
+        else:
+            df_m, gdp_train = real_time
+        df_m = df_m.dropna(axis=1, thresh=12)
+        if len(df_m.columns) < 2:
+            return None
+        df_feature_m = df_m.copy()
+        if not df_aux_all.empty:
+            df_aux = self._filter_by_release_lag(df_aux_all, as_of, release_lags).copy()
+            df_aux = df_aux.dropna(axis=1, thresh=12)
+            if not df_aux.empty:
+                df_feature_m = pd.concat([df_feature_m, df_aux], axis=1)
+        return {
+            "indicators": df_m,
+            "features": df_feature_m,
+            "gdp": gdp_train,
+            "actual": float(gdp_growth.loc[date]),
+            "real_time": real_time is not None,
+        }
 
-        start_date = pd.Timestamp("2016-01-01")
-        test_indices = gdp_growth.index[gdp_growth.index >= start_date]
-        results = []
+    def _backtest_quarter(self, country_code, date, inputs):
+        """Out-of-sample bridge nowcast and interval for one quarter, or None."""
+        if inputs is None:
+            return None
+        gdp_growth = inputs["gdp"]
+        df_m = inputs["indicators"].copy()
+        df_feature_m = inputs["features"].copy()
+        for col in df_m.columns:
+            df_m[col] = self.nowcast_missing(df_m[col])
+        for col in df_feature_m.columns:
+            df_feature_m[col] = self.nowcast_missing(df_feature_m[col])
+
+        factor_m = self._extract_factor(df_m)
+        feature_q = self._quarterly_feature_frame(df_feature_m)
+
+        bridge = self._bridge_nowcast(country_code, factor_m, gdp_growth, date)
+        if bridge is None:
+            return None
 
-        for date in test_indices:
-            if skip_covid and pd.Timestamp("2020-01-01") <= date <= pd.Timestamp(
-                "2021-12-31"
-            ):
-                continue
+        train = bridge["train"]
+        y_train = train["GDP"]
+        pred = bridge["pred"]
+
+        train_factor = train["Factor"].to_numpy(dtype=float)
+        train_gdp = y_train.to_numpy(dtype=float)
+        test_factor = bridge["factor"]
+        with span("simulation", "bootstrap interval"):
+            interval = self.interval_engine.intervals(
+                lambda n, rng: residual_bootstrap_draws(
+                    train_factor, train_gdp, test_factor, n, rng
+                ),
+                transform=partial(canada_guardrail, country_code),
+                method="residual",
+            )
 
-            as_of = date + pd.Timedelta(days=self.backtest_as_of_day)
-            df_m = self._filter_by_release_lag(df_m_all, as_of, release_lags)
-            df_m = df_m.dropna(axis=1, thresh=12)
-            if len(df_m.columns) < 2:
-                continue
-            df_feature_m = df_m.copy()
-            if not df_aux_all.empty:
-                df_aux = self._filter_by_release_lag(
-                    df_aux_all, as_of, release_lags
-                ).copy()
-                df_aux = df_aux.dropna(axis=1, thresh=12)
-                if not df_aux.empty:
-                    df_feature_m = pd.concat([df_feature_m, df_aux], axis=1)
-
-            for col in df_m.columns:
-                df_m[col] = self.nowcast_missing(df_m[col])
-            for col in df_feature_m.columns:
-                df_feature_m[col] = self.nowcast_missing(df_feature_m[col])
-
-            factor_m = self._extract_factor(df_m)
-
-            factor_q = factor_m.resample("QS").mean()
-            feature_q = self._quarterly_feature_frame(df_feature_m)
-
-            combined = pd.concat([gdp_growth, factor_q], axis=1).dropna()
-            combined.columns = ["GDP", "Factor"]
-
-            train = combined.loc[combined.index < date]
-            if len(train) < 20:
-                continue
+        return {
+            "Date": date,
+            "Actual": inputs["actual"],
+            "Predicted": pred,
+            "Train_Mean": y_train.mean(),
+            "PI_Lower": interval["lower"] if interval else np.nan,
+            "PI_Upper": interval["upper"] if interval else np.nan,
+            "Real_Time": inputs["real_time"],
+            **{
+                col: feature_q.loc[date, col]
+                for col in feature_q.columns
+                if date in feature_q.index
+            },
+        }
 
-            test = combined.loc[[date]]
-            if test.empty:
-                continue
+    def _backtest_pipeline(self, country_code, dates):
+        """Per-quarter graph for a country; new quarters are added as they arrive.
 
-            y_train = train["GDP"]
-            X_train = sm.add_constant(train["Factor"])
+        Each quarter depends on its as-of data slice, which is fingerprinted by
+        content. A new release or revision therefore only refits the quarters
+        whose as-of data it changes.
+        """
+        with self._pipelines_lock:
+            graph = self._pipelines.get(country_code)
+            if graph is None:
+                graph = self._pipelines[country_code] = PipelineGraph()
+                for name in ("gdp", "indicators", "aux_indicators", "vintages"):
+                    graph.input(name)
+            for date in dates:
+                key = date.strftime("%Y-%m-%d")
+                if f"quarter:{key}" in graph.nodes:
+                    continue
+                graph.node(
+                    f"as_of:{key}",
+                    partial(self._as_of_inputs, country_code, date),
+                    ["gdp", "indicators", "aux_indicators", "vintages"],
+                    cutoff=True,
+                )
+                graph.node(
+                    f"quarter:{key}",
+                    partial(self._backtest_quarter, country_code, date),
+                    [f"as_of:{key}"],
+                )
+            return graph
 
-            model = sm.OLS(y_train, X_train).fit()
-            pred = model.predict([1, test["Factor"].iloc[0]])[0]
+    def run_expanding_window(
+        self, country_code, skip_covid=False, data_bundle=None, real_time=False
+    ):
+        """Runs the expanding window backtest from 2016-Q1 onwards.
 
-            if country_code == "Canada" and abs(pred) > 0.74:
-                pred = pred * 0.6 + 0.4 * 0.4
+        Quarters run concurrently and are memoised per as-of data slice, so a
+        repeated run refits only the quarters touched by new data.
 
-            results.append(
-                {
-                    "Date": date,
-                    "Actual": test["GDP"].iloc[0],
-                    "Predicted": pred,
-                    "Train_Mean": y_train.mean(),
-                    **{
-                        col: feature_q.loc[date, col]
-                        for col in feature_q.columns
-                        if date in feature_q.index
-                    },
-                }
+        With ``real_time``, the as-of inputs come from ALFRED vintages. A
+        ``data_bundle`` that has a "vintages" entry (even an empty
+        ``VintageStore()``) supplies them; otherwise they are loaded here.
+        Without it, every quarter uses release-lag filtered revised data.
+        """
+        if data_bundle is None:
+            data_bundle = self.prepare_data(country_code, real_time=real_time)
+        if data_bundle is None:
+            return None
+        vintages = VintageStore()
+        if real_time:
+            vintages = data_bundle.get("vintages")
+            if vintages is None:
+                vintages = self.load_vintages(country_code)
+
+        gdp_growth = data_bundle["gdp"]
+        start_date = pd.Timestamp("2016-01-01")
+        dates = [
+            date
+            for date in gdp_growth.index[gdp_growth.index >= start_date]
+            if not (
+                skip_covid
+                and pd.Timestamp("2020-01-01") <= date <= pd.Timestamp("2021-12-31")
             )
+        ]
+        targets = [f"quarter:{date.strftime('%Y-%m-%d')}" for date in dates]
+        values = self._backtest_pipeline(country_code, dates).run(
+            {
+                "gdp": gdp_growth,
+                "indicators": data_bundle["indicators"],
+                "aux_indicators": data_bundle.get("aux_indicators", pd.DataFrame()),
+                "vintages": vintages,
+            },
+            targets=targets,
+        )
+        results = [values[name] for name in targets if values[name] is not None]
 
         if not results:
             return None
         df_res = pd.DataFrame(results).set_index("Date")
+        real_time_quarters = int(df_res.pop("Real_Time").sum())
         df_res["Residual"] = df_res["Actual"] - df_res["Predicted"]
         df_res = self._apply_mixed_frequency_calibration(
             df_res,
@@ -471,13 +874,18 @@ class BacktestEngine:
                 "rmse_gain": (baseline_rmse - calibrated_rmse) / baseline_rmse * 100,
             }
 
+        levels = self.interval_engine.levels
         return {
             "df": df_res.reset_index(),
             "rmse": rmse,
             "mae": mae,
             "oos_r2": oos_r2,
             "calibration": calibration,
+            "interval_coverage": self._interval_coverage(
+                df_res, levels[-1] - levels[0]
+            ),
             "training_mean": results[-1]["Train_Mean"] if results else 0,
+            "real_time_quarters": real_time_quarters,
         }
 
     def run_bayesian_shrinkage_test(self, results):
@@ -502,6 +910,7 @@ class BacktestEngine:
     - Improvement:         {improvement:+.2f}%
         """
 
+    @traced("report")
     def format_calibration_report(self, results):
         calibration = results.get("calibration")
         if not calibration:
@@ -519,69 +928,110 @@ class BacktestEngine:
     - RMSE Gain:            {calibration['rmse_gain']:+.2f}%
         """
 
+    @traced("report")
+    def format_interval_report(self, results):
+        coverage = results.get("interval_coverage")
+        if not coverage:
+            return "  Insufficient data for bootstrap interval coverage."
+
+        return f"""
+  Bootstrap Prediction Intervals (Residual, Rolling OOS):
+    - Nominal Coverage:     {coverage['nominal']:.0%}
+    - Empirical Coverage:   {coverage['empirical']:.0%} (n={coverage['n']})
+    - Misses Below / Above: {coverage['below']:.0%} / {coverage['above']:.0%}
+    - Mean Width:           {coverage['mean_width']:.2f} pp
+        """
+
     @staticmethod
     def _format_quarter(timestamp):
         ts = pd.Timestamp(timestamp)
         return f"{ts.year} Q{ts.quarter}"
 
-    def plot_dashboard(self, country, results):
-        """Backtest dashboard chart."""
+    @staticmethod
+    def _dashboard_payload(country, results):
         df = results["df"]
-        plt.style.use("bmh")
-        fig, (ax1, ax2, ax3) = plt.subplots(
-            3, 1, figsize=(10, 14), gridspec_kw={"height_ratios": [1.5, 1, 1.2]}
-        )
+        payload = {
+            "country": country,
+            "oos_r2": float(results["oos_r2"]),
+            "date": df["Date"].to_numpy(dtype="datetime64[ns]"),
+            "actual": df["Actual"].to_numpy(dtype=float),
+            "predicted": df["Predicted"].to_numpy(dtype=float),
+            "residual": df["Residual"].to_numpy(dtype=float),
+        }
+        if "ML_Calibrated" in df.columns:
+            calibrated = df.dropna(subset=["ML_Calibrated"])
+            payload["calibrated_date"] = calibrated["Date"].to_numpy(dtype="datetime64[ns]")
+            payload["calibrated"] = calibrated["ML_Calibrated"].to_numpy(dtype=float)
+        return payload
+
+    @staticmethod
+    def _draw_dashboard(fig, payload):
+        ax1, ax2, ax3 = fig.subplots(3, 1, gridspec_kw={"height_ratios": [1.5, 1, 1.2]})
+        dates = payload["date"]
 
         ax1.plot(
-            df["Date"],
-            df["Actual"],
+            dates,
+            payload["actual"],
             label="Actual GDP",
             color="#1f77b4",
             linewidth=2,
             marker="o",
         )
         ax1.plot(
-            df["Date"],
-            df["Predicted"],
+            dates,
+            payload["predicted"],
             label="Quant Model",
             color="#aec7e8",
             linestyle="--",
             linewidth=1.5,
         )
-        if "ML_Calibrated" in df.columns:
-            calibrated = df.dropna(subset=["ML_Calibrated"])
+        if "calibrated" in payload:
             ax1.plot(
-                calibrated["Date"],
-                calibrated["ML_Calibrated"],
+                payload["calibrated_date"],
+                payload["calibrated"],
                 label="ML-Calibrated",
                 color="#00c853",
                 linestyle="-.",
                 linewidth=1.5,
             )
         ax1.set_title(
-            f"{country}: GDP Forecast vs Actual (OOS)", loc="left", fontweight="bold"
+            f"{payload['country']}: GDP Forecast vs Actual (OOS)",
+            loc="left",
+            fontweight="bold",
         )
         ax1.legend()
 
-        colors = ["#2ca02c" if x >= 0 else "#d62728" for x in df["Residual"]]
-        ax2.bar(df["Date"], df["Residual"], color=colors, alpha=0.7)
+        colors = ["#2ca02c" if x >= 0 else "#d62728" for x in payload["residual"]]
+        ax2.bar(dates, payload["residual"], color=colors, alpha=0.7)
         ax2.axhline(0, color="black", linewidth=1)
         ax2.set_title("Forecast Residuals", loc="left", fontweight="bold")
 
-        ax3.scatter(df["Actual"], df["Predicted"], alpha=0.6, color="#1f77b4")
-        lims = [df["Actual"].min(), df["Actual"].max()]
+        ax3.scatter(payload["actual"], payload["predicted"], alpha=0.6, color="#1f77b4")
+        lims = [payload["actual"].min(), payload["actual"].max()]
         ax3.plot(lims, lims, "r--", alpha=0.5, label="Perfect Fit")
         ax3.set_title(
-            f"Accuracy Scatter (Overall Backtest R2: {results['oos_r2']:.3f})",
+            f"Accuracy Scatter (Overall Backtest R2: {payload['oos_r2']:.3f})",
             loc="left",
             fontweight="bold",
         )
         ax3.set_xlabel("Actual")
         ax3.set_ylabel("Predicted")
+        fig.tight_layout()
 
-        plt.tight_layout()
-        plt.savefig(f"backtest_dashboard_{country.lower()}.png", dpi=120)
-        plt.close()
+    def plot_dashboard(self, country, results, renderer=None):
+        """Backtest dashboard chart, rendered in the background.
+
+        Returns a future that resolves to the PNG path.
+        """
+        from src.core.chart_renderer import default_renderer
+
+        renderer = renderer or default_renderer()
+        return renderer.submit(
+            self._draw_dashboard,
+            self._dashboard_payload(country, results),
+            f"backtest_dashboard_{country.lower()}.png",
+            figsize=(10, 14),
+        )
 
     def print_report(self):
         print("\n" + "=" * 60)
@@ -591,24 +1041,33 @@ class BacktestEngine:
         print(f"As-of Rule: Quarter start + {self.backtest_as_of_day} days")
         print("=" * 60)
 
+        charts = []
         for country in ["US", "Canada"]:
             print(f"\n>>> Analyzing {country}...")
-            res = self.run_expanding_window(country, skip_covid=False)
+            res = self.run_expanding_window(country, skip_covid=False, real_time=True)
             if res:
                 print(f"  Long-Term Statistics (2016-Present):")
                 print(f"    - Overall Backtest R2:      {res['oos_r2']:.4f}")
                 print(f"    - RMSE:                {res['rmse']:.4f}%")
                 print(f"    - MAE:                 {res['mae']:.4f}%")
+                print(
+                    f"    - Real-Time Quarters:  {res['real_time_quarters']}/{len(res['df'])}"
+                    " (ALFRED vintages; others release-lag filtered)"
+                )
                 print(self.format_calibration_report(res))
-                self.plot_dashboard(country, res)
+                print(self.format_interval_report(res))
+                charts.append(self.plot_dashboard(country, res))
             else:
                 print(f"  [ERROR] Insufficient data for {country} backtest.")
 
+        for chart in charts:
+            chart.result()
         print("\n" + "=" * 60)
         print("Charts saved: backtest_dashboard_us/canada.png")
         print("=" * 60)
 
 
 if __name__ == "__main__":
+    ensure_utf8_stdout()
     engine = BacktestEngine()
     engine.print_report()
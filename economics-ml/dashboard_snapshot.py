@@ -0,0 +1,257 @@
+"""Regenerates ``dashboard/public/snapshot.json`` from the live and backtest engines.
+
+Every section first collects its inputs through one shared fetch cache, so a
+series needed by several sections is downloaded once. A section whose input
+fingerprint matches the one stored in the current file is kept as it is. The
+other sections are rebuilt concurrently and the file is replaced atomically.
+"""
+
+import copy
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+
+from backtest_engine import BacktestEngine
+from src.core.pipeline_graph import value_fingerprint
+from src.core.runtime import atomic_write_text, ensure_utf8_stdout
+from src.core.tracing import propagate
+from src.engine.gdp_nowcast_engine import GDPCastNowEngine
+from src.engine.policy_rate_engine import PolicyRateEngine
+
+
+DEFAULT_OUTPUT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "dashboard", "public", "snapshot.json")
+)
+
+# Bump when a section's layout changes so stored fingerprints are not reused.
+SNAPSHOT_FORMAT = 1
+
+
+def input_fingerprint(value):
+    """Content hash of a section's inputs; frames are hashed by index and values."""
+    return value_fingerprint([SNAPSHOT_FORMAT, value])
+
+
+class DashboardSnapshotBuilder:
+    """Builds the dashboard snapshot in one process with shared data."""
+
+    def __init__(self, output_path=None, max_workers=4, force=False):
+        self.output_path = output_path or DEFAULT_OUTPUT
+        self.max_workers = max_workers
+        self.force = force
+        self.policy = PolicyRateEngine()
+        # The policy engine's single-flight cache also memoises the frame fetches.
+        self.cache = self.policy.fetcher
+        self.nowcasts = {
+            country: self._share(GDPCastNowEngine(country), "nowcast")
+            for country in ("US", "Canada")
+        }
+        self.backtest = self._share(BacktestEngine(), "backtest")
+
+    def _share(self, engine, kind):
+        fetch = engine.fetch_fred
+
+        def shared_fetch(sid, *args, **kwargs):
+            key = (kind, sid, args, tuple(sorted(kwargs.items())))
+            return self.cache.shared(key, lambda: fetch(sid, *args, **kwargs)).copy()
+
+        engine.fetch_fred = shared_fetch
+        return engine
+
+    def sections(self):
+        """Dotted section path -> (collect inputs, build section from inputs)."""
+        return {
+            "liveSnapshot.usGrowth": (
+                self.nowcasts["US"]._live_inputs,
+                partial(self._growth_section, "US"),
+            ),
+            "liveSnapshot.canadaGrowth": (
+                self.nowcasts["Canada"]._live_inputs,
+                partial(self._growth_section, "Canada"),
+            ),
+            "liveSnapshot.policyStance": (self._policy_inputs, self._policy_section),
+            "backtest.us": (
+                partial(self.backtest.prepare_data, "US", real_time=True),
+                partial(self._backtest_section, "US"),
+            ),
+            "backtest.canada": (
+                partial(self.backtest.prepare_data, "Canada", real_time=True),
+                partial(self._backtest_section, "Canada"),
+            ),
+        }
+
+    @staticmethod
+    def _confidence(r2):
+        if r2 >= 0.5:
+            return "High"
+        if r2 >= 0.25:
+            return "Medium"
+        return "Low"
+
+    def _growth_section(self, country, live):
+        res = self.nowcasts[country]._nowcast(live)
+        return {
+            "nowcast": round(res["final_val"], 2),
+            "calibratedNowcast": round(res["calibrated_val"], 2),
+            "confidence": self._confidence(res["r2"]),
+            "measurementAdj": round(res["measurement_adjustment"], 2),
+            "mlCalibrationAdj": round(res["ml_calibration_adjustment"], 2),
+            "targetQuarter": res["target_q"],
+            "dataThrough": res["data_thru"],
+        }
+
+    def _policy_inputs(self):
+        plan = self.policy._fetch_plan(("US", "Canada"))
+        self.cache.prefetch(plan)
+        return {
+            "fred": {
+                sid: self.cache.fetch_fred_series(sid, limit=limit)
+                for sid, limit in sorted(plan.items())
+            },
+            "bls": self.cache.fetch_bls_unemployment(),
+            "boc": self.cache.fetch_boc_data(),
+        }
+
+    def _policy_section(self, _inputs):
+        analyses = self.policy.analyze_many(("US", "Canada"))
+        section = {}
+        for key, country in (("fed", "US"), ("boc", "Canada")):
+            analysis = analyses[country]
+            analysis.chart.result()
+            section[key] = {
+                "label": analysis.stance,
+                "bps": int(round(analysis.gap_bps)),
+                "actualRate": round(analysis.inputs.actual_rate, 2),
+                "baseTaylorRate": round(analysis.base_rate, 2),
+                "dataEnhancedTaylorRate": round(analysis.enhanced_rate, 2),
+                "enhancedBps": int(round(analysis.enhanced_gap_bps)),
+            }
+        return section
+
+    def _backtest_section(self, country, data_bundle):
+        results = self.backtest.run_expanding_window(
+            country, data_bundle=data_bundle, real_time=True
+        )
+        calibration = results.get("calibration") if results else None
+        if not calibration:
+            return None
+        return {
+            "windowStart": BacktestEngine._format_quarter(calibration["window_start"]),
+            "windowEnd": BacktestEngine._format_quarter(calibration["window_end"]),
+            "observations": int(calibration["n"]),
+            "baselineR2": round(calibration["baseline_r2"], 4),
+            "calibratedR2": round(calibration["calibrated_r2"], 4),
+            "baselineRmse": round(calibration["baseline_rmse"], 4),
+            "calibratedRmse": round(calibration["calibrated_rmse"], 4),
+            "rmseGain": round(calibration["rmse_gain"], 2),
+        }
+
+    @staticmethod
+    def _run(name, step, *args):
+        """Run one section step; a failure leaves the section as it was."""
+        try:
+            return step(*args)
+        except Exception as exc:
+            print(f"  [WARN] {name}: {exc}")
+            return None
+
+    def _load(self):
+        try:
+            with open(self.output_path, encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _get(snapshot, name):
+        node = snapshot
+        for part in name.split("."):
+            if not isinstance(node, dict) or part not in node:
+                return None
+            node = node[part]
+        return node
+
+    @staticmethod
+    def _set(snapshot, name, value):
+        *parents, leaf = name.split(".")
+        node = snapshot
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = value
+
+    def build(self):
+        """Refresh stale sections and rewrite the file; returns the status per section."""
+        previous = self._load()
+        stored = previous.get("meta", {}).get("fingerprints", {})
+        sections = self.sections()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            inputs = dict(
+                zip(
+                    sections,
+                    pool.map(
+                        propagate(lambda name: self._run(name, sections[name][0])),
+                        sections,
+                    ),
+                )
+            )
+            fingerprints = {
+                name: input_fingerprint(value)
+                for name, value in inputs.items()
+                if value is not None
+            }
+            stale = [
+                name
+                for name in fingerprints
+                if self.force
+                or fingerprints[name] != stored.get(name)
+                or self._get(previous, name) is None
+            ]
+            built = dict(
+                zip(
+                    stale,
+                    pool.map(
+                        propagate(
+                            lambda name: self._run(name, sections[name][1], inputs[name])
+                        ),
+                        stale,
+                    ),
+                )
+            )
+
+        snapshot = copy.deepcopy(previous)
+        kept = {}
+        status = {}
+        for name in sections:
+            if name not in fingerprints or (name in built and built[name] is None):
+                status[name] = "failed"
+                if name in stored:
+                    kept[name] = stored[name]
+            elif name in built:
+                self._set(snapshot, name, built[name])
+                kept[name] = fingerprints[name]
+                status[name] = "rebuilt"
+            else:
+                kept[name] = fingerprints[name]
+                status[name] = "unchanged"
+
+        if "rebuilt" in status.values():
+            snapshot["meta"] = {
+                "generatedAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "fingerprints": kept,
+            }
+            atomic_write_text(self.output_path, json.dumps(snapshot, indent=2) + "\n")
+        return status
+
+    def format_status(self, status):
+        lines = [f"Snapshot: {self.output_path}"]
+        lines += [f"  {name:<28}{state}" for name, state in status.items()]
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    ensure_utf8_stdout()
+    builder = DashboardSnapshotBuilder()
+    print(builder.format_status(builder.build()))
@@ -0,0 +1,152 @@
+"""Load test of the fetch and modelling pipeline against a local FRED stand-in.
+
+A ``SyntheticUniverse`` (the catalogued FRED series plus ``--indicators``
+synthetic monthly indicators over ``--years`` of history) is served by a
+``FredStubServer`` on localhost. ``FRED_BASE_URL`` points the engines at it,
+and the page and snapshot caches go to a throwaway directory. ``--clients``
+threads then send ``--requests`` units of work between them, and the script
+reports throughput, latency percentiles and the HTTP metrics registry.
+
+Tasks:
+    fetch    one ``MacroDataFetcher.fetch_series`` call for a random series
+    gdp      a US nowcast whose panel also holds ``--panel`` synthetic indicators
+    policy   a US policy analysis, with the BLS and BoC scrapes left offline
+
+Usage:
+    python load_test.py --indicators 500 --years 70 --clients 50 --requests 2000
+    python load_test.py --task gdp --panel 100 --clients 8 --requests 32
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.core.runtime import ensure_utf8_stdout
+from src.data_utils.synthetic_fred import FredStubServer, SyntheticUniverse
+
+
+def fetch_task(universe, args):
+    from src.data_utils.macro_data_fetcher import MacroDataFetcher
+
+    fetcher = MacroDataFetcher()
+    series_ids = list(universe.catalog)
+
+    def run(i):
+        sid = random.Random(i).choice(series_ids)
+        if not len(fetcher.fetch_series(sid, limit=args.limit)):
+            raise RuntimeError(f"{sid}: no observations")
+
+    return run
+
+
+def gdp_task(universe, args):
+    from src.engine.gdp_nowcast_engine import GDPCastNowEngine
+
+    panel = {sid: sid for sid in universe.indicators[: args.panel]}
+
+    def run(i):
+        engine = GDPCastNowEngine("US")
+        engine.indicators.update(panel)
+        engine.pipeline = engine._build_pipeline()
+        engine.fetch_measurement_adjustment = lambda: 0.0
+        engine.run_nowcast()
+
+    return run
+
+
+def policy_task(universe, args):
+    from src.engine.policy_rate_engine import PolicyRateEngine
+
+    def run(i):
+        engine = PolicyRateEngine()
+        engine.fetcher.fetch_bls_unemployment = lambda: "Error: offline load test."
+        engine.fetcher.fetch_boc_data = lambda: {"error": "offline load test"}
+        engine.analyze("US")
+
+    return run
+
+
+TASKS = {"fetch": fetch_task, "gdp": gdp_task, "policy": policy_task}
+
+
+def drive(run, clients, requests):
+    """Run ``run(i)`` for i < requests on ``clients`` threads; (latencies, errors)."""
+    latencies = np.zeros(requests)
+    errors = []
+    lock = threading.Lock()
+
+    def timed(i):
+        start = time.perf_counter()
+        try:
+            run(i)
+        except Exception as exc:
+            with lock:
+                errors.append(f"{type(exc).__name__}: {exc}")
+        latencies[i] = time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(timed, range(requests)))
+    return latencies, errors
+
+
+def format_summary(task, latencies, errors, elapsed, server_requests):
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+    lines = [
+        f"### Load test: {task}",
+        f"- **Units of work**: {len(latencies)} ({len(errors)} failed)",
+        f"- **Wall time**: {elapsed:.2f}s ({len(latencies) / elapsed:.1f}/s)",
+        f"- **Latency (ms)**: p50 {p50:.1f}, p95 {p95:.1f}, p99 {p99:.1f}, "
+        f"max {latencies.max() * 1000:.1f}",
+        f"- **Stub server requests**: {server_requests}",
+    ]
+    for error in sorted(set(errors))[:5]:
+        lines.append(f"- **Error**: {error}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test against a synthetic FRED server")
+    parser.add_argument("--task", default="fetch", choices=sorted(TASKS))
+    parser.add_argument("--indicators", type=int, default=500, help="Synthetic indicators")
+    parser.add_argument("--years", type=float, default=70, help="Years of history")
+    parser.add_argument("--clients", type=int, default=50, help="Concurrent client threads")
+    parser.add_argument("--requests", type=int, default=500, help="Units of work in total")
+    parser.add_argument("--limit", type=int, default=1000, help="With 'fetch': observations per call")
+    parser.add_argument("--panel", type=int, default=50, help="With 'gdp': synthetic indicators in the panel")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    ensure_utf8_stdout()
+
+    workdir = tempfile.mkdtemp(prefix="economics_ml_load_")
+    universe = SyntheticUniverse(n_indicators=args.indicators, years=args.years, seed=args.seed)
+    with FredStubServer(universe) as server:
+        os.environ.update(
+            FRED_BASE_URL=server.base_url,
+            FRED_API_KEY="load-test",
+            ECONOMICS_ML_CACHE_DIR=os.path.join(workdir, "cache"),
+        )
+        # Charts and other relative-path outputs land in the scratch directory.
+        os.chdir(workdir)
+        run = TASKS[args.task](universe, args)
+
+        start = time.perf_counter()
+        latencies, errors = drive(run, args.clients, args.requests)
+        elapsed = time.perf_counter() - start
+
+    from src.data_utils.http_metrics import REGISTRY
+
+    print(format_summary(args.task, latencies, errors, elapsed, server.requests))
+    print(REGISTRY.format_summary(), file=sys.stderr)
+    print(f"[Load test] Scratch directory: {workdir}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
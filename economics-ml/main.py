@@ -1,12 +1,19 @@
 import argparse
 import sys
-import io
 
-if sys.stdout.encoding != "utf-8":
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+from src.core import deadline, tracing
+from src.core.runtime import ensure_utf8_stdout
 
-from src.engine.policy_rate_engine import PolicyRateEngine
-from src.engine.gdp_nowcast_engine import GDPCastNowEngine, format_report
+# Engines are imported inside the task branches: pandas, scipy, matplotlib
+# and requests only load once the selected task actually needs them, so --help
+# and argument errors return without paying the scientific-stack import cost.
+
+
+def _duration(text):
+    try:
+        return deadline.parse_duration(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc))
 
 
 def main():
@@ -15,29 +22,173 @@ def main():
     )
     parser.add_argument(
         "task",
-        choices=["policy", "gdp"],
-        help="Task to perform: 'policy' for rate analysis or 'gdp' for nowcasting",
+        choices=["policy", "gdp", "all", "snapshot"],
+        help="Task to perform: 'policy' for rate analysis, 'gdp' for nowcasting, "
+        "'all' for both in one process, or 'snapshot' to rebuild the dashboard snapshot",
     )
     parser.add_argument(
         "--country",
-        default="US",
+        nargs="+",
+        default=None,
         choices=["US", "Canada"],
-        help="Target country (default: US)",
+        help="Target countries (default: US; with 'all': US Canada)",
+    )
+    parser.add_argument(
+        "--timeline",
+        action="store_true",
+        help="With 'gdp': replay each indicator release in the current quarter",
+    )
+    parser.add_argument(
+        "--backtest",
+        action="store_true",
+        help="With 'policy': score the rule layers at past decision dates",
+    )
+
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=0,
+        help="With 'gdp': answer from a fitted-model snapshot younger than this many seconds",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="With 'snapshot': JSON path (default: dashboard/public/snapshot.json); "
+        "with 'all': directory that also receives each report as Markdown",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With 'snapshot': rebuild every section even if its inputs are unchanged",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="economics_ml_profile.json",
+        default=None,
+        metavar="PATH",
+        help="Time each pipeline stage and write the trace to PATH "
+        "(default: economics_ml_profile.json)",
+    )
+    parser.add_argument(
+        "--profile-format",
+        default="json",
+        choices=["json", "chrome"],
+        help="With --profile: span JSON, or Chrome trace events for chrome://tracing",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=_duration,
+        default=None,
+        metavar="DURATION",
+        help="Latency budget for the run, e.g. 5s or 800ms: optional sources "
+        "(RSS, StatCan, BLS, BoC) run concurrently and are skipped if not back in time",
+    )
+
+    parser.add_argument(
+        "--metrics",
+        nargs="?",
+        const="economics_ml_metrics.json",
+        default=None,
+        metavar="PATH",
+        help="Record latency, bytes and outcome of every HTTP call and the "
+        "fallback values used, and write them to PATH (default: economics_ml_metrics.json)",
+    )
+    parser.add_argument(
+        "--metrics-format",
+        default="json",
+        choices=["json", "prometheus"],
+        help="With --metrics: JSON, or Prometheus text exposition format",
     )
 
     args = parser.parse_args()
+    if args.country is None:
+        args.country = ["US", "Canada"] if args.task == "all" else ["US"]
+    ensure_utf8_stdout()
+    if args.deadline:
+        deadline.start(args.deadline)
+
+    try:
+        if not args.profile:
+            run_task(args)
+            return
+
+        tracer = tracing.enable()
+        try:
+            with tracing.span("task", args.task, country=",".join(args.country)):
+                run_task(args)
+        finally:
+            tracing.disable()
+            tracer.write(args.profile, fmt=args.profile_format)
+            print(tracer.format_summary(), file=sys.stderr)
+            print(f"[Profile] Trace written to: {args.profile}", file=sys.stderr)
+    finally:
+        if args.metrics:
+            from src.data_utils.http_metrics import REGISTRY
+
+            REGISTRY.write(args.metrics, fmt=args.metrics_format)
+            print(REGISTRY.format_summary(), file=sys.stderr)
+            print(f"[Metrics] Written to: {args.metrics}", file=sys.stderr)
+
+
+def run_task(args):
+    if args.task == "snapshot":
+        from dashboard_snapshot import DashboardSnapshotBuilder
+
+        builder = DashboardSnapshotBuilder(output_path=args.output, force=args.force)
+        print(builder.format_status(builder.build()))
+
+    elif args.task == "policy" and args.backtest:
+        from policy_backtest_engine import PolicyBacktestEngine
+
+        backtest = PolicyBacktestEngine()
+        for country in args.country:
+            print(backtest.format_report(backtest.run_backtest(country)))
+
+    elif args.task == "all" or (len(args.country) > 1 and not args.timeline):
+        from report_batch import ReportBatch
+
+        tasks = ("policy", "gdp") if args.task == "all" else (args.task,)
+        batch = ReportBatch(args.country, tasks, max_age=args.max_age)
+        reports = batch.run()
+        print(ReportBatch.format_reports(reports))
+        if args.output and args.task == "all":
+            for path in ReportBatch.write(reports, args.output):
+                print(f"[Saved] {path}")
+
+    elif args.task == "policy":
+        from src.engine.policy_rate_engine import PolicyRateEngine
 
-    if args.task == "policy":
         engine = PolicyRateEngine()
-        result = engine.generate_analysis(args.country)
+        result = engine.generate_analysis(args.country[0])
         print(result["report"])
         print(f"\n[Visual] Chart generated at: {result['image_path']}")
 
+    elif args.task == "gdp" and args.timeline:
+        from backtest_engine import BacktestEngine
+
+        backtest = BacktestEngine()
+        for country in args.country:
+            timeline = backtest.run_release_timeline(country)
+            print(backtest.format_timeline_report(country, timeline))
+
     elif args.task == "gdp":
-        engine = GDPCastNowEngine(args.country)
-        res = engine.run_nowcast()
-        report = format_report(args.country, res)
-        print(report)
+        from src.engine.gdp_nowcast_report import (
+            default_snapshot_path,
+            format_report,
+            fresh_result,
+            snapshot_kind,
+        )
+
+        country = args.country[0]
+        # A fresh snapshot is answered before the engine (pandas, requests) loads.
+        res = fresh_result(default_snapshot_path(country), snapshot_kind(country), args.max_age)
+        if res is None:
+            from src.engine.gdp_nowcast_engine import GDPCastNowEngine
+
+            engine = GDPCastNowEngine(country, snapshot_max_age=args.max_age)
+            res = engine.run_nowcast()
+        print(format_report(country, res))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,310 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.core.hp_filter import one_sided_hp_filter
+from src.core.runtime import ensure_utf8_stdout
+from src.engine.policy_rate_engine import PolicyRateEngine
+
+
+LAYERS = ("taylor_1993", "taylor_1999", "nonlinear", "post_08", "smoothed", "enhanced")
+
+# Per-process state for the worker pool: the shared raw histories and a policy
+# engine whose cached Taylor panels are extended date by date.
+_WORKER = {}
+
+
+def _init_worker(backtest, country, raw, hp_gap):
+    _WORKER.update(
+        backtest=backtest,
+        country=country,
+        raw=raw,
+        hp_gap=hp_gap,
+        realized=raw["actual"].resample("MS").mean(),
+        policy=PolicyRateEngine(),
+    )
+
+
+def _evaluate_block(dates):
+    rows = []
+    for date in dates:
+        row = _WORKER["backtest"].evaluate_decision(
+            _WORKER["country"],
+            date,
+            _WORKER["raw"],
+            _WORKER["hp_gap"],
+            _WORKER["policy"],
+            realized=_WORKER["realized"],
+        )
+        if row is not None:
+            rows.append(row)
+    return rows
+
+
+class PolicyBacktestEngine:
+    """Policy-rate backtest at historical central bank decision dates.
+
+    Each decision is replayed with only the data published by that date. The
+    rule layers of ``PolicyRateEngine.generate_analysis`` are then scored
+    against the policy rate that followed.
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.threshold = 2.5
+        self.stress_multiplier = 1.5
+        # Moves smaller than this count as a hold, for rules and actual rates.
+        self.move_band_bps = 25.0
+        self.realized_band_bps = 12.5
+        self.start = "2012-01-01"
+        self.countries = {
+            "US": {
+                "title": "FOMC",
+                "gdp_id": "GDPC1",
+                "r_star_real": 0.6,
+                # Eight scheduled meetings, approximated by the third Wednesday.
+                "decision_months": (1, 3, 5, 6, 7, 9, 11, 12),
+                "decision_week": 3,
+                "release_lags": {
+                    "actual": 1,
+                    "price": 30,
+                    "unrate": 7,
+                    "nrou": 0,
+                    "financial": 5,
+                    "labor": 5,
+                    "gdp": 30,
+                },
+            },
+            "Canada": {
+                "title": "Bank of Canada",
+                "gdp_id": "NGDPRSAXDCCAQ",
+                "r_star_real": 0.75,
+                # Eight fixed announcement dates, approximated by the second Wednesday.
+                "decision_months": (1, 3, 4, 6, 7, 9, 10, 12),
+                "decision_week": 2,
+                "release_lags": {
+                    "actual": 1,
+                    "price": 20,
+                    "unrate": 7,
+                    "cad": 1,
+                    "oil": 1,
+                    "gdp": 60,
+                },
+            },
+        }
+        # Observation period behind each series' dates; anything else is monthly.
+        self.periods = {
+            "nrou": "Q",
+            "gdp": "Q",
+            "financial": "D",
+            "labor": "D",
+            "cad": "D",
+            "oil": "D",
+        }
+
+    def decision_dates(self, country, start=None, end=None):
+        """Approximate decision calendar between ``start`` and ``end``."""
+        config = self.countries[country]
+        start = pd.Timestamp(start or self.start)
+        end = pd.Timestamp(end or datetime.now())
+        dates = pd.date_range(start, end, freq=f"WOM-{config['decision_week']}WED")
+        return dates[dates.month.isin(config["decision_months"])]
+
+    def release_dates(self, name, index, lag_days):
+        period = self.periods.get(name, "M")
+        if period == "M":
+            index = index + pd.offsets.MonthEnd(0)
+        elif period == "Q":
+            index = index + pd.offsets.QuarterEnd(0)
+        return index + pd.to_timedelta(lag_days, unit="D")
+
+    def _as_of(self, country, name, series, as_of):
+        """Observations published on or before ``as_of``."""
+        lag = self.countries[country]["release_lags"].get(name, 30)
+        return series[self.release_dates(name, series.index, lag) <= as_of]
+
+    def _fetch_raw(self, country, policy):
+        raw = policy._fetch_history_series(country)
+        raw["gdp"] = policy._fetch_series(self.countries[country]["gdp_id"], 100).to_pandas()
+        return raw
+
+    def _real_time_hp_gap(self, country, gdp):
+        """One-sided HP gap (pct) indexed by publication date of each quarter."""
+        gdp = gdp[gdp > 0]
+        if len(gdp) < 20:
+            return pd.Series(dtype=float, index=pd.DatetimeIndex([]))
+        cycle, _ = one_sided_hp_filter(np.log(gdp), lamb=1600)
+        lag = self.countries[country]["release_lags"]["gdp"]
+        published = self.release_dates("gdp", cycle.index, lag)
+        return pd.Series(cycle.to_numpy() * 100, index=published)
+
+    def _classify(self, change_bps, band):
+        if change_bps > band:
+            return "hike"
+        if change_bps < -band:
+            return "cut"
+        return "hold"
+
+    def evaluate_decision(self, country, date, raw, hp_gap, policy, realized=None):
+        """Replay the rule layers at one decision date; None if data is missing."""
+        config = self.countries[country]
+        date = pd.Timestamp(date)
+        if realized is None:
+            realized = raw["actual"].resample("MS").mean()
+        next_month = date.to_period("M").to_timestamp() + pd.offsets.MonthBegin(1)
+        if next_month not in realized.index or pd.isna(realized.loc[next_month]):
+            return None
+
+        filtered = {
+            name: self._as_of(country, name, series, date) for name, series in raw.items()
+        }
+        r_star = config["r_star_real"]
+        inputs = policy._policy_history_inputs(country, r_star, raw=filtered)
+        if inputs.empty:
+            return None
+        calibration_frame = policy._build_policy_calibration_frame(
+            country, r_star, inputs=inputs
+        )
+        latest = inputs.dropna(subset=["inflation", "output_gap", "actual_rate"])
+        if latest.empty:
+            return None
+        row = latest.iloc[-1].fillna(0.0)
+
+        known_gap = hp_gap[hp_gap.index <= date]
+        gap = float(known_gap.iloc[-1]) if len(known_gap) else float(row["output_gap"])
+        pi = float(row["inflation"])
+        prior = float(row["actual_rate"])
+        models = policy.engine.models
+
+        nonlinear = models.taylor_nonlinear(
+            r_star,
+            pi,
+            gap,
+            threshold=self.threshold,
+            stress_multiplier=self.stress_multiplier,
+        )
+        enhanced, _ = policy._data_enhanced_taylor_rate(
+            base_rate=nonlinear,
+            current_features={
+                "activity_gap": float(np.median([row["output_gap"], gap])),
+                "inflation_pressure": pi - 2.0,
+                "financial_conditions": float(row["financial_stress"]),
+                "external_pressure": float(row["external_pressure"]),
+                "labor_cooling": float(row["labor_cooling"]),
+            },
+            calibration_frame=calibration_frame,
+        )
+        rates = {
+            "taylor_1993": models.taylor_1993(r_star, pi, gap),
+            "taylor_1999": models.taylor_1999(r_star, pi, gap),
+            "nonlinear": nonlinear,
+            "post_08": models.post_08_adjusted(r_star, pi, gap, row["financial_stress"]),
+            "smoothed": models.apply_smoothing(nonlinear, prior),
+            "enhanced": enhanced,
+        }
+
+        post = float(realized.loc[next_month])
+        result = {
+            "Date": date,
+            "Data_Through": latest.index[-1],
+            "Prior_Rate": prior,
+            "Realized_Rate": post,
+            "Move": self._classify((post - prior) * 100, self.realized_band_bps),
+            "Output_Gap": gap,
+            "Inflation": pi,
+        }
+        for layer, rate in rates.items():
+            result[layer] = float(rate)
+            result[f"{layer}_signal"] = self._classify(
+                (rate - prior) * 100, self.move_band_bps
+            )
+        return result
+
+    def run_backtest(self, country, start=None, end=None, raw=None):
+        """Evaluate every decision date, in contiguous blocks across processes."""
+        policy = PolicyRateEngine()
+        if raw is None:
+            raw = self._fetch_raw(country, policy)
+        if raw["actual"].empty:
+            return None
+        hp_gap = self._real_time_hp_gap(country, raw.get("gdp", pd.Series(dtype=float)))
+        dates = list(self.decision_dates(country, start, end))
+        if not dates:
+            return None
+
+        # Contiguous blocks let each worker extend its cached panels date by date.
+        n_blocks = max(1, min(self.max_workers, len(dates)))
+        blocks = [list(block) for block in np.array_split(np.array(dates), n_blocks)]
+        if n_blocks == 1:
+            _init_worker(self, country, raw, hp_gap)
+            rows = _evaluate_block(blocks[0])
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_blocks,
+                initializer=_init_worker,
+                initargs=(self, country, raw, hp_gap),
+            ) as pool:
+                rows = [row for block in pool.map(_evaluate_block, blocks) for row in block]
+
+        if not rows:
+            return None
+        df = pd.DataFrame(rows).set_index("Date").sort_index()
+        return {"country": country, "df": df, "stats": self.layer_statistics(df)}
+
+    @staticmethod
+    def layer_statistics(df):
+        """Direction hit rate and level error (bps) of each layer against outcomes."""
+        moves = df["Move"] != "hold"
+        stats = {}
+        for layer in LAYERS:
+            error = (df[layer] - df["Realized_Rate"]) * 100
+            hits = df[f"{layer}_signal"] == df["Move"]
+            stats[layer] = {
+                "n": int(len(df)),
+                "hit_rate": float(hits.mean()),
+                "move_hit_rate": float(hits[moves].mean()) if moves.any() else np.nan,
+                "bias_bps": float(error.mean()),
+                "mae_bps": float(error.abs().mean()),
+                "rmse_bps": float(np.sqrt((error**2).mean())),
+            }
+        return stats
+
+    def format_report(self, results):
+        if not results:
+            return "  Insufficient data for the policy backtest."
+        df = results["df"]
+        config = self.countries[results["country"]]
+        lines = [
+            f"  {config['title']} decisions {df.index[0]:%Y-%m} to {df.index[-1]:%Y-%m} "
+            f"(n={len(df)}, moves={int((df['Move'] != 'hold').sum())}):",
+            f"    {'Layer':<13}{'Hit':>7}{'Move Hit':>10}{'Bias':>9}{'MAE':>8}{'RMSE':>8}",
+        ]
+        for layer, s in results["stats"].items():
+            move_hit = "n/a" if np.isnan(s["move_hit_rate"]) else f"{s['move_hit_rate']:.0%}"
+            lines.append(
+                f"    {layer:<13}{s['hit_rate']:>7.0%}{move_hit:>10}"
+                f"{s['bias_bps']:>+9.0f}{s['mae_bps']:>8.0f}{s['rmse_bps']:>8.0f}"
+            )
+        lines.append("    (Bias/MAE/RMSE in bps versus the following month's policy rate.)")
+        return "\n".join(lines)
+
+    def print_report(self):
+        print("\n" + "=" * 60)
+        print("ECONOMICS ML SKILL: POLICY-RATE BACKTEST")
+        print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+        print("As-of Rule: inputs filtered by publication lag at each decision date")
+        print("=" * 60)
+
+        for country in ["US", "Canada"]:
+            print(f"\n>>> Analyzing {country}...")
+            print(self.format_report(self.run_backtest(country)))
+
+        print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    ensure_utf8_stdout()
+    PolicyBacktestEngine().print_report()
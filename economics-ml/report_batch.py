@@ -0,0 +1,116 @@
+"""Runs the policy and GDP reports for several countries in one process.
+
+Every job reads FRED through the policy engine's single-flight cache. A
+series used by more than one report (``UNRATE``, ``GDPC1`` or
+``LRHUTTTTCAM156S``, for example) is therefore downloaded once, at the
+largest limit any job needs. The union of all series is prefetched
+concurrently, then the reports are built in parallel. They are printed in
+(task, country) order.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from src.core.runtime import atomic_write_text, ensure_utf8_stdout
+from src.core.tracing import propagate
+from src.engine.gdp_nowcast_engine import GDPCastNowEngine, format_report
+from src.engine.policy_rate_engine import PolicyRateEngine
+
+
+TASKS = ("policy", "gdp")
+COUNTRIES = ("US", "Canada")
+
+# Observations requested by GDPCastNowEngine.fetch_fred.
+NOWCAST_LIMIT = 160
+
+
+def records_to_frame(records):
+    """FRED records (newest first) as the dated ``value`` frame the nowcast expects."""
+    if not records:
+        return pd.DataFrame()
+    df = pd.DataFrame(records)
+    df["date"] = pd.to_datetime(df["date"])
+    df["value"] = pd.to_numeric(df["value"], errors="coerce")
+    return df[["date", "value"]].sort_values("date").set_index("date")
+
+
+class ReportBatch:
+    """The (task x country) report matrix over one shared fetch layer."""
+
+    def __init__(self, countries=COUNTRIES, tasks=TASKS, max_age=0, max_workers=None):
+        self.countries = list(countries)
+        self.tasks = [task for task in TASKS if task in tasks]
+        self.max_workers = max_workers
+        self.policy = PolicyRateEngine()
+        self.cache = self.policy.fetcher
+        self.nowcasts = {
+            country: self._share(GDPCastNowEngine(country, snapshot_max_age=max_age))
+            for country in self.countries
+        }
+
+    def _share(self, engine):
+        def shared_fetch(sid, limit=NOWCAST_LIMIT):
+            return records_to_frame(self.cache.fetch_fred_series(sid, limit=limit))
+
+        engine.fetch_fred = shared_fetch
+        return engine
+
+    def jobs(self):
+        return [(task, country) for task in self.tasks for country in self.countries]
+
+    def fetch_plan(self):
+        """Largest limit per FRED series over every job in the batch."""
+        plan = self.policy._fetch_plan(self.countries) if "policy" in self.tasks else {}
+        if "gdp" in self.tasks:
+            for engine in self.nowcasts.values():
+                for sid in [*engine.indicators, engine.gdp_id]:
+                    plan[sid] = max(NOWCAST_LIMIT, plan.get(sid, 0))
+        return plan
+
+    def _policy_report(self, country):
+        analysis = self.policy.analyze(country)
+        analysis.chart.result()
+        return f"{analysis.report}\n\n[Visual] Chart generated at: {analysis.image_path}"
+
+    def _gdp_report(self, country):
+        return format_report(country, self.nowcasts[country].run_nowcast())
+
+    def _run(self, job):
+        task, country = job
+        build = self._policy_report if task == "policy" else self._gdp_report
+        try:
+            return build(country)
+        except Exception as exc:
+            return f"[ERROR] {task} {country}: {exc}"
+
+    def run(self):
+        """Returns ``{(task, country): report text}`` in job order."""
+        jobs = self.jobs()
+        self.cache.prefetch(self.fetch_plan())
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(jobs) or 1) as pool:
+            reports = list(pool.map(propagate(self._run), jobs))
+        return dict(zip(jobs, reports))
+
+    @staticmethod
+    def write(reports, directory):
+        """Save each report as ``<task>_<country>.md``; returns the paths."""
+        paths = []
+        for (task, country), report in reports.items():
+            path = os.path.join(directory, f"{task}_{country.lower()}.md")
+            atomic_write_text(path, report + "\n")
+            paths.append(path)
+        return paths
+
+    @staticmethod
+    def format_reports(reports):
+        sections = []
+        for (task, country), report in reports.items():
+            sections.append(f"{'=' * 60}\n{task.upper()} | {country}\n{'=' * 60}\n{report}")
+        return "\n\n".join(sections)
+
+
+if __name__ == "__main__":
+    ensure_utf8_stdout()
+    print(ReportBatch.format_reports(ReportBatch().run()))
@@ -0,0 +1,153 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+
+from src.core.linalg_kernels import add_intercept, ols, ols_batched
+
+
+DEFAULT_LEVELS = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def moving_block_indices(n_obs, block_length, n_boot, rng):
+    """Moving-block resample of row positions, shape (n_boot, n_obs)."""
+    block_length = int(max(1, min(block_length, n_obs)))
+    n_blocks = int(np.ceil(n_obs / block_length))
+    starts = rng.integers(0, n_obs - block_length + 1, size=(n_boot, n_blocks))
+    idx = starts[:, :, None] + np.arange(block_length)[None, None, :]
+    return idx.reshape(n_boot, -1)[:, :n_obs]
+
+
+def residual_bootstrap_draws(factor, gdp, current_factor, n_boot, rng):
+    """Bridge-regression residual bootstrap with the factor held fixed."""
+    factor = np.asarray(factor, dtype=float)
+    gdp = np.asarray(gdp, dtype=float)
+    x = add_intercept(factor)
+    beta = ols(x, gdp)
+    fitted = x @ beta
+    resid = gdp - fitted
+    resid = resid - resid.mean()
+
+    shocks = resid[rng.integers(0, len(resid), size=(n_boot, len(resid)))]
+    y_star = fitted[None, :] + shocks
+    # One factorisation, n_boot right-hand sides.
+    beta_star = ols(x, y_star.T)
+    point = beta_star[0] + beta_star[1] * current_factor
+    return point + resid[rng.integers(0, len(resid), size=n_boot)]
+
+
+def block_bootstrap_draws(
+    panel, quarter_weights, gdp, current_weights, n_boot, rng, block_length=4
+):
+    """Joint block bootstrap over factor extraction and the bridge regression.
+
+    ``panel`` is the standardised, gap-filled monthly indicator matrix (T, k);
+    ``quarter_weights`` (n, T) averages monthly factor values into the quarters
+    aligned with ``gdp``; ``current_weights`` (T,) builds the current-quarter
+    factor reading.
+    """
+    panel = np.asarray(panel, dtype=float)
+    quarter_weights = np.asarray(quarter_weights, dtype=float)
+    gdp = np.asarray(gdp, dtype=float)
+    current_weights = np.asarray(current_weights, dtype=float)
+
+    _, _, vt = np.linalg.svd(panel, full_matrices=False)
+    reference = vt[0]
+
+    month_idx = moving_block_indices(panel.shape[0], 3 * block_length, n_boot, rng)
+    resampled = panel[month_idx]
+    cov = np.einsum("bti,btj->bij", resampled, resampled)
+    _, vecs = np.linalg.eigh(cov)
+    loadings = vecs[:, :, -1]
+    loadings *= np.sign(loadings @ reference)[:, None]
+
+    factor = loadings @ panel.T
+    factor_q = factor @ quarter_weights.T
+    current = factor @ current_weights
+
+    row_idx = moving_block_indices(len(gdp), block_length, n_boot, rng)
+    fq_star = np.take_along_axis(factor_q, row_idx, axis=1)
+    y_star = gdp[row_idx]
+    beta = ols_batched(add_intercept(fq_star[..., None]), y_star)
+
+    fitted = beta[:, :1] + beta[:, 1:] * fq_star
+    resid = y_star - fitted
+    noise = resid[np.arange(n_boot), rng.integers(0, len(gdp), size=n_boot)]
+    return beta[:, 0] + beta[:, 1] * current + noise
+
+
+class BootstrapIntervalEngine:
+    """Runs bootstrap draws in fixed-size chunks across a thread pool.
+
+    Chunks that have not finished when the time budget runs out are dropped, so
+    the returned quantiles always arrive within ``budget_seconds`` plus one
+    chunk.
+    """
+
+    def __init__(
+        self,
+        n_boot=4000,
+        chunk_size=500,
+        budget_seconds=1.0,
+        levels=DEFAULT_LEVELS,
+        max_workers=None,
+        seed=None,
+    ):
+        self.n_boot = n_boot
+        self.chunk_size = chunk_size
+        self.budget_seconds = budget_seconds
+        self.levels = tuple(levels)
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.seed = seed
+
+    def draw(self, draw_fn, transform=None):
+        """Collect draws from ``draw_fn(n, rng)`` within the time budget."""
+        n_chunks = max(1, int(np.ceil(self.n_boot / self.chunk_size)))
+        seeds = np.random.SeedSequence(self.seed).spawn(n_chunks)
+        deadline = time.perf_counter() + self.budget_seconds
+
+        def run_chunk(seed_seq):
+            if time.perf_counter() > deadline:
+                return None
+            return draw_fn(self.chunk_size, np.random.default_rng(seed_seq))
+
+        draws = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = {pool.submit(run_chunk, s) for s in seeds}
+            while pending:
+                timeout = max(0.0, deadline - time.perf_counter())
+                done, pending = wait(
+                    pending, timeout=timeout if draws else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    chunk = future.result()
+                    if chunk is not None:
+                        draws.append(np.asarray(chunk, dtype=float))
+                if draws and time.perf_counter() >= deadline:
+                    for future in pending:
+                        future.cancel()
+                    break
+
+        values = np.concatenate(draws) if draws else np.array([], dtype=float)
+        values = values[np.isfinite(values)]
+        if transform is not None:
+            values = transform(values)
+        return values
+
+    def intervals(self, draw_fn, transform=None, method="bootstrap"):
+        values = self.draw(draw_fn, transform=transform)
+        if values.size == 0:
+            return None
+        quantiles = np.quantile(values, self.levels)
+        return {
+            "method": method,
+            "n_draws": int(values.size),
+            "quantiles": {
+                float(level): float(q) for level, q in zip(self.levels, quantiles)
+            },
+            "lower": float(quantiles[0]),
+            "upper": float(quantiles[-1]),
+            "coverage": round(float(self.levels[-1] - self.levels[0]), 6),
+        }
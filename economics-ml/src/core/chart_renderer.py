@@ -0,0 +1,177 @@
+"""Background PNG rendering with a content-keyed image cache.
+
+Callers build a payload of plain values and arrays on their own thread and
+hand it to a draw function. The draw function gets an explicit Agg-backed
+``Figure``, so pyplot's global state is never touched. Figures are rendered
+by a single worker thread because matplotlib does not support concurrent
+drawing. The caller gets a future back immediately. A PNG is stored under
+a hash of the payload, so an unchanged chart is copied from the cache
+instead of redrawn. The cache keeps the ``max_cached`` most recently used
+images.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+from src.core.runtime import cache_dir, prune_cache, touch_cached
+from src.core.tracing import propagate, span
+
+
+# Bump when a draw function changes so cached images are not reused.
+RENDER_VERSION = 1
+
+
+def payload_fingerprint(payload):
+    """Stable hash of nested dicts/lists of scalars, strings and arrays."""
+    digest = hashlib.sha256()
+
+    def feed(value):
+        if isinstance(value, dict):
+            digest.update(b"{")
+            for key in sorted(value, key=str):
+                feed(str(key))
+                feed(value[key])
+            digest.update(b"}")
+        elif isinstance(value, (list, tuple)):
+            digest.update(b"[")
+            for item in value:
+                feed(item)
+            digest.update(b"]")
+        elif isinstance(value, np.ndarray):
+            digest.update(str((value.dtype.str, value.shape)).encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        else:
+            digest.update(repr(value).encode())
+            digest.update(b";")
+
+    feed(payload)
+    return digest.hexdigest()[:24]
+
+
+_STYLES = {}
+
+
+def style_rc(name):
+    """rcParams of a matplotlib style sheet, read once per process."""
+    if name not in _STYLES:
+        import matplotlib.style
+
+        _STYLES[name] = dict(matplotlib.style.library[name])
+    return _STYLES[name]
+
+
+class ChartRenderer:
+    """Renders charts off the calling thread and caches PNGs by content."""
+
+    def __init__(self, cache_directory=None, dpi=120, max_cached=64):
+        self.cache_directory = cache_directory
+        self.dpi = dpi
+        self.max_cached = max_cached
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chart")
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def _cache_path(self, key):
+        directory = self.cache_directory or cache_dir("charts")
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"{key}.png")
+
+    def submit(self, draw, payload, output_filename, style="bmh", figsize=(10, 6)):
+        """Queue ``draw(fig, payload)``; returns a future resolving to the path.
+
+        When the cache already holds this payload the image is copied right
+        away and the returned future is already done.
+        """
+        key = payload_fingerprint(
+            [RENDER_VERSION, draw.__module__, draw.__qualname__, style, figsize, self.dpi, payload]
+        )
+        cached = self._cache_path(key)
+        if os.path.exists(cached):
+            touch_cached(cached)
+            _copy(cached, output_filename)
+            done = Future()
+            done.set_result(output_filename)
+            return done
+
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pool.submit(
+                    propagate(self._render), draw, payload, cached, style, figsize
+                )
+                self._pending[key] = future
+                future.add_done_callback(lambda _f, k=key: self._forget(k))
+
+        result = Future()
+
+        def deliver(rendered):
+            try:
+                _copy(rendered.result(), output_filename)
+                result.set_result(output_filename)
+            except Exception as exc:
+                result.set_exception(exc)
+
+        future.add_done_callback(deliver)
+        return result
+
+    def _forget(self, key):
+        with self._lock:
+            self._pending.pop(key, None)
+
+    def _render(self, draw, payload, cached, style, figsize):
+        import matplotlib
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        with span("plot", getattr(draw, "__qualname__", "chart")), matplotlib.rc_context(
+            style_rc(style) if style else None
+        ):
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+            draw(fig, payload)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(cached), prefix=".tmp-", suffix=".png"
+            )
+            os.close(fd)
+            try:
+                fig.savefig(tmp_path, dpi=self.dpi, bbox_inches="tight")
+                os.replace(tmp_path, cached)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        prune_cache(os.path.dirname(cached), self.max_cached, ".png")
+        return cached
+
+    def wait(self):
+        """Block until every queued chart has been written."""
+        self._pool.submit(lambda: None).result()
+
+
+def _copy(source, target):
+    if os.path.abspath(source) == os.path.abspath(target):
+        return
+    directory = os.path.dirname(os.path.abspath(target))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".png")
+    os.close(fd)
+    shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, target)
+
+
+_DEFAULT = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_renderer():
+    """Process-wide renderer shared by the engines."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = ChartRenderer()
+        return _DEFAULT
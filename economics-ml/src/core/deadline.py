@@ -0,0 +1,137 @@
+"""Per-run latency budget for the optional measurement sources.
+
+The core model inputs (FRED) are always awaited. Optional sources are the
+RSS newsflow, the StatCan outlook, the BLS release and the Bank of Canada
+page. They are started together with ``schedule`` and then collected against
+the run deadline set by ``start``. A source still running when the budget is
+spent is skipped: its default value is used and its name is returned, so the
+report can say which adjustment was left out.
+
+While an optional source runs under a deadline, ``metered_get`` caps each
+request timeout at the remaining budget. A skipped source therefore stops
+soon after the cut-off instead of holding its thread for a full 10-15 second
+timeout. Such a request is flagged on its thread (``take_exceeded``), so a
+circuit breaker does not count a cut-short call against a healthy endpoint.
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from src.core import tracing
+
+
+_DURATION = re.compile(r"^\s*(\d+(?:\.\d*)?|\.\d+)\s*(ms|s|m)?\s*$")
+_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0}
+
+_run = None
+_local = threading.local()
+
+
+def parse_duration(text):
+    """``"5s"``, ``"500ms"``, ``"1.5"`` (seconds) or ``"2m"`` as seconds."""
+    match = _DURATION.match(str(text))
+    if not match:
+        raise ValueError(f"invalid duration: {text!r} (use e.g. 5s, 500ms, 2m)")
+    seconds = float(match.group(1)) * _UNITS[match.group(2) or "s"]
+    if seconds <= 0:
+        raise ValueError(f"duration must be positive: {text!r}")
+    return seconds
+
+
+class Deadline:
+    """Wall-clock budget; ``reserve`` seconds are kept back for the model and report."""
+
+    def __init__(self, seconds, reserve=None):
+        self.seconds = float(seconds)
+        if reserve is None:
+            reserve = min(1.0, 0.2 * self.seconds)
+        self.reserve = reserve
+        self.cutoff = time.monotonic() + self.seconds - reserve
+
+    def remaining(self):
+        """Seconds left for optional work, never negative."""
+        return max(0.0, self.cutoff - time.monotonic())
+
+    @property
+    def expired(self):
+        return self.remaining() <= 0.0
+
+
+def start(seconds, reserve=None):
+    """Set the process-wide deadline of the current run."""
+    global _run
+    _run = Deadline(seconds, reserve)
+    return _run
+
+
+def clear():
+    global _run
+    _run = None
+
+
+def current():
+    return _run
+
+
+def budget():
+    """The deadline bounding the optional source running on this thread, if any."""
+    return getattr(_local, "deadline", None)
+
+
+def note_exceeded():
+    """Flag that a request on this thread was cut short by the run deadline."""
+    _local.exceeded = True
+
+
+def take_exceeded():
+    """True if a request on this thread hit the deadline since the last call."""
+    hit = getattr(_local, "exceeded", False)
+    _local.exceeded = False
+    return hit
+
+
+class OptionalSources:
+    """Optional fetches started together and collected against a deadline."""
+
+    def __init__(self, tasks, deadline=None):
+        self.deadline = deadline
+        self._pool = ThreadPoolExecutor(
+            max_workers=len(tasks) or 1, thread_name_prefix="optional-source"
+        )
+        self._futures = {
+            name: self._pool.submit(tracing.propagate(self._call), fetch)
+            for name, fetch in tasks.items()
+        }
+
+    def _call(self, fetch):
+        _local.deadline = self.deadline
+        try:
+            return fetch()
+        finally:
+            _local.deadline = None
+
+    def collect(self, defaults=None):
+        """``(results, skipped)``; a skipped source's result is its default.
+
+        Without a deadline every source is awaited. Errors raised by a source
+        that finished are re-raised, as a direct call would.
+        """
+        defaults = defaults or {}
+        timeout = None if self.deadline is None else self.deadline.remaining()
+        done, _ = wait(self._futures.values(), timeout=timeout)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        results, skipped = {}, []
+        for name, future in self._futures.items():
+            if future in done:
+                results[name] = future.result()
+            else:
+                results[name] = defaults.get(name)
+                skipped.append(name)
+        return results, skipped
+
+
+def schedule(tasks):
+    """Start ``{name: fetch}`` concurrently under the current run deadline."""
+    return OptionalSources(tasks, current())
@@ -0,0 +1,120 @@
+"""Array-in/array-out least-squares kernels shared by the engines.
+
+Every solver takes plain ndarrays and returns coefficient arrays; the callers
+own design-matrix construction through ``add_intercept`` so that intercept
+handling is identical everywhere. Single problems are solved with QR or
+Cholesky factorisations, never explicit inverses. The batched variants
+solve many right-hand sides against one factorisation, or a stack of
+equally shaped problems in one call.
+"""
+
+import numpy as np
+from scipy.linalg import solve_triangular
+
+
+def add_intercept(x):
+    """Prepend a column of ones: (n,) or (n, k) -> (n, k + 1); stacks broadcast."""
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x[:, None]
+    ones = np.ones(x.shape[:-1] + (1,))
+    return np.concatenate([ones, x], axis=-1)
+
+
+def ols(x, y):
+    """Least squares via QR; ``y`` may be (n,) or (n, m) for m right-hand sides.
+
+    Rank-deficient designs fall back to the minimum-norm SVD solution, which
+    matches ``pinv(x) @ y``.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    q, r = np.linalg.qr(x)
+    diag = np.abs(np.diag(r))
+    if diag.size and diag.min() > diag.max() * x.shape[0] * np.finfo(float).eps:
+        return solve_triangular(r, q.T @ y)
+    return np.linalg.lstsq(x, y, rcond=None)[0]
+
+
+def wls(x, y, weights):
+    """Weighted least squares with non-negative observation weights."""
+    root = np.sqrt(np.asarray(weights, dtype=float))
+    x = np.asarray(x, dtype=float) * root[:, None]
+    y = np.asarray(y, dtype=float)
+    y = y * (root if y.ndim == 1 else root[:, None])
+    return ols(x, y)
+
+
+def ridge(x, y, alpha, penalize_intercept=False, weights=None):
+    """Ridge regression via Cholesky of the penalised normal equations.
+
+    ``alpha`` is a scalar or a per-coefficient vector. The first column is
+    treated as the intercept and left unpenalised unless asked otherwise.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if weights is not None:
+        root = np.sqrt(np.asarray(weights, dtype=float))
+        x = x * root[:, None]
+        y = y * (root if y.ndim == 1 else root[:, None])
+    penalty = np.broadcast_to(np.asarray(alpha, dtype=float), (x.shape[1],)).copy()
+    if not penalize_intercept:
+        penalty[0] = 0.0
+    return solve_normal_equations(x.T @ x + np.diag(penalty), x.T @ y)
+
+
+def solve_normal_equations(gram, rhs):
+    """Solve ``gram @ beta = rhs`` for a symmetric PSD ``gram``.
+
+    Uses Cholesky when the matrix is positive definite and the pseudo-inverse
+    otherwise, so singular systems still return the minimum-norm solution.
+    """
+    gram = np.asarray(gram, dtype=float)
+    rhs = np.asarray(rhs, dtype=float)
+    try:
+        chol = np.linalg.cholesky(gram)
+    except np.linalg.LinAlgError:
+        return np.linalg.pinv(gram, hermitian=True) @ rhs
+    z = solve_triangular(chol, rhs, lower=True)
+    return solve_triangular(chol, z, lower=True, trans="T")
+
+
+def ols_batched(x, y, ridge_eps=1e-10):
+    """Solve a stack of OLS problems: x (B, n, p), y (B, n) or (B, n, m).
+
+    Uses the batched normal equations with a tiny diagonal jitter; intended for
+    the small, well-conditioned bridge problems resampled in the bootstrap.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    vector = y.ndim == x.ndim - 1
+    if vector:
+        y = y[..., None]
+    gram = np.einsum("...ni,...nj->...ij", x, x)
+    gram = gram + ridge_eps * np.eye(x.shape[-1])
+    rhs = np.einsum("...ni,...nm->...im", x, y)
+    beta = np.linalg.solve(gram, rhs)
+    return beta[..., 0] if vector else beta
+
+
+def ridge_batched(x, y, alpha, penalize_intercept=False):
+    """Stacked ridge problems: x (B, n, p), y (B, n); returns (B, p)."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    penalty = np.broadcast_to(np.asarray(alpha, dtype=float), (x.shape[-1],)).copy()
+    if not penalize_intercept:
+        penalty[0] = 0.0
+    gram = np.einsum("...ni,...nj->...ij", x, x) + np.diag(penalty)
+    rhs = np.einsum("...ni,...n->...i", x, y)
+    return np.linalg.solve(gram, rhs[..., None])[..., 0]
+
+
+def r_squared(y, fitted):
+    """Coefficient of determination; NaN when ``y`` has no variance."""
+    y = np.asarray(y, dtype=float)
+    resid = y - np.asarray(fitted, dtype=float)
+    ss_tot = np.sum((y - y.mean()) ** 2)
+    if ss_tot == 0:
+        return np.nan
+    return float(1.0 - np.sum(resid**2) / ss_tot)
+
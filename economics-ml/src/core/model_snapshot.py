@@ -0,0 +1,71 @@
+import hashlib
+import json
+import os
+import time
+
+from src.core.runtime import atomic_write_text
+
+# numpy and pandas are imported where they are used: reading a snapshot is
+# stdlib-only, so the CLI can answer from one without the scientific stack.
+
+
+SNAPSHOT_VERSION = 1
+
+
+def frame_fingerprint(frame):
+    """Short content hash of a date-indexed frame or series (index + values)."""
+    import numpy as np
+    import pandas as pd
+
+    if frame is None or len(frame) == 0:
+        return "empty"
+    values = np.ascontiguousarray(np.asarray(frame, dtype=float))
+    index = np.ascontiguousarray(pd.DatetimeIndex(frame.index).asi8)
+    digest = hashlib.sha256()
+    digest.update(index.tobytes())
+    digest.update(values.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def save_snapshot(path, kind, fingerprints, state):
+    """Persist fitted state with its input fingerprints as compact JSON."""
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "kind": kind,
+        "created_at": time.time(),
+        "fingerprints": dict(fingerprints),
+        "state": state,
+    }
+    atomic_write_text(path, json.dumps(payload, separators=(",", ":"), default=_jsonable))
+    return payload
+
+
+def load_snapshot(path, kind):
+    """Return the stored payload, or None if missing, unreadable or stale-format."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if payload.get("version") != SNAPSHOT_VERSION or payload.get("kind") != kind:
+        return None
+    return payload
+
+
+def snapshot_age(payload):
+    return time.time() - float(payload.get("created_at", 0.0))
+
+
+def _jsonable(value):
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (np.floating, np.integer)):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialise {type(value).__name__}")
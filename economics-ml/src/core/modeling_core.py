@@ -1,56 +1,130 @@
 import numpy as np
 
 
+def _as_rate(value):
+    """Plain float for scalar inputs, ndarray otherwise."""
+    value = np.asarray(value, dtype=float)
+    return float(value) if value.ndim == 0 else value
+
+
+def _broadcast_inputs(*values):
+    return tuple(np.asarray(v, dtype=float) for v in values)
+
+
 class TaylorRuleModels:
+    """Taylor rule variants; every argument accepts scalars or broadcastable arrays."""
+
     def __init__(self, pi_target=2.0):
         self.pi_target = pi_target
 
     def taylor_1993(self, r_star, pi, output_gap):
         """Taylor 1993: i = r* + pi + 0.5(pi - pi*) + 0.5(gap)"""
-        return r_star + pi + 0.5 * (pi - self.pi_target) + 0.5 * output_gap
+        r_star, pi, output_gap = _broadcast_inputs(r_star, pi, output_gap)
+        return _as_rate(r_star + pi + 0.5 * (pi - self.pi_target) + 0.5 * output_gap)
 
     def taylor_1999(self, r_star, pi, output_gap):
         """Taylor 1999: higher gap weight. i = r* + pi + 0.5(pi - pi*) + 1.0(gap)"""
-        return r_star + pi + 0.5 * (pi - self.pi_target) + 1.0 * output_gap
+        r_star, pi, output_gap = _broadcast_inputs(r_star, pi, output_gap)
+        return _as_rate(r_star + pi + 0.5 * (pi - self.pi_target) + 1.0 * output_gap)
 
     def taylor_nonlinear(
         self, r_star, pi, output_gap, threshold=2.5, stress_multiplier=1.5
     ):
         """Non-linear Taylor: steeper reaction above inflation threshold."""
+        r_star, pi, output_gap, threshold, stress_multiplier = _broadcast_inputs(
+            r_star, pi, output_gap, threshold, stress_multiplier
+        )
         base_pi_gap = pi - self.pi_target
+        adjusted_pi_gap = base_pi_gap * np.where(pi > threshold, stress_multiplier, 1.0)
 
-        if pi > threshold:
-            adjusted_pi_gap = base_pi_gap * stress_multiplier
-        else:
-            adjusted_pi_gap = base_pi_gap
-
-        return r_star + pi + 0.5 * adjusted_pi_gap + 1.0 * output_gap
+        return _as_rate(r_star + pi + 0.5 * adjusted_pi_gap + 1.0 * output_gap)
 
     def post_08_adjusted(self, r_star, pi, output_gap, financial_stress=0.0):
         """Post-2008: subtracts financial stress premium."""
         base_rate = self.taylor_1999(r_star, pi, output_gap)
-        return base_rate - 0.25 * financial_stress
+        return _as_rate(base_rate - 0.25 * np.asarray(financial_stress, dtype=float))
 
     def apply_smoothing(self, current_rule_rate, previous_actual_rate, rho=0.8):
         """Interest rate smoothing: i_t = rho * i_{t-1} + (1 - rho) * i_rule"""
-        return rho * previous_actual_rate + (1 - rho) * current_rule_rate
+        current_rule_rate, previous_actual_rate, rho = _broadcast_inputs(
+            current_rule_rate, previous_actual_rate, rho
+        )
+        return _as_rate(rho * previous_actual_rate + (1 - rho) * current_rule_rate)
+
+
+class RateSurface:
+    """Dense policy-rate grid with labelled axes.
+
+    ``values`` has one axis per entry in ``dims``; ``coords`` maps each dim to
+    its coordinate array. ``gap_labels`` keeps the scenario names when the gaps
+    came from a labelled mapping.
+    """
+
+    def __init__(self, values, dims, coords, gap_labels=None):
+        self.values = values
+        self.dims = tuple(dims)
+        self.coords = {dim: np.asarray(coords[dim], dtype=float) for dim in self.dims}
+        self.gap_labels = list(gap_labels) if gap_labels is not None else None
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.values, dtype=dtype)
+
+    def index(self, dim, value):
+        """Position of the coordinate nearest to ``value`` along ``dim``."""
+        return int(np.argmin(np.abs(self.coords[dim] - value)))
+
+    def sel(self, **selectors):
+        """Slice by nearest coordinate value, e.g. ``sel(r_star=0.6)``."""
+        key = []
+        dims = []
+        for dim in self.dims:
+            if dim in selectors:
+                key.append(self.index(dim, selectors[dim]))
+            else:
+                key.append(slice(None))
+                dims.append(dim)
+        values = self.values[tuple(key)]
+        if not dims:
+            return float(values)
+        labels = self.gap_labels if "gap" in dims else None
+        return RateSurface(values, dims, {d: self.coords[d] for d in dims}, labels)
 
 
 class PolicyOracle:
     def __init__(self):
         self.models = TaylorRuleModels()
 
-    def generate_matrix(self, r_star_range, pi_range, gap_scenarios):
-        """Generate 3D results matrix."""
-        results = {}
-        for r_star in r_star_range:
-            results[r_star] = {}
-            for gap in gap_scenarios:
-                results[r_star][gap] = []
-                for pi in pi_range:
-                    rate = self.models.taylor_1999(r_star, pi, gap)
-                    results[r_star][gap].append(rate)
-        return results
+    def generate_matrix(
+        self, r_star_range, pi_range, gap_scenarios, rule="taylor_1999", **rule_kwargs
+    ):
+        """Evaluate a rule on the full (r*, gap, pi) grid in one broadcast.
+
+        ``gap_scenarios`` may be a sequence of gaps or a ``{label: gap}`` mapping.
+        Extra keyword arguments (e.g. ``threshold``) are passed to the rule.
+        """
+        if isinstance(gap_scenarios, dict):
+            labels = list(gap_scenarios.keys())
+            gaps = np.fromiter(gap_scenarios.values(), dtype=float)
+        else:
+            labels = None
+            gaps = np.asarray(gap_scenarios, dtype=float)
+        r_star = np.asarray(r_star_range, dtype=float)
+        pi = np.asarray(pi_range, dtype=float)
+
+        values = getattr(self.models, rule)(
+            r_star[:, None, None], pi[None, None, :], gaps[None, :, None], **rule_kwargs
+        )
+        values = np.broadcast_to(values, (len(r_star), len(gaps), len(pi)))
+        return RateSurface(
+            np.ascontiguousarray(values),
+            ("r_star", "gap", "pi"),
+            {"r_star": r_star, "gap": gaps, "pi": pi},
+            gap_labels=labels,
+        )
 
 
 if __name__ == "__main__":
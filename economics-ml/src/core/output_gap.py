@@ -0,0 +1,340 @@
+"""Output-gap estimator ensemble over full histories.
+
+Every estimator maps dated input series to a dated gap series in percent:
+
+- ``okun``: -2 x (unemployment - natural rate), monthly.
+- ``hp``: two-sided Hodrick-Prescott cycle of log real GDP.
+- ``hamilton``: Hamilton (2018) regression filter, the error in predicting
+  log GDP eight quarters ahead from its four latest values.
+- ``baxter_king``: Baxter-King band-pass (6-32 quarters, K = 12). The series
+  is extended K quarters at both ends with AR(4) growth forecasts and
+  backcasts, so the latest quarter gets a value.
+- ``uc``: unobserved-components model, a smooth trend (random-walk slope)
+  plus an AR(2) cycle. It is fitted by maximum likelihood with the Kalman
+  filter, and the gap is the smoothed cycle.
+- ``caputil``: capacity utilisation minus its sample mean, monthly.
+
+``OutputGapEnsemble`` runs the estimators concurrently. It caches the result
+per data vintage (a fingerprint of the inputs), in memory and as a JSON
+snapshot, so an unchanged vintage is never re-estimated. Like the memory,
+the snapshot directory keeps only the ``memory_size`` most recently used
+vintages.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from src.core.chart_renderer import payload_fingerprint
+from src.core.hp_filter import hp_filter
+from src.core.linalg_kernels import add_intercept, ols
+from src.core.model_snapshot import frame_fingerprint, load_snapshot, save_snapshot
+from src.core.runtime import cache_dir, prune_cache, touch_cached
+from src.core.tracing import propagate, traced
+
+
+GAP_NAMES = {
+    "okun": "Okun",
+    "hp": "HP",
+    "hamilton": "Hamilton",
+    "baxter_king": "Baxter-King",
+    "uc": "UC trend",
+    "caputil": "CapUtil",
+}
+
+# Bump when an estimator changes so cached vintages are not reused.
+ESTIMATOR_VERSION = 1
+
+
+@traced("transform")
+def okun_gap(unemployment, natural_rate=None, window=120, coefficient=2.0):
+    """Okun gap; without a published natural rate, a trailing mean stands in."""
+    if natural_rate is None or natural_rate.empty:
+        natural = unemployment.rolling(window, min_periods=1).mean()
+    else:
+        natural = (
+            natural_rate.reindex(unemployment.index.union(natural_rate.index))
+            .ffill()
+            .reindex(unemployment.index)
+        )
+    return (-coefficient * (unemployment - natural)).dropna()
+
+
+@traced("transform")
+def hp_gap(log_gdp, lamb=1600):
+    cycle, _trend = hp_filter(log_gdp, lamb=lamb)
+    return cycle
+
+
+@traced("transform")
+def hamilton_gap(log_gdp, h=8, p=4):
+    """Residual of y[t+h] on a constant and y[t], ..., y[t-p+1]."""
+    y = log_gdp.to_numpy(dtype=float)
+    lags = np.lib.stride_tricks.sliding_window_view(y[: y.size - h], p)[:, ::-1]
+    target = y[p - 1 + h :]
+    x = add_intercept(lags)
+    residual = target - x @ ols(x, target)
+    return pd.Series(residual, index=log_gdp.index[p - 1 + h :])
+
+
+def baxter_king_weights(low=6, high=32, K=12):
+    """Symmetric band-pass weights a_{-K..K}, adjusted to sum to zero."""
+    w_low, w_high = 2 * np.pi / high, 2 * np.pi / low
+    j = np.arange(1, K + 1)
+    b = np.r_[(w_high - w_low) / np.pi, (np.sin(j * w_high) - np.sin(j * w_low)) / (np.pi * j)]
+    weights = np.r_[b[:0:-1], b]
+    return weights - weights.sum() / weights.size
+
+
+def _ar_extend(y, steps, p=4):
+    """Extend levels ``steps`` periods with AR(p) forecasts of the differences."""
+    growth = np.diff(y)
+    lags = np.lib.stride_tricks.sliding_window_view(growth[:-1], p)[:, ::-1]
+    beta = ols(add_intercept(lags), growth[p:])
+    history = list(growth[-p:])
+    level = y[-1]
+    extension = np.empty(steps)
+    for i in range(steps):
+        step = beta[0] + float(np.dot(beta[1:], history[::-1][:p]))
+        history.append(step)
+        level += step
+        extension[i] = level
+    return extension
+
+
+@traced("transform")
+def baxter_king_gap(log_gdp, low=6, high=32, K=12):
+    y = log_gdp.to_numpy(dtype=float)
+    padded = np.r_[_ar_extend(y[::-1], K)[::-1], y, _ar_extend(y, K)]
+    cycle = np.convolve(padded, baxter_king_weights(low, high, K), mode="valid")
+    return pd.Series(cycle, index=log_gdp.index)
+
+
+def _uc_system(params):
+    """Transition matrix and state noise of the smooth-trend + AR(2) model."""
+    sd_slope, sd_cycle = np.exp(params[:2])
+    r1, r2 = np.tanh(params[2:])
+    phi1, phi2 = r1 * (1 - r2), r2
+    transition = np.array(
+        [[1.0, 1.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, phi1, phi2], [0.0, 0.0, 1.0, 0.0]]
+    )
+    noise = np.diag([0.0, sd_slope**2, sd_cycle**2, 0.0])
+    return transition, noise
+
+
+def _uc_filter(y, params, smooth=False):
+    """Kalman filter (and RTS smoother) of the UC model; returns loglik or cycle."""
+    from scipy.linalg import solve_discrete_lyapunov
+
+    transition, noise = _uc_system(params)
+    n = y.size
+    state = np.array([y[0], 0.0, 0.0, 0.0])
+    cov = np.zeros((4, 4))
+    cov[0, 0] = cov[1, 1] = 1e7
+    cov[2:, 2:] = solve_discrete_lyapunov(transition[2:, 2:], noise[2:, 2:])
+    z = np.array([1.0, 0.0, 1.0, 0.0])
+
+    loglik = 0.0
+    filtered, filtered_cov = [], []
+    for t in range(n):
+        pz = cov @ z
+        f = float(z @ pz)
+        v = y[t] - float(z @ state)
+        gain = pz / f
+        state = state + gain * v
+        cov = cov - np.outer(gain, pz)
+        if t >= 2:
+            loglik -= 0.5 * (np.log(2 * np.pi * f) + v * v / f)
+        filtered.append(state)
+        filtered_cov.append(cov)
+        state = transition @ state
+        cov = transition @ cov @ transition.T + noise
+    if not smooth:
+        return loglik
+
+    smoothed = np.empty((n, 4))
+    smoothed[-1] = filtered[-1]
+    for t in range(n - 2, -1, -1):
+        ahead = transition @ filtered_cov[t] @ transition.T + noise
+        gain = filtered_cov[t] @ transition.T @ np.linalg.pinv(ahead)
+        smoothed[t] = filtered[t] + gain @ (smoothed[t + 1] - transition @ filtered[t])
+    return smoothed[:, 2]
+
+
+@traced("transform")
+def uc_trend_gap(log_gdp):
+    """Smoothed cycle of the UC model fitted by maximum likelihood."""
+    from scipy.optimize import minimize
+
+    y = log_gdp.to_numpy(dtype=float)
+    scale = max(float(np.std(hp_gap(log_gdp))), 1e-3)
+    start = np.array([np.log(0.05), np.log(0.5 * scale), np.arctanh(0.9), np.arctanh(-0.6)])
+    # The parameters are unconstrained (log sds, tanh partial autocorrelations);
+    # the simplex search is robust to the flat likelihood of small variances.
+    fit = minimize(
+        lambda params: -_uc_filter(y, params),
+        start,
+        method="Nelder-Mead",
+        options={"maxiter": 2000, "xatol": 1e-4, "fatol": 1e-6},
+    )
+    params = fit.x if np.isfinite(fit.fun) else start
+    return pd.Series(_uc_filter(y, params, smooth=True), index=log_gdp.index)
+
+
+@traced("transform")
+def capacity_gap(capacity):
+    return capacity - capacity.mean()
+
+
+@dataclass
+class OutputGapEstimates:
+    """Gap histories of one data vintage, keyed by estimator name."""
+
+    vintage: str
+    series: dict = field(default_factory=dict)
+
+    @property
+    def latest(self):
+        return {name: float(gap.iloc[-1]) for name, gap in self.series.items() if len(gap)}
+
+    @property
+    def median(self):
+        return float(np.median(list(self.latest.values())))
+
+    @property
+    def spread(self):
+        """Cross-estimator standard deviation of the latest gaps, in pp."""
+        return float(np.std(list(self.latest.values())))
+
+    def history(self, freq="QS"):
+        """Estimator histories averaged to a common frequency."""
+        return pd.concat(
+            {name: gap.resample(freq).mean() for name, gap in self.series.items()},
+            axis=1,
+            sort=True,
+        )
+
+
+class OutputGapEnsemble:
+    """Runs the gap estimators concurrently and caches them per data vintage."""
+
+    # Minimum observations per estimator (quarters of GDP, months otherwise).
+    MIN_OBS = {
+        "okun": 1,
+        "hp": 21,
+        "hamilton": 24,
+        "baxter_king": 40,
+        "uc": 40,
+        "caputil": 121,
+    }
+
+    def __init__(self, max_workers=None, cache_directory=None, memory_size=16):
+        self.max_workers = max_workers or len(GAP_NAMES)
+        self.cache_directory = cache_directory
+        self.memory_size = memory_size
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _tasks(self, gdp=None, unemployment=None, natural_rate=None, capacity=None, window=120):
+        tasks = {}
+        if unemployment is not None and len(unemployment) >= self.MIN_OBS["okun"]:
+            tasks["okun"] = lambda: okun_gap(unemployment, natural_rate, window=window)
+        if gdp is not None:
+            log_gdp = np.log(gdp[gdp > 0]) * 100
+            if len(log_gdp) >= self.MIN_OBS["hp"]:
+                tasks["hp"] = lambda: hp_gap(log_gdp)
+            if len(log_gdp) >= self.MIN_OBS["hamilton"]:
+                tasks["hamilton"] = lambda: hamilton_gap(log_gdp)
+            if len(log_gdp) >= self.MIN_OBS["baxter_king"]:
+                tasks["baxter_king"] = lambda: baxter_king_gap(log_gdp)
+            if len(log_gdp) >= self.MIN_OBS["uc"]:
+                tasks["uc"] = lambda: uc_trend_gap(log_gdp)
+        if capacity is not None and len(capacity) >= self.MIN_OBS["caputil"]:
+            tasks["caputil"] = lambda: capacity_gap(capacity)
+        return tasks
+
+    @staticmethod
+    def vintage(window=120, **inputs):
+        """Fingerprint of the input series (index and values) and settings."""
+        return payload_fingerprint(
+            [
+                ESTIMATOR_VERSION,
+                window,
+                {
+                    name: None if series is None else frame_fingerprint(series)
+                    for name, series in inputs.items()
+                },
+            ]
+        )
+
+    def _snapshot_directory(self):
+        return self.cache_directory or cache_dir("output_gaps")
+
+    def _snapshot_path(self, vintage):
+        return os.path.join(self._snapshot_directory(), f"{vintage}.json")
+
+    def estimate(self, gdp=None, unemployment=None, natural_rate=None, capacity=None, window=120):
+        """Gap histories for these inputs; estimators without enough data are left out."""
+        vintage = self.vintage(
+            gdp=gdp,
+            unemployment=unemployment,
+            natural_rate=natural_rate,
+            capacity=capacity,
+            window=window,
+        )
+        with self._lock:
+            if vintage in self._memory:
+                self._memory.move_to_end(vintage)
+                return self._memory[vintage]
+
+        estimates = self._load(vintage)
+        if estimates is None:
+            tasks = self._tasks(gdp, unemployment, natural_rate, capacity, window)
+            estimates = OutputGapEstimates(vintage)
+            if tasks:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as pool:
+                    futures = {name: pool.submit(propagate(task)) for name, task in tasks.items()}
+                for name in GAP_NAMES:
+                    if name in futures:
+                        gap = futures[name].result().dropna()
+                        if len(gap):
+                            estimates.series[name] = gap
+            self._save(estimates)
+
+        with self._lock:
+            self._memory[vintage] = estimates
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+        return estimates
+
+    def _load(self, vintage):
+        path = self._snapshot_path(vintage)
+        snapshot = load_snapshot(path, "output_gaps")
+        if not snapshot or snapshot["fingerprints"].get("vintage") != vintage:
+            return None
+        touch_cached(path)
+        return OutputGapEstimates(
+            vintage,
+            {
+                name: pd.Series(item["values"], index=pd.DatetimeIndex(item["dates"]), dtype=float)
+                for name, item in snapshot["state"].items()
+            },
+        )
+
+    def _save(self, estimates):
+        state = {
+            name: {"dates": [ts.strftime("%Y-%m-%d") for ts in gap.index], "values": gap.to_numpy()}
+            for name, gap in estimates.series.items()
+        }
+        save_snapshot(
+            self._snapshot_path(estimates.vintage),
+            "output_gaps",
+            {"vintage": estimates.vintage},
+            state,
+        )
+        prune_cache(self._snapshot_directory(), self.memory_size, ".json")
@@ -0,0 +1,137 @@
+"""Typed inputs and results of the policy-rate analysis.
+
+``CentralBankSpec`` describes where one central bank's inputs come from, so a
+new bank is a new spec rather than a new pipeline. ``PolicyInputs`` holds the
+point readings collected for a run. ``PolicyAnalysis`` carries every rate,
+gap and contribution that the report, chart and snapshot are rendered from.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CentralBankSpec:
+    country: str
+    title: str
+    gap_source: str
+    # FRED series id, or "BOC" for the scraped Bank of Canada page.
+    policy_rate: str
+    # ("yoy_index", id) for a price index or ("percent", id) for a YoY rate.
+    inflation: tuple
+    # FRED series id, or "BLS" for the scraped BLS release.
+    unemployment: str
+    # ("series", id) for a published NAIRU or ("mean", id, n) for a trailing mean.
+    natural_rate: tuple
+    gdp: str
+    capacity: str
+    # ("series", id, half_width) around a nominal neutral rate, or ("boc",).
+    r_star: tuple
+    financial: str = None
+    claims: str = None
+    # (id, scale) pairs summed into the external-pressure feature.
+    external: tuple = ()
+    fallbacks: dict = field(default_factory=dict)
+    show_unemployment: bool = False
+    # Monthly FRED history behind the Okun gap; defaults to ``unemployment``.
+    unemployment_history: str = None
+
+
+@dataclass
+class PolicyInputs:
+    country: str
+    title: str
+    actual_rate: float
+    inflation: float
+    unemployment: float
+    natural_rate: float
+    gaps: dict
+    r_star_mid: float
+    r_star_range: list
+    threshold: float = 2.5
+    financial_stress: float = 0.0
+    labor_cooling: float = 0.0
+    external_pressure: float = 0.0
+    # Optional scraped inputs left out because the run deadline was reached.
+    skipped: tuple = ()
+
+    @property
+    def output_gap(self):
+        """The HP gap drives the base rule, as in the published reports."""
+        return self.gaps["hp"]
+
+    @property
+    def activity_gap(self):
+        """Median of the output-gap ensemble."""
+        return float(np.median(list(self.gaps.values())))
+
+    @property
+    def gap_spread(self):
+        """Cross-estimator standard deviation of the gaps, in pp."""
+        return float(np.std(list(self.gaps.values())))
+
+    @property
+    def features(self):
+        """Current readings of the data-enhancement features."""
+        return {
+            "activity_gap": self.activity_gap,
+            "inflation_pressure": self.inflation - 2.0,
+            "financial_conditions": self.financial_stress,
+            "external_pressure": self.external_pressure,
+            "labor_cooling": self.labor_cooling,
+        }
+
+
+@dataclass
+class PolicyAnalysis:
+    inputs: PolicyInputs
+    base_rate: float
+    linear_rate: float
+    enhanced_rate: float
+    contributions: dict
+    stance: str
+    # Nonlinear rule at the ensemble median gap, and at its lowest / highest gap.
+    ensemble_rate: float = None
+    ensemble_range: tuple = None
+    simulation: dict = None
+    history: object = None
+    history_stats: dict = None
+    enhanced_history: object = None
+    enhanced_track: dict = None
+    image_path: str = None
+    chart: object = None
+    report: str = None
+
+    @property
+    def gap_bps(self):
+        return (self.inputs.actual_rate - self.base_rate) * 100
+
+    @property
+    def enhanced_gap_bps(self):
+        return (self.inputs.actual_rate - self.enhanced_rate) * 100
+
+    @property
+    def nonlinear_premium(self):
+        return (self.base_rate - self.linear_rate) * 100
+
+    def summary(self):
+        """JSON-ready headline numbers for snapshots and dashboards."""
+        return {
+            "country": self.inputs.country,
+            "title": self.inputs.title,
+            "stance": self.stance,
+            "actual_rate": self.inputs.actual_rate,
+            "inflation": self.inputs.inflation,
+            "output_gap": self.inputs.output_gap,
+            "gaps": dict(self.inputs.gaps),
+            "gap_median": self.inputs.activity_gap,
+            "gap_spread": self.inputs.gap_spread,
+            "r_star_mid": self.inputs.r_star_mid,
+            "base_rate": self.base_rate,
+            "enhanced_rate": self.enhanced_rate,
+            "ensemble_rate": self.ensemble_rate,
+            "gap_bps": self.gap_bps,
+            "enhanced_gap_bps": self.enhanced_gap_bps,
+            "contributions": dict(self.contributions),
+        }
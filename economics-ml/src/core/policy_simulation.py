@@ -0,0 +1,243 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.core.modeling_core import TaylorRuleModels
+
+
+DEFAULT_LEVELS = (0.025, 0.05, 0.25, 0.5, 0.75, 0.95, 0.975)
+
+
+def draw_distribution(spec, size, rng):
+    """Sample from a ``(kind, *params)`` spec.
+
+    Supported kinds: ``("fixed", value)``, ``("normal", mean, sd)``,
+    ``("uniform", low, high)`` and ``("triangular", low, mode, high)``.
+    """
+    kind, *params = spec
+    if kind == "fixed":
+        return np.full(size, float(params[0]))
+    if kind == "normal":
+        return rng.normal(params[0], params[1], size)
+    if kind == "uniform":
+        return rng.uniform(params[0], params[1], size)
+    if kind == "triangular":
+        return rng.triangular(params[0], params[1], params[2], size)
+    raise ValueError(f"Unknown distribution kind: {kind}")
+
+
+def distribution_bounds(spec, width=8.0):
+    """Range covering essentially all the mass of a spec."""
+    kind, *params = spec
+    if kind == "fixed":
+        return float(params[0]), float(params[0])
+    if kind == "normal":
+        return params[0] - width * params[1], params[0] + width * params[1]
+    if kind == "uniform":
+        return float(params[0]), float(params[1])
+    if kind == "triangular":
+        return float(params[0]), float(params[2])
+    raise ValueError(f"Unknown distribution kind: {kind}")
+
+
+class StreamingHistogram:
+    """Fixed-bin histogram with exact moments, for quantiles in bounded memory."""
+
+    def __init__(self, low, high, bins=4000):
+        if high <= low:
+            high = low + 1e-6
+        self.low = float(low)
+        self.high = float(high)
+        self.bins = int(bins)
+        self.width = (self.high - self.low) / self.bins
+        self.counts = np.zeros(self.bins + 2, dtype=np.int64)
+        self.n = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def add(self, values):
+        idx = np.floor((values - self.low) / self.width).astype(np.int64) + 1
+        np.clip(idx, 0, self.bins + 1, out=idx)
+        self.counts += np.bincount(idx, minlength=self.bins + 2)
+        self.n += values.size
+        self.total += float(values.sum())
+        self.total_sq += float(np.dot(values, values))
+
+    def merge(self, other):
+        self.counts += other.counts
+        self.n += other.n
+        self.total += other.total
+        self.total_sq += other.total_sq
+
+    @property
+    def mean(self):
+        return self.total / self.n if self.n else np.nan
+
+    @property
+    def std(self):
+        if not self.n:
+            return np.nan
+        return float(np.sqrt(max(self.total_sq / self.n - self.mean**2, 0.0)))
+
+    def quantile(self, q):
+        """Linear interpolation inside the bin holding the q-th draw."""
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+        cum = np.cumsum(self.counts)
+        target = q * self.n
+        pos = np.searchsorted(cum, target, side="left")
+        pos = np.clip(pos, 1, self.bins)
+        before = np.where(pos > 0, cum[pos - 1], 0)
+        inside = np.maximum(self.counts[pos], 1)
+        frac = np.clip((target - before) / inside, 0.0, 1.0)
+        return self.low + (pos - 1 + frac) * self.width
+
+    def cdf(self, x):
+        """Share of draws at or below ``x``."""
+        if not self.n:
+            return np.nan
+        pos = int(np.clip(np.floor((x - self.low) / self.width) + 1, 0, self.bins + 1))
+        below = self.counts[:pos].sum()
+        frac = 0.0
+        if 1 <= pos <= self.bins:
+            frac = (x - (self.low + (pos - 1) * self.width)) / self.width
+        return float((below + frac * self.counts[pos]) / self.n)
+
+
+class PolicyRateSimulator:
+    """Monte Carlo distribution of Taylor-rule rates.
+
+    Draws r*, inflation and each output-gap estimate from their specs, picks
+    one gap estimate per draw (a model-uncertainty mixture), and streams the
+    implied rates for every rule variant into fixed-bin histograms. Draws are
+    generated in fixed-size chunks across a thread pool, so memory stays at
+    ``chunk_size`` per worker however many draws are requested.
+    """
+
+    def __init__(
+        self,
+        n_draws=2_000_000,
+        chunk_size=250_000,
+        budget_seconds=1.0,
+        levels=DEFAULT_LEVELS,
+        max_workers=None,
+        bins=4000,
+        seed=None,
+    ):
+        self.n_draws = n_draws
+        self.chunk_size = chunk_size
+        self.budget_seconds = budget_seconds
+        self.levels = tuple(levels)
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.bins = bins
+        self.seed = seed
+        self.models = TaylorRuleModels()
+
+    def _rates(self, r_star, pi, gap, threshold, stress_multiplier):
+        return {
+            "nonlinear": self.models.taylor_nonlinear(
+                r_star, pi, gap, threshold=threshold, stress_multiplier=stress_multiplier
+            ),
+            "taylor_1999": self.models.taylor_1999(r_star, pi, gap),
+            "taylor_1993": self.models.taylor_1993(r_star, pi, gap),
+            # Everything except the inflation terms: the fan around a pi-curve.
+            "level_shift": r_star + gap,
+        }
+
+    def _histograms(self, r_star, pi, gaps, threshold, stress_multiplier):
+        r_lo, r_hi = distribution_bounds(r_star)
+        p_lo, p_hi = distribution_bounds(pi)
+        bounds = [distribution_bounds(spec) for spec in gaps.values()]
+        g_lo = min(b[0] for b in bounds)
+        g_hi = max(b[1] for b in bounds)
+        corners = [
+            self._rates(r, p, g, threshold, stress_multiplier)
+            for r in (r_lo, r_hi)
+            for p in (p_lo, p_hi, threshold)
+            for g in (g_lo, g_hi)
+        ]
+        histograms = {}
+        for name in corners[0]:
+            values = [c[name] for c in corners]
+            histograms[name] = StreamingHistogram(min(values), max(values), self.bins)
+        return histograms
+
+    def simulate(
+        self,
+        r_star,
+        pi,
+        gaps,
+        threshold=2.5,
+        stress_multiplier=1.5,
+        gap_weights=None,
+    ):
+        """Run the simulation; ``gaps`` maps estimate names to distribution specs."""
+        names = list(gaps)
+        weights = np.ones(len(names)) if gap_weights is None else np.asarray(
+            [gap_weights[n] for n in names], dtype=float
+        )
+        weights = weights / weights.sum()
+        template = self._histograms(r_star, pi, gaps, threshold, stress_multiplier)
+
+        n_chunks = max(1, int(np.ceil(self.n_draws / self.chunk_size)))
+        seeds = np.random.SeedSequence(self.seed).spawn(n_chunks)
+        start = time.perf_counter()
+        deadline = start + self.budget_seconds
+
+        def run_chunk(seed_seq):
+            if time.perf_counter() > deadline:
+                return None
+            rng = np.random.default_rng(seed_seq)
+            size = self.chunk_size
+            r = draw_distribution(r_star, size, rng)
+            p = draw_distribution(pi, size, rng)
+            pick = rng.choice(len(names), size=size, p=weights)
+            gap = np.empty(size)
+            for i, name in enumerate(names):
+                mask = pick == i
+                gap[mask] = draw_distribution(gaps[name], int(mask.sum()), rng)
+            local = {
+                name: StreamingHistogram(h.low, h.high, h.bins)
+                for name, h in template.items()
+            }
+            for name, values in self._rates(r, p, gap, threshold, stress_multiplier).items():
+                local[name].add(values)
+            return local
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for local in pool.map(run_chunk, seeds):
+                if local is None:
+                    continue
+                for name, hist in local.items():
+                    template[name].merge(hist)
+
+        n = template["nonlinear"].n
+        if n == 0:
+            return None
+        return {
+            "n_draws": int(n),
+            "elapsed": time.perf_counter() - start,
+            "levels": self.levels,
+            "histograms": template,
+            "variants": {
+                name: {
+                    "mean": hist.mean,
+                    "std": hist.std,
+                    "quantiles": dict(
+                        zip(self.levels, map(float, hist.quantile(self.levels)))
+                    ),
+                }
+                for name, hist in template.items()
+            },
+        }
+
+
+def summarize_position(simulation, actual_rate, variant="nonlinear"):
+    """Where the actual rate sits in the simulated distribution."""
+    hist = simulation["histograms"][variant]
+    std = hist.std
+    return {
+        "z_score": (actual_rate - hist.mean) / std if std else 0.0,
+        "percentile": hist.cdf(actual_rate) * 100,
+    }
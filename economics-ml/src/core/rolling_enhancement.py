@@ -0,0 +1,105 @@
+"""Month-by-month history of the data-enhanced Taylor adjustment.
+
+The enhancement regresses the actual-minus-base residual on standardised
+features with an intercept. Standardising is an affine reparametrisation,
+so the fitted values equal those of a raw-feature regression with an
+intercept. In that form the intercept term is the sample mean residual and
+each contribution is ``beta_j * (x_j - mean_j)``. The regression therefore
+only needs running raw moments, which can be updated one row at a time in
+O(k^2) and solved in O(k^3). That makes the whole history linear in its
+length.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.core.linalg_kernels import solve_normal_equations
+
+
+class RunningNormalEquations:
+    """Raw-moment accumulator for OLS with an intercept; rows can be removed."""
+
+    def __init__(self, n_features):
+        self.n = 0
+        self.sx = np.zeros(n_features)
+        self.sy = 0.0
+        self.sxx = np.zeros((n_features, n_features))
+        self.sxy = np.zeros(n_features)
+
+    def add(self, x, y, weight=1.0):
+        self.n += int(weight)
+        self.sx += weight * x
+        self.sy += weight * y
+        self.sxx += weight * np.outer(x, x)
+        self.sxy += weight * x * y
+
+    def remove(self, x, y):
+        self.add(x, y, weight=-1.0)
+
+    def solve(self):
+        """Return ``(x_mean, y_mean, slopes)`` for the rows currently held.
+
+        Features with no variance in the sample get a zero slope, matching the
+        ``sd == 0`` guard of the standardised fit.
+        """
+        x_mean = self.sx / self.n
+        y_mean = self.sy / self.n
+        gram = self.sxx - np.outer(self.sx, x_mean)
+        rhs = self.sxy - self.sx * y_mean
+        scale = np.maximum(np.diag(self.sxx), np.finfo(float).tiny)
+        active = np.diag(gram) > 1e-10 * scale
+        slopes = np.zeros_like(x_mean)
+        if active.any():
+            slopes[active] = solve_normal_equations(
+                gram[np.ix_(active, active)], rhs[active]
+            )
+        return x_mean, y_mean, slopes
+
+
+def enhanced_rate_history(base_rate, calibration_frame, window=None, min_obs=None):
+    """Real-time enhanced-rate path and per-feature contributions.
+
+    The adjustment at each month is fitted on the preceding months only,
+    over an expanding sample or the last ``window`` months, and then applied
+    to that month's features. Clipping and scaling follow
+    ``PolicyRateEngine._data_enhanced_taylor_rate``.
+    """
+    feature_cols = [
+        col for col in calibration_frame.columns if col != "target_adjustment"
+    ]
+    sample = calibration_frame.dropna(subset=["target_adjustment"] + feature_cols)
+    if min_obs is None:
+        min_obs = len(feature_cols) + 2
+    x = sample[feature_cols].to_numpy(dtype=float)
+    y = sample["target_adjustment"].to_numpy(dtype=float)
+    base = pd.Series(base_rate).reindex(sample.index).to_numpy(dtype=float)
+
+    abs_y = pd.Series(np.abs(y))
+    if window:
+        bound = abs_y.rolling(window, min_periods=1).max().shift(1).to_numpy()
+    else:
+        bound = abs_y.cummax().shift(1).to_numpy()
+
+    moments = RunningNormalEquations(len(feature_cols))
+    rows = []
+    dates = []
+    for t in range(len(sample)):
+        if moments.n >= min_obs:
+            x_mean, intercept, slopes = moments.solve()
+            contributions = slopes * (x[t] - x_mean)
+            raw_total = intercept + contributions.sum()
+            total = float(np.clip(raw_total, -bound[t], bound[t]))
+            if raw_total != 0:
+                scale = total / raw_total
+                contributions = contributions * scale
+                intercept *= scale
+            rows.append(
+                [base[t], base[t] + total, intercept, *contributions, total, moments.n]
+            )
+            dates.append(sample.index[t])
+        moments.add(x[t], y[t])
+        if window and moments.n > window:
+            moments.remove(x[t - window], y[t - window])
+
+    columns = ["base_rate", "enhanced_rate", "intercept", *feature_cols, "total", "n"]
+    return pd.DataFrame(rows, index=pd.Index(dates, name=sample.index.name), columns=columns)
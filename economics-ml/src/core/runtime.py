@@ -0,0 +1,84 @@
+import io
+import os
+import sys
+import tempfile
+
+
+def ensure_utf8_stdout():
+    """Rewrap stdout as UTF-8 so emoji and symbols in reports print on any console.
+
+    Called from entry points rather than at import time, so importing an engine
+    never replaces the interpreter's stdout as a side effect.
+    """
+    if sys.stdout.encoding and sys.stdout.encoding.lower().replace("-", "") == "utf8":
+        return
+    if not hasattr(sys.stdout, "buffer"):
+        return
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+
+
+def cache_dir(*parts):
+    """Per-user cache directory for snapshots and other reusable run state.
+
+    Defaults to ``~/.cache/economics-ml`` and can be redirected with the
+    ``ECONOMICS_ML_CACHE_DIR`` environment variable.
+    """
+    root = os.getenv("ECONOMICS_ML_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "economics-ml"
+    )
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def fred_observations_url():
+    """FRED ``series/observations`` endpoint.
+
+    ``FRED_BASE_URL`` (default ``https://api.stlouisfed.org/fred``) points every
+    fetcher at another server with the same contract, such as the local
+    stand-in in ``src.data_utils.synthetic_fred``.
+    """
+    base = os.getenv("FRED_BASE_URL") or "https://api.stlouisfed.org/fred"
+    return base.rstrip("/") + "/series/observations"
+
+
+def atomic_write_text(path, text):
+    """Write ``text`` to ``path`` via a temp file and rename, never half-written."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".part")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def touch_cached(path):
+    """Mark a cache entry as recently used so ``prune_cache`` keeps it."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def prune_cache(directory, keep, suffix):
+    """Delete all but the ``keep`` most recently used ``suffix`` files."""
+    entries = []
+    try:
+        for entry in os.scandir(directory):
+            # Dot-files are temp files still being written.
+            if entry.name.endswith(suffix) and not entry.name.startswith("."):
+                entries.append((entry.stat().st_mtime, entry.path))
+    except OSError:
+        # Another process pruned the directory first.
+        return
+    entries.sort(reverse=True)
+    for _, path in entries[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+
+from src.core.modeling_core import TaylorRuleModels
+
+
+INPUT_COLUMNS = ("r_star", "inflation", "output_gap", "financial_stress", "actual_rate")
+RULE_COLUMNS = ("taylor_1993", "taylor_1999", "nonlinear", "post_08", "smoothed")
+
+
+class TaylorPathGenerator:
+    """Counterfactual rule paths over a monthly input history.
+
+    Every rule variant is evaluated on the whole input frame in one broadcast
+    call. The smoothed path applies ``apply_smoothing`` to the nonlinear rule
+    with the previous month's actual rate, so it needs no recursion.
+    """
+
+    def __init__(self, models=None, threshold=2.5, stress_multiplier=1.5, rho=0.8):
+        self.models = models or TaylorRuleModels()
+        self.threshold = threshold
+        self.stress_multiplier = stress_multiplier
+        self.rho = rho
+
+    def evaluate(self, inputs):
+        """Rule paths for an input frame indexed by month (see ``INPUT_COLUMNS``)."""
+        r_star = inputs["r_star"].to_numpy(dtype=float)
+        pi = inputs["inflation"].to_numpy(dtype=float)
+        gap = inputs["output_gap"].to_numpy(dtype=float)
+        stress = inputs["financial_stress"].to_numpy(dtype=float)
+        actual = inputs["actual_rate"].to_numpy(dtype=float)
+        previous = np.r_[np.nan, actual[:-1]]
+
+        nonlinear = self.models.taylor_nonlinear(
+            r_star,
+            pi,
+            gap,
+            threshold=self.threshold,
+            stress_multiplier=self.stress_multiplier,
+        )
+        paths = {
+            "actual_rate": actual,
+            "taylor_1993": self.models.taylor_1993(r_star, pi, gap),
+            "taylor_1999": self.models.taylor_1999(r_star, pi, gap),
+            "nonlinear": nonlinear,
+            "post_08": self.models.post_08_adjusted(r_star, pi, gap, stress),
+            "smoothed": self.models.apply_smoothing(nonlinear, previous, rho=self.rho),
+        }
+        return pd.DataFrame(
+            {name: np.broadcast_to(values, len(inputs)) for name, values in paths.items()},
+            index=inputs.index,
+        )
+
+
+class TaylorPathPanel:
+    """Cached rule-path panel that is extended incrementally.
+
+    ``update`` compares the new inputs with the cached ones and re-evaluates
+    only from the first month that is new or revised (plus one month of
+    look-back for the smoothed rule). Unchanged inputs cost a comparison.
+    """
+
+    def __init__(self, generator=None):
+        self.generator = generator or TaylorPathGenerator()
+        self.inputs = None
+        self.panel = None
+        self.rows_evaluated = 0
+
+    def _first_changed(self, inputs):
+        """Position of the first new or revised month, or None if unchanged."""
+        if self.inputs is None or inputs.index[0] < self.inputs.index[0]:
+            return 0
+        cached = self.inputs.reindex(inputs.index)
+        same = np.isclose(
+            cached.to_numpy(dtype=float), inputs.to_numpy(dtype=float), equal_nan=True
+        ).all(axis=1)
+        if same.all():
+            return None
+        return int(np.argmin(same))
+
+    def update(self, inputs):
+        inputs = inputs.loc[:, list(INPUT_COLUMNS)].astype(float).sort_index()
+        if inputs.empty:
+            self.inputs = inputs
+            self.panel = pd.DataFrame(columns=["actual_rate", *RULE_COLUMNS], dtype=float)
+            return self.panel
+
+        pos = self._first_changed(inputs)
+        if pos is None:
+            self.panel = self.panel.loc[inputs.index]
+            self.inputs = inputs
+            return self.panel
+
+        begin = max(pos - 1, 0)
+        fresh = self.generator.evaluate(inputs.iloc[begin:]).iloc[pos - begin :]
+        self.rows_evaluated += len(fresh)
+        if pos > 0:
+            fresh = pd.concat([self.panel.loc[inputs.index[:pos]], fresh])
+        self.panel = fresh
+        self.inputs = inputs
+        return self.panel
+
+
+def deviation_stats(panel, rules=RULE_COLUMNS):
+    """Actual-minus-rule deviation summary in bps for each rule path."""
+    stats = {}
+    for rule in rules:
+        deviation = ((panel["actual_rate"] - panel[rule]) * 100).dropna()
+        if deviation.empty:
+            continue
+        latest = float(deviation.iloc[-1])
+        stats[rule] = {
+            "n": int(len(deviation)),
+            "since": deviation.index[0],
+            "mean_bps": float(deviation.mean()),
+            "mae_bps": float(deviation.abs().mean()),
+            "rmse_bps": float(np.sqrt((deviation**2).mean())),
+            "latest_bps": latest,
+            "percentile": float((deviation <= latest).mean() * 100),
+        }
+    return stats
@@ -0,0 +1,215 @@
+"""Span timers for per-stage profiling, enabled by ``main.py --profile``.
+
+Engines wrap their stages in ``span(stage, name)`` blocks or ``@traced``
+functions. Stages are coarse labels such as fetch, transform, factor,
+regression, calibration, simulation, plot and report. While tracing is off,
+``span`` returns a shared no-op context manager and ``traced`` adds a single
+global lookup per call.
+
+While tracing is on, each span records wall-clock start and duration, its
+thread and its parent span. The parent is tracked in a context variable.
+Work submitted to a thread pool through ``propagate`` keeps the submitter's
+span as its parent. From these the trace gives a structured JSON
+document and a Chrome trace-event file (``chrome://tracing`` or Perfetto).
+Time is split into self time per stage, so nested spans are not counted twice.
+"""
+
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+
+from src.core.runtime import atomic_write_text
+
+
+_TRACER = None
+_NULL_SPAN = contextlib.nullcontext()
+# Id of the innermost open span of the current context.
+_CURRENT_SPAN = contextvars.ContextVar("economics_ml_span", default=None)
+
+
+class Tracer:
+    """Collects finished spans from every thread."""
+
+    def __init__(self):
+        self.origin = time.perf_counter_ns()
+        self.started_at = time.time()
+        self.spans = []
+        self._lock = threading.Lock()
+        self._ids = 0
+
+    @contextlib.contextmanager
+    def span(self, stage, name, attrs):
+        with self._lock:
+            self._ids += 1
+            span_id = self._ids
+        parent = _CURRENT_SPAN.get()
+        token = _CURRENT_SPAN.set(span_id)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            _CURRENT_SPAN.reset(token)
+            record = {
+                "id": span_id,
+                "parent": parent,
+                "stage": stage,
+                "name": name,
+                "thread": threading.current_thread().name,
+                "tid": threading.get_ident(),
+                "start_ms": (start - self.origin) / 1e6,
+                "duration_ms": (end - start) / 1e6,
+            }
+            if attrs:
+                record["attrs"] = {key: str(value) for key, value in attrs.items()}
+            with self._lock:
+                self.spans.append(record)
+
+    def stage_totals(self):
+        """Self time (ms) and span count per stage, slowest first.
+
+        A span's self time is its duration less the time during which any of
+        its children ran. Children on pool threads may overlap one another,
+        so their intervals are merged rather than summed.
+        """
+        children = {}
+        for record in self.spans:
+            if record["parent"] is not None:
+                start = record["start_ms"]
+                children.setdefault(record["parent"], []).append(
+                    (start, start + record["duration_ms"])
+                )
+        totals = {}
+        for record in self.spans:
+            start = record["start_ms"]
+            covered = _covered_ms(
+                children.get(record["id"], ()), start, start + record["duration_ms"]
+            )
+            entry = totals.setdefault(record["stage"], {"self_ms": 0.0, "count": 0})
+            entry["self_ms"] += record["duration_ms"] - covered
+            entry["count"] += 1
+        return dict(sorted(totals.items(), key=lambda item: -item[1]["self_ms"]))
+
+    def to_json(self):
+        spans = sorted(self.spans, key=lambda record: record["start_ms"])
+        return {
+            "started_at": self.started_at,
+            "wall_ms": (time.perf_counter_ns() - self.origin) / 1e6,
+            "stages": self.stage_totals(),
+            "spans": spans,
+        }
+
+    def to_chrome_trace(self):
+        """Complete ("X") trace events; timestamps and durations in microseconds."""
+        events = []
+        for record in sorted(self.spans, key=lambda record: record["start_ms"]):
+            events.append(
+                {
+                    "name": record["name"],
+                    "cat": record["stage"],
+                    "ph": "X",
+                    "ts": record["start_ms"] * 1000.0,
+                    "dur": record["duration_ms"] * 1000.0,
+                    "pid": os.getpid(),
+                    "tid": record["tid"],
+                    "args": record.get("attrs", {}),
+                }
+            )
+        threads = {record["tid"]: record["thread"] for record in self.spans}
+        for tid, thread in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": tid,
+                    "args": {"name": thread},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path, fmt="json"):
+        payload = self.to_chrome_trace() if fmt == "chrome" else self.to_json()
+        atomic_write_text(path, json.dumps(payload, indent=1))
+        return path
+
+    def format_summary(self):
+        lines = ["Profile (self time by stage):"]
+        for stage, entry in self.stage_totals().items():
+            lines.append(f"  {stage:<12}{entry['self_ms']:>10.1f} ms  ({entry['count']} spans)")
+        return "\n".join(lines)
+
+
+def _covered_ms(intervals, lower, upper):
+    """Length of the union of ``intervals`` clipped to [lower, upper]."""
+    covered, reach = 0.0, lower
+    for start, end in sorted(intervals):
+        start, end = max(start, reach), min(end, upper)
+        if end > start:
+            covered += end - start
+            reach = end
+    return covered
+
+
+def enable():
+    """Start collecting spans into a fresh tracer and return it."""
+    global _TRACER
+    _TRACER = Tracer()
+    return _TRACER
+
+
+def disable():
+    """Stop collecting; returns the tracer that was active, if any."""
+    global _TRACER
+    tracer, _TRACER = _TRACER, None
+    return tracer
+
+
+def current():
+    return _TRACER
+
+
+def span(stage, name=None, **attrs):
+    """Context manager timing one block; a shared no-op while tracing is off."""
+    tracer = _TRACER
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(stage, name or stage, attrs)
+
+
+def propagate(fn):
+    """``fn`` running in a copy of the caller's context on every call.
+
+    Wrap work handed to a thread pool, so that spans it opens on a worker
+    thread nest under the span that submitted it.
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
+
+
+def traced(stage, name=None):
+    """Decorator form of ``span``, named after the function by default."""
+
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            tracer = _TRACER
+            if tracer is None:
+                return fn(*args, **kwargs)
+            with tracer.span(stage, label, None):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
@@ -1,44 +1,91 @@
-import matplotlib.pyplot as plt
 import numpy as np
+from src.core.chart_renderer import default_renderer
 from src.core.modeling_core import PolicyOracle
 
 
-def plot_taylor_sensitivity(
+def taylor_sensitivity_payload(
     country_name,
     current_pi,
     gap_scenarios,
     r_star_mid,
     r_star_range,
     actual_rate,
-    output_filename="taylor_chart.png",
+    fan_offsets=None,
 ):
-    """Taylor Rule chart with output gap scenarios."""
+    """Everything the Taylor sensitivity chart plots, as plain values and arrays."""
     oracle = PolicyOracle()
 
     pi_min = current_pi - 0.4
     pi_max = current_pi + 0.4
     pi_range = np.linspace(pi_min, pi_max, 100)
-
-    plt.figure(figsize=(10, 6))
-    plt.style.use("bmh")
-
     threshold_val = 2.5
 
-    def get_rate_vectorized(r, gap):
-        rates = []
-        for pi in pi_range:
-            val = oracle.models.taylor_nonlinear(
-                r, pi, gap, threshold=threshold_val, stress_multiplier=1.5
-            )
-            rates.append(val)
-        return np.array(rates)
+    surface = oracle.generate_matrix(
+        [r_star_mid],
+        pi_range,
+        gap_scenarios,
+        rule="taylor_nonlinear",
+        threshold=threshold_val,
+        stress_multiplier=1.5,
+    ).sel(r_star=r_star_mid)
+
+    bands = []
+    if fan_offsets:
+        pi_curve = oracle.models.taylor_nonlinear(
+            0.0, pi_range, 0.0, threshold=threshold_val, stress_multiplier=1.5
+        )
+        for low, high, alpha in ((0.05, 0.95, 0.12), (0.25, 0.75, 0.22)):
+            if low in fan_offsets and high in fan_offsets:
+                # Rounded to chart resolution so Monte Carlo noise between runs
+                # does not defeat the image cache.
+                bands.append(
+                    {
+                        "label": f"Simulated {high - low:.0%} band",
+                        "alpha": alpha,
+                        "lower": pi_curve + round(fan_offsets[low], 2),
+                        "upper": pi_curve + round(fan_offsets[high], 2),
+                    }
+                )
+
+    lows = [actual_rate, surface.values.min(), *(b["lower"].min() for b in bands)]
+    highs = [actual_rate, surface.values.max(), *(b["upper"].max() for b in bands)]
+    return {
+        "title": f"{country_name}: Taylor Rule Scenarios",
+        "current_pi": float(current_pi),
+        "actual_rate": float(actual_rate),
+        "pi_range": pi_range,
+        "labels": list(gap_scenarios.keys()),
+        "gaps": [float(v) for v in gap_scenarios.values()],
+        "rates": np.asarray(surface.values),
+        "bands": bands,
+        "xticks": np.arange(
+            np.floor(pi_min * 10) / 10, np.ceil(pi_max * 10) / 10 + 0.05, 0.1
+        ),
+        "ylim": (float(min(lows)) - 0.25, float(max(highs)) + 0.25),
+    }
+
+
+def draw_taylor_sensitivity(fig, payload):
+    """Draw the Taylor sensitivity chart onto an explicit figure."""
+    ax = fig.add_subplot()
+    pi_range = payload["pi_range"]
+
+    for band in payload["bands"]:
+        ax.fill_between(
+            pi_range,
+            band["lower"],
+            band["upper"],
+            color="#7f7f7f",
+            alpha=band["alpha"],
+            linewidth=0,
+            label=band["label"],
+            zorder=1,
+        )
 
     custom_colors = ["#1f77b4", "#ff7f0e", "#2ca02c"]
-
     plotted_gaps = {}
 
-    for i, (label, gap_val) in enumerate(gap_scenarios.items()):
-        rates = get_rate_vectorized(r_star_mid, gap_val)
+    for i, (label, gap_val) in enumerate(zip(payload["labels"], payload["gaps"])):
         col = custom_colors[i % len(custom_colors)]
 
         if gap_val in plotted_gaps:
@@ -49,9 +96,9 @@ def plot_taylor_sensitivity(
             z_ord = 4
             plotted_gaps[gap_val] = True
 
-        plt.plot(
+        ax.plot(
             pi_range,
-            rates,
+            payload["rates"][i],
             color=col,
             linewidth=lw,
             linestyle="-",
@@ -60,33 +107,51 @@ def plot_taylor_sensitivity(
             zorder=z_ord,
         )
 
-    plt.axhline(
+    actual_rate = payload["actual_rate"]
+    ax.axhline(
         y=actual_rate,
         color="black",
         linestyle="--",
         linewidth=1.5,
         label=f"Current policy rate: {actual_rate}%",
     )
+    ax.scatter([payload["current_pi"]], [actual_rate], color="black", s=80, zorder=10)
 
-    plt.scatter([current_pi], [actual_rate], color="black", s=80, zorder=10)
-
-    plt.xticks(
-        np.arange(np.floor(pi_min * 10) / 10, np.ceil(pi_max * 10) / 10 + 0.05, 0.1)
-    )
-
-    all_rates = [actual_rate]
-    for g in gap_scenarios.values():
-        all_rates.extend(get_rate_vectorized(r_star_mid, g))
-    y_min = min(all_rates) - 0.25
-    y_max = max(all_rates) + 0.25
-    plt.ylim(y_min, y_max)
+    ax.set_xticks(payload["xticks"])
+    ax.set_ylim(*payload["ylim"])
+    ax.legend(loc="upper left", frameon=False, title="Output Gap", fontsize=10)
 
-    plt.legend(loc="upper left", frameon=False, title="Output Gap", fontsize=10)
+    ax.set_title(payload["title"], fontsize=12, fontweight="bold")
+    ax.set_xlabel("Inflation, %", fontsize=11)
+    ax.set_ylabel("Implied policy rate, %", fontsize=11)
+    ax.grid(True, linestyle="--", alpha=0.6)
 
-    plt.title(f"{country_name}: Taylor Rule Scenarios", fontsize=12, fontweight="bold")
-    plt.xlabel("Inflation, %", fontsize=11)
-    plt.ylabel("Implied policy rate, %", fontsize=11)
-    plt.grid(True, linestyle="--", alpha=0.6)
 
-    plt.savefig(output_filename, dpi=120, bbox_inches="tight")
-    print(f"Chart generated: {output_filename}")
+def plot_taylor_sensitivity(
+    country_name,
+    current_pi,
+    gap_scenarios,
+    r_star_mid,
+    r_star_range,
+    actual_rate,
+    output_filename="taylor_chart.png",
+    fan_offsets=None,
+    renderer=None,
+):
+    """Taylor Rule chart with output gap scenarios.
+
+    ``fan_offsets`` maps quantile levels to simulated r* + gap offsets; when
+    given, the nonlinear rule is shaded as 50% and 90% fan bands. Rendering
+    happens in the background; the returned future resolves to the path.
+    """
+    payload = taylor_sensitivity_payload(
+        country_name,
+        current_pi,
+        gap_scenarios,
+        r_star_mid,
+        r_star_range,
+        actual_rate,
+        fan_offsets=fan_offsets,
+    )
+    renderer = renderer or default_renderer()
+    return renderer.submit(draw_taylor_sensitivity, payload, output_filename)
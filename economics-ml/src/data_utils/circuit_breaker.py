@@ -0,0 +1,139 @@
+"""Circuit breakers for the scraped endpoints, persisted across runs.
+
+A blocked or unreachable page (bls.gov, bankofcanada.ca) would otherwise make
+every run wait out the full request timeout before using its fallback. Each
+breaker keeps its state in ``<cache>/breakers/<name>.json``:
+
+- *closed*: calls go through. ``threshold`` consecutive failures open it.
+- *open*: calls fail fast for ``cooldown`` seconds. They return the last good
+  result if there is one, else the fetcher's own fallback.
+- *half-open*: when the cool-down has passed, one call probes the endpoint.
+  Success closes the breaker; failure opens it for another cool-down.
+
+The last good result stands in for a failed or skipped call only while it is
+younger than ``max_stale`` seconds, and each use is counted as a
+``stale_last_good`` fallback. Calls cut short by the run deadline
+(``--deadline``) are not counted as failures.
+
+State is re-read on every call, so separate processes share it.
+"""
+
+import json
+import os
+import threading
+import time
+
+from src.core import deadline
+from src.core.runtime import atomic_write_text, cache_dir
+from src.data_utils.http_metrics import record_fallback
+
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitBreaker:
+    """Fail-fast guard around one fetch, with its last good result."""
+
+    def __init__(
+        self,
+        name,
+        threshold=3,
+        cooldown=900.0,
+        max_stale=86400.0,
+        directory=None,
+        clock=time.time,
+    ):
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_stale = max_stale
+        self.directory = directory
+        self.clock = clock
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        directory = self.directory or cache_dir("breakers")
+        return os.path.join(directory, f"{self.name}.json")
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                state = json.load(handle)
+        except (OSError, ValueError):
+            state = {}
+        state.setdefault("state", CLOSED)
+        state.setdefault("failures", 0)
+        return state
+
+    def _save(self, state):
+        try:
+            atomic_write_text(self.path, json.dumps(state, indent=2, sort_keys=True))
+        except OSError:
+            pass
+
+    def _admit(self):
+        """True if the call may go out; moves an expired open breaker to half-open."""
+        with self._lock:
+            state = self.load()
+            if state["state"] == CLOSED:
+                return True
+            now = self.clock()
+            if now - state.get("opened_at", 0.0) < self.cooldown:
+                return False
+            # One probe per cool-down: other callers keep failing fast meanwhile.
+            state.update(state=HALF_OPEN, opened_at=now)
+            self._save(state)
+            return True
+
+    def _record(self, ok, result):
+        with self._lock:
+            state = self.load()
+            now = self.clock()
+            if ok:
+                state.update(
+                    state=CLOSED,
+                    failures=0,
+                    last_good=result,
+                    last_good_at=now,
+                )
+                state.pop("last_error", None)
+            else:
+                state["failures"] += 1
+                state["last_error"] = str(result)[:200]
+                if state["state"] == HALF_OPEN or state["failures"] >= self.threshold:
+                    state.update(state=OPEN, opened_at=now)
+            self._save(state)
+
+    def _last_good(self, state, otherwise):
+        """The stored last good result while younger than ``max_stale``, else ``otherwise()``."""
+        if "last_good" in state and self.clock() - state.get("last_good_at", 0.0) <= self.max_stale:
+            record_fallback(self.name, "stale_last_good")
+            return state["last_good"]
+        return otherwise()
+
+    def call(self, fetch, failed, fallback):
+        """``fetch()`` unless the breaker is open; then the last good result or ``fallback()``.
+
+        ``failed(result)`` classifies a fetch result, since the fetchers report
+        errors as values rather than exceptions. A failed result is also
+        replaced by the last good one when there is one. A call cut short by
+        the run deadline says nothing about the endpoint and is not recorded.
+        """
+        if not self._admit():
+            record_fallback(self.name, "circuit_open")
+            return self._last_good(self.load(), fallback)
+        deadline.take_exceeded()
+        try:
+            result = fetch()
+        except Exception as exc:
+            if not deadline.take_exceeded():
+                self._record(False, exc)
+            raise
+        if deadline.take_exceeded():
+            return self._last_good(self.load(), lambda: result)
+        if not failed(result):
+            self._record(True, result)
+            return result
+        self._record(False, result)
+        return self._last_good(self.load(), lambda: result)
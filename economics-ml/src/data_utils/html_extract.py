@@ -0,0 +1,156 @@
+"""Targeted table-row extraction and a conditional-GET cache for scraped pages.
+
+The BLS and Bank of Canada scrapers each need one row of one table.
+``find_table_row`` streams the page through the stdlib ``HTMLParser`` and
+keeps only the text of the row it is reading. It builds no tree, and it
+stops once the row is found or the tables it may search are exhausted.
+
+``PageExtractCache`` stores the values extracted from a page together with
+the page's ``ETag`` and ``Last-Modified`` headers, in
+``<cache>/pages/<name>.json``. The next request sends them back as
+``If-None-Match`` / ``If-Modified-Since``. When the page is unchanged, the
+server answers ``304 Not Modified`` with no body, and the stored values are
+returned without parsing anything.
+"""
+
+import json
+import os
+import time
+from html.parser import HTMLParser
+
+from src.core.runtime import atomic_write_text, cache_dir
+from src.data_utils.http_metrics import metered_get
+
+
+# Characters fed to the parser per step; the scan stops between chunks.
+CHUNK_SIZE = 16384
+
+
+class TableRowFinder(HTMLParser):
+    """Streams ``<tr>`` cell texts to ``match(cells)`` until it returns True."""
+
+    def __init__(self, match, max_tables=None):
+        super().__init__(convert_charrefs=True)
+        self.match = match
+        self.max_tables = max_tables
+        self.tables = 0
+        self.row = None
+        self.done = False
+        self._depth = 0
+        self._cells = None
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            if self._depth == 0:
+                if self.max_tables is not None and self.tables >= self.max_tables:
+                    self.done = True
+                    return
+                self.tables += 1
+            self._depth += 1
+        elif self._depth and tag == "tr":
+            self._end_row()
+            self._cells = []
+        elif self._cells is not None and tag in ("td", "th"):
+            self._end_cell()
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if tag in ("td", "th"):
+            self._end_cell()
+        elif tag == "tr":
+            self._end_row()
+        elif tag == "table" and self._depth:
+            self._end_row()
+            self._depth -= 1
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            text = data.strip()
+            if text:
+                self._cell.append(text)
+
+    def _end_cell(self):
+        if self._cell is not None:
+            self._cells.append("".join(self._cell))
+            self._cell = None
+
+    def _end_row(self):
+        self._end_cell()
+        cells, self._cells = self._cells, None
+        if cells and not self.done and self.match(cells):
+            self.row = cells
+            self.done = True
+
+
+def find_table_row(markup, match, max_tables=None):
+    """Scan ``markup`` for the first table row whose cell texts satisfy ``match``.
+
+    Only the first ``max_tables`` top-level tables are searched when given.
+    Returns the finder, whose ``row`` is the cell texts (or None) and whose
+    ``tables`` counts the tables seen.
+    """
+    finder = TableRowFinder(match, max_tables)
+    for start in range(0, len(markup), CHUNK_SIZE):
+        finder.feed(markup[start : start + CHUNK_SIZE])
+        if finder.done:
+            return finder
+    finder.close()
+    finder._end_row()
+    return finder
+
+
+class PageExtractCache:
+    """Values extracted from one page, revalidated with a conditional GET."""
+
+    def __init__(self, name, directory=None):
+        self.name = name
+        self.directory = directory
+
+    @property
+    def path(self):
+        directory = self.directory or cache_dir("pages")
+        return os.path.join(directory, f"{self.name}.json")
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    def fetch(self, source, url, extract, headers=None, **kwargs):
+        """``extract(text)`` of the page at ``url``, or the stored values if unchanged.
+
+        Values are stored only when the server sent a validator and ``extract``
+        returned something other than None.
+        """
+        headers = dict(headers or {})
+        entry = self.load()
+        if entry.get("url") == url and "values" in entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = metered_get(source, url, headers=headers, **kwargs)
+        if response.status_code == 304 and "values" in entry:
+            return entry["values"]
+        response.raise_for_status()
+
+        values = extract(response.text)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if values is not None and (isinstance(etag, str) or isinstance(last_modified, str)):
+            entry = {
+                "url": url,
+                "etag": etag if isinstance(etag, str) else None,
+                "last_modified": last_modified if isinstance(last_modified, str) else None,
+                "values": values,
+                "fetched_at": time.time(),
+            }
+            try:
+                atomic_write_text(self.path, json.dumps(entry, indent=2, sort_keys=True))
+            except OSError:
+                pass
+        return values
@@ -0,0 +1,243 @@
+"""Process-wide metrics for outbound HTTP calls and input fallbacks.
+
+Every fetcher sends its requests through ``metered_get(source, url, ...)``.
+That function still calls ``requests.get``, then records the latency in a
+histogram, the response size and the outcome, labelled by source and host.
+Call sites that fall back to a hard-coded value report it with
+``record_fallback``, which makes silently degraded runs visible. The registry
+can be exported as Prometheus text or JSON.
+
+An optional source running under a run deadline (``src.core.deadline``) has
+its request timeout capped at the remaining budget. Once the budget is spent
+the request is not sent. Both that and a timeout of a capped request raise
+``DeadlineExceeded`` and are counted under the ``deadline`` outcome.
+"""
+
+import json
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+from src.core import deadline
+from src.core.runtime import atomic_write_text
+
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implicit.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class HttpMetrics:
+    """Thread-safe counters and latency histograms keyed by (source, host)."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._requests = {}
+            self._latency = {}
+            self._bytes = {}
+            self._fallbacks = {}
+
+    def observe(self, source, host, seconds, nbytes, outcome):
+        key = (source, host)
+        with self._lock:
+            self._requests[key + (outcome,)] = self._requests.get(key + (outcome,), 0) + 1
+            self._bytes[key] = self._bytes.get(key, 0) + nbytes
+            hist = self._latency.get(key)
+            if hist is None:
+                hist = self._latency[key] = {
+                    "counts": [0] * (len(self.buckets) + 1),
+                    "sum": 0.0,
+                    "max": 0.0,
+                }
+            index = len(self.buckets)
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    index = i
+                    break
+            hist["counts"][index] += 1
+            hist["sum"] += seconds
+            hist["max"] = max(hist["max"], seconds)
+
+    def record_fallback(self, scope, name):
+        with self._lock:
+            self._fallbacks[(scope, name)] = self._fallbacks.get((scope, name), 0) + 1
+
+    def to_json(self):
+        """Per-source totals, outcomes, latency histogram and fallback counts."""
+        with self._lock:
+            sources = []
+            for (source, host), hist in sorted(self._latency.items()):
+                outcomes = {
+                    outcome: count
+                    for (src, hst, outcome), count in sorted(self._requests.items())
+                    if (src, hst) == (source, host)
+                }
+                total = sum(hist["counts"])
+                sources.append(
+                    {
+                        "source": source,
+                        "host": host,
+                        "requests": total,
+                        "outcomes": outcomes,
+                        "bytes": self._bytes[(source, host)],
+                        "latency_seconds": {
+                            "mean": hist["sum"] / total,
+                            "max": hist["max"],
+                            "buckets": dict(
+                                zip(
+                                    [str(bound) for bound in self.buckets] + ["+Inf"],
+                                    hist["counts"],
+                                )
+                            ),
+                        },
+                    }
+                )
+            fallbacks = [
+                {"scope": scope, "input": name, "count": count}
+                for (scope, name), count in sorted(self._fallbacks.items())
+            ]
+        return {"sources": sources, "fallbacks": fallbacks}
+
+    def to_prometheus(self):
+        """Prometheus text exposition format (version 0.0.4)."""
+
+        def labels(**pairs):
+            body = ",".join(f'{key}="{_escape(value)}"' for key, value in pairs.items())
+            return "{" + body + "}"
+
+        lines = [
+            "# HELP economics_ml_http_requests_total Outbound HTTP requests by outcome.",
+            "# TYPE economics_ml_http_requests_total counter",
+        ]
+        with self._lock:
+            for (source, host, outcome), count in sorted(self._requests.items()):
+                lines.append(
+                    "economics_ml_http_requests_total"
+                    f"{labels(source=source, host=host, outcome=outcome)} {count}"
+                )
+            lines += [
+                "# HELP economics_ml_http_request_duration_seconds Outbound HTTP latency.",
+                "# TYPE economics_ml_http_request_duration_seconds histogram",
+            ]
+            for (source, host), hist in sorted(self._latency.items()):
+                cumulative = 0
+                for bound, count in zip(list(self.buckets) + ["+Inf"], hist["counts"]):
+                    cumulative += count
+                    lines.append(
+                        "economics_ml_http_request_duration_seconds_bucket"
+                        f"{labels(source=source, host=host, le=bound)} {cumulative}"
+                    )
+                lines.append(
+                    "economics_ml_http_request_duration_seconds_sum"
+                    f"{labels(source=source, host=host)} {hist['sum']:.6f}"
+                )
+                lines.append(
+                    "economics_ml_http_request_duration_seconds_count"
+                    f"{labels(source=source, host=host)} {cumulative}"
+                )
+            lines += [
+                "# HELP economics_ml_http_response_bytes_total Response body bytes received.",
+                "# TYPE economics_ml_http_response_bytes_total counter",
+            ]
+            for (source, host), nbytes in sorted(self._bytes.items()):
+                lines.append(
+                    "economics_ml_http_response_bytes_total"
+                    f"{labels(source=source, host=host)} {nbytes}"
+                )
+            lines += [
+                "# HELP economics_ml_fallbacks_total Inputs served by a default because "
+                "the source returned nothing usable.",
+                "# TYPE economics_ml_fallbacks_total counter",
+            ]
+            for (scope, name), count in sorted(self._fallbacks.items()):
+                lines.append(
+                    f"economics_ml_fallbacks_total{labels(scope=scope, input=name)} {count}"
+                )
+        return "\n".join(lines) + "\n"
+
+    def write(self, path, fmt="json"):
+        if fmt == "prometheus":
+            atomic_write_text(path, self.to_prometheus())
+        else:
+            atomic_write_text(path, json.dumps(self.to_json(), indent=1))
+        return path
+
+    def format_summary(self):
+        payload = self.to_json()
+        lines = ["HTTP sources:"]
+        for entry in payload["sources"]:
+            failed = entry["requests"] - entry["outcomes"].get("ok", 0)
+            lines.append(
+                f"  {entry['source']:<10}{entry['host']:<32}{entry['requests']:>4} req"
+                f"{failed:>4} failed{entry['latency_seconds']['mean'] * 1000:>9.0f} ms avg"
+                f"{entry['bytes'] / 1024:>9.1f} KiB"
+            )
+        for entry in payload["fallbacks"]:
+            lines.append(f"  [FALLBACK] {entry['scope']}: {entry['input']} x{entry['count']}")
+        return "\n".join(lines)
+
+
+REGISTRY = HttpMetrics()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _outcome(exc):
+    if isinstance(exc, requests.Timeout):
+        return "timeout"
+    if isinstance(exc, requests.ConnectionError):
+        return "connection_error"
+    return "error"
+
+
+class DeadlineExceeded(requests.Timeout):
+    """A request not sent, or cut short, because the run deadline was spent."""
+
+
+def metered_get(source, url, **kwargs):
+    """``requests.get`` that records latency, size and outcome under ``source``."""
+    host = urlparse(url).netloc
+    budget = deadline.budget()
+    capped = False
+    if budget is not None:
+        remaining = budget.remaining()
+        if remaining <= 0:
+            REGISTRY.observe(source, host, 0.0, 0, "deadline")
+            deadline.note_exceeded()
+            raise DeadlineExceeded(f"{source}: run deadline reached")
+        requested = kwargs.get("timeout")
+        capped = not isinstance(requested, (int, float)) or remaining < requested
+        kwargs["timeout"] = remaining if capped else requested
+    start = time.perf_counter()
+    try:
+        response = requests.get(url, **kwargs)
+    except Exception as exc:
+        if capped and isinstance(exc, requests.Timeout):
+            REGISTRY.observe(source, host, time.perf_counter() - start, 0, "deadline")
+            deadline.note_exceeded()
+            raise DeadlineExceeded(f"{source}: run deadline reached") from exc
+        REGISTRY.observe(source, host, time.perf_counter() - start, 0, _outcome(exc))
+        raise
+    content = getattr(response, "content", None)
+    nbytes = len(content) if isinstance(content, (bytes, str)) else 0
+    status = getattr(response, "status_code", None)
+    outcome = "ok"
+    if status == 304:
+        outcome = "not_modified"
+    elif isinstance(status, int) and status >= 400:
+        outcome = "http_error"
+    REGISTRY.observe(source, host, time.perf_counter() - start, nbytes, outcome)
+    return response
+
+
+def record_fallback(scope, name):
+    """Count one use of a hard-coded default in place of a fetched input."""
+    REGISTRY.record_fallback(scope, name)
@@ -1,37 +1,60 @@
 import os
-import requests
 import pandas as pd
 from datetime import datetime
-from bs4 import BeautifulSoup
+
+from src.core.runtime import fred_observations_url
+from src.core.tracing import span, traced
+from src.data_utils.circuit_breaker import CircuitBreaker
+from src.data_utils.html_extract import PageExtractCache, find_table_row
+from src.data_utils.http_metrics import metered_get, record_fallback
+from src.data_utils.macro_series import MacroSeries
 
 
 class MacroDataFetcher:
     def __init__(self, fred_api_key=None):
         self.fred_api_key = fred_api_key or os.getenv("FRED_API_KEY")
-        self.fred_base_url = "https://api.stlouisfed.org/fred/series/observations"
+        self.fred_base_url = fred_observations_url()
+        # Scraped pages fail fast for a cool-down after repeated failures.
+        self.breakers = {"bls": CircuitBreaker("bls"), "boc": CircuitBreaker("boc")}
+        # Extracted values per page, revalidated by ETag / Last-Modified.
+        self.pages = {"bls": PageExtractCache("bls"), "boc": PageExtractCache("boc")}
 
     def fetch_fred_series(self, series_id, limit=20):
         """Fetch data from FRED API."""
-        if not self.fred_api_key:
-            return []
-
-        params = {
-            "series_id": series_id,
-            "api_key": self.fred_api_key,
-            "file_type": "json",
-            "sort_order": "desc",
-            "limit": limit,
-        }
-        try:
-            response = requests.get(self.fred_base_url, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            observations = [obs for obs in data["observations"] if obs["value"] != "."]
-            return observations[:limit]
-        except Exception:
-            return []
-
+        with span("fetch", f"FRED {series_id}", limit=limit):
+            if not self.fred_api_key:
+                return []
+
+            params = {
+                "series_id": series_id,
+                "api_key": self.fred_api_key,
+                "file_type": "json",
+                "sort_order": "desc",
+                "limit": limit,
+            }
+            try:
+                response = metered_get("fred", self.fred_base_url, params=params, timeout=15)
+                response.raise_for_status()
+                data = response.json()
+                observations = [obs for obs in data["observations"] if obs["value"] != "."]
+                return observations[:limit]
+            except Exception:
+                return []
+
+    def fetch_series(self, series_id, limit=20):
+        """``fetch_fred_series`` parsed into a MacroSeries."""
+        return MacroSeries.from_records(self.fetch_fred_series(series_id, limit), series_id)
+
+    @traced("fetch", "BLS unemployment")
     def fetch_bls_unemployment(self):
+        """Latest BLS unemployment rate, behind the ``bls`` circuit breaker."""
+        return self.breakers["bls"].call(
+            self._scrape_bls_unemployment,
+            failed=lambda result: not isinstance(result, dict),
+            fallback=lambda: "Error: BLS circuit open.",
+        )
+
+    def _scrape_bls_unemployment(self):
         """
         Scrape latest unemployment rate directly from BLS (Bureau of Labor Statistics).
         """
@@ -40,29 +63,35 @@ class MacroDataFetcher:
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         }
         try:
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            table = soup.find("table")
-            if not table:
-                return "Error: BLS table not found."
-
-            rows = table.find_all("tr")
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-                if not cells:
-                    continue
-                row_text = cells[0].get_text(strip=True)
-                if "Unemployment rate" in row_text:
-                    val = cells[-1].get_text(strip=True)
-                    return {"date": "Latest BLS release", "value": val, "source": url}
-
-            return "Error: Unemployment rate row not found."
+            val = self.pages["bls"].fetch(
+                "bls", url, self._bls_unemployment_cell, headers=headers, timeout=15
+            )
+            return {"date": "Latest BLS release", "value": val, "source": url}
         except Exception as e:
             return f"Error: {str(e)}"
 
+    @staticmethod
+    def _bls_unemployment_cell(html):
+        """Last cell of the "Unemployment rate" row in the release's first table."""
+        finder = find_table_row(
+            html, lambda cells: "Unemployment rate" in cells[0], max_tables=1
+        )
+        if not finder.tables:
+            raise ValueError("BLS table not found.")
+        if finder.row is None:
+            raise ValueError("Unemployment rate row not found.")
+        return finder.row[-1]
+
+    @traced("fetch", "BoC indicators")
     def fetch_boc_data(self):
+        """BoC indicators, behind the ``boc`` circuit breaker."""
+        return self.breakers["boc"].call(
+            self._scrape_boc_data,
+            failed=lambda result: "error" in result,
+            fallback=lambda: {"error": "BoC circuit open"},
+        )
+
+    def _scrape_boc_data(self):
         """
         Scrape BoC for Output Gap, Policy Rate, and Nominal Neutral Rate.
         """
@@ -72,54 +101,45 @@ class MacroDataFetcher:
         data = {"output_gap": -0.8, "policy_rate": 2.25, "neutral_rate": [2.25, 3.25]}
 
         try:
-            resp = requests.get(url, headers=headers, timeout=15)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.content, "html.parser")
-
-            tables = soup.find_all("table")
-            for table in tables:
-                for tr in table.find_all("tr"):
-                    cells = [
-                        td.get_text(strip=True) for td in tr.find_all(["td", "th"])
-                    ]
-                    if not cells:
-                        continue
-                    full_row_text = " ".join(cells).lower()
-                    if "current mpr output gap" in full_row_text:
-                        target_indices = [
-                            i
-                            for i, c in enumerate(cells)
-                            if "current mpr output gap" in c.lower()
-                        ]
-                        if target_indices:
-                            start_idx = target_indices[0]
-                            for i in range(start_idx + 1, len(cells)):
-                                clean_val = (
-                                    cells[i]
-                                    .replace("Q1", "")
-                                    .replace("Q2", "")
-                                    .replace("Q3", "")
-                                    .replace("Q4", "")
-                                    .replace("%", "")
-                                    .strip()
-                                )
-                                try:
-                                    if clean_val and not any(
-                                        kw in clean_val.lower()
-                                        for kw in ["historical", "output", "survey"]
-                                    ):
-                                        data["output_gap"] = float(clean_val)
-                                except:
-                                    if data["output_gap"] != -0.8:
-                                        break
-                                    continue
-
-            page_text = soup.get_text().lower()
-
+            output_gap = self.pages["boc"].fetch(
+                "boc", url, self._boc_output_gap, headers=headers, timeout=15
+            )
+            if output_gap is None:
+                record_fallback("boc", "output_gap")
+            else:
+                data["output_gap"] = output_gap
             return data
         except Exception as e:
             return {"error": str(e)}
 
+    @staticmethod
+    def _boc_output_gap(html):
+        """Latest reading in the "Current MPR output gap" row, or None."""
+        label = "current mpr output gap"
+        finder = find_table_row(html, lambda cells: label in " ".join(cells).lower())
+        if finder.row is None:
+            return None
+        cells = finder.row
+        target_indices = [i for i, c in enumerate(cells) if label in c.lower()]
+        if not target_indices:
+            return None
+
+        output_gap = None
+        for cell in cells[target_indices[0] + 1 :]:
+            clean_val = cell
+            for token in ("Q1", "Q2", "Q3", "Q4", "%"):
+                clean_val = clean_val.replace(token, "")
+            clean_val = clean_val.strip()
+            if not clean_val or any(
+                kw in clean_val.lower() for kw in ["historical", "output", "survey"]
+            ):
+                continue
+            try:
+                output_gap = float(clean_val)
+            except ValueError:
+                if output_gap is not None:
+                    break
+        return output_gap
 
 if __name__ == "__main__":
     fetcher = MacroDataFetcher()
@@ -0,0 +1,101 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from src.core.tracing import propagate
+from src.data_utils.macro_data_fetcher import MacroDataFetcher
+from src.data_utils.macro_series import MacroSeries
+
+
+class SharedSeriesCache:
+    """Single-flight, in-memory fetch layer shared by concurrent analyses.
+
+    Exposes the ``MacroDataFetcher`` methods the engines call. A FRED series is
+    downloaded once per run at the largest ``limit`` requested so far. Smaller
+    requests are served from the newest rows. Callers asking for a series that
+    is already in flight wait on that request instead of sending their own.
+    Empty results (missing key, network failure) are handed to the waiting
+    callers but not kept, so a later call can retry.
+    """
+
+    def __init__(self, fetcher=None, max_workers=8):
+        self.fetcher = fetcher or MacroDataFetcher()
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._series = {}
+        self._calls = {}
+
+    def fetch_fred_series(self, series_id, limit=20):
+        with self._lock:
+            entry = self._series.get(series_id)
+            if entry is not None and entry[0] >= limit:
+                future = entry[1]
+                owner = False
+            else:
+                future = Future()
+                self._series[series_id] = (limit, future)
+                owner = True
+        if owner:
+            try:
+                records = self.fetcher.fetch_fred_series(series_id, limit=limit)
+            except Exception as exc:
+                self._discard(self._series, series_id, future)
+                future.set_exception(exc)
+                raise
+            if not records:
+                self._discard(self._series, series_id, future)
+            future.set_result(records)
+        return list(future.result()[:limit])
+
+    def fetch_series(self, series_id, limit=20):
+        """The cached records of ``series_id`` parsed into a MacroSeries."""
+        return MacroSeries.from_records(self.fetch_fred_series(series_id, limit), series_id)
+
+    def shared(self, key, fetch):
+        """Single-flight memo of ``fetch()`` under ``key`` for other sources.
+
+        Lets engines with their own fetch functions (e.g. DataFrame-returning
+        FRED helpers) share downloads within one run. Failures are not kept.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._calls[key] = future
+        if owner:
+            try:
+                result = fetch()
+            except Exception as exc:
+                self._discard(self._calls, key, future)
+                future.set_exception(exc)
+                raise
+            future.set_result(result)
+        return future.result()
+
+    def _call_once(self, name):
+        return self.shared(name, getattr(self.fetcher, name))
+
+    def _discard(self, table, key, future):
+        with self._lock:
+            entry = table.get(key)
+            current = entry[1] if isinstance(entry, tuple) else entry
+            if current is future:
+                del table[key]
+
+    def fetch_bls_unemployment(self):
+        return self._call_once("fetch_bls_unemployment")
+
+    def fetch_boc_data(self):
+        return self._call_once("fetch_boc_data")
+
+    def prefetch(self, requests):
+        """Fetch ``{series_id: limit}`` concurrently and wait for all of them."""
+        if not requests:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            list(
+                pool.map(
+                    propagate(lambda item: self.fetch_fred_series(item[0], limit=item[1])),
+                    requests.items(),
+                )
+            )
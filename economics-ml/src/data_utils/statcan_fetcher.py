@@ -2,7 +2,9 @@ import io
 import zipfile
 
 import pandas as pd
-import requests
+
+from src.core.tracing import traced
+from src.data_utils.http_metrics import metered_get
 
 
 class StatCanDataFetcher:
@@ -28,9 +30,10 @@ class StatCanDataFetcher:
         series["value"] = pd.to_numeric(series["VALUE"], errors="coerce")
         return series.dropna().set_index("date")[["value"]].sort_index()
 
+    @traced("fetch", "StatCan retail sales")
     def fetch_canada_retail_sales(self):
         try:
-            response = requests.get(self.RETAIL_SALES_URL, timeout=20)
+            response = metered_get("statcan", self.RETAIL_SALES_URL, timeout=20)
             response.raise_for_status()
             return self._parse_retail_sales_zip(response.content)
         except Exception:
@@ -0,0 +1,378 @@
+"""Synthetic macro universe and a local stand-in for the FRED observations API.
+
+``SyntheticUniverse`` generates every FRED series the engines request
+(``CATALOG``) plus ``n_indicators`` extra monthly indicators named
+``SYN0001``, ``SYN0002`` and so on. All of them are driven by a few AR(1)
+common factors, so the panel has the factor structure of real activity data.
+It also has the awkward features of real data:
+
+- ragged edges: each series has its own publication lag, so the newest
+  periods of some series are still unpublished on the as-of date;
+- revisions: every observation is published with an error and revised once
+  later, and both vintages are kept with ALFRED-style ``realtime_start`` /
+  ``realtime_end`` dates;
+- outliers, and missing values sent as ``"."`` as FRED does.
+
+``FredStubServer`` serves a universe over HTTP. It implements the
+``series/observations`` query parameters and JSON shape that the three
+fetchers use. Point the engines at it by setting ``FRED_BASE_URL`` to its
+``base_url``. Throughput and latency tests of the whole pipeline then run
+offline at any scale (see ``load_test.py``).
+"""
+
+import json
+import threading
+import zlib
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+
+# series id -> (frequency, kind, publication lag in days, parameters).
+# "growth": a trending level built from period growth rates.
+#   Parameters: (latest level, annual drift %, idiosyncratic sd % per month).
+# "level": a mean-reverting rate or index, clipped to plausible bounds.
+#   Parameters: (mean, standard deviation, lower bound, upper bound).
+CATALOG = {
+    "GDPC1": ("QS", "growth", 30, (23500.0, 2.5, 0.3)),
+    "NGDPRSAXDCCAQ": ("QS", "growth", 60, (2300000.0, 2.2, 0.3)),
+    "INDPRO": ("MS", "growth", 17, (103.0, 1.0, 0.7)),
+    "PAYEMS": ("MS", "growth", 7, (159000.0, 1.2, 0.12)),
+    "RSAFS": ("MS", "growth", 17, (720000.0, 4.5, 0.9)),
+    "UNRATE": ("MS", "level", 7, (5.8, 1.5, 2.5, 15.0)),
+    "PCEC96": ("MS", "growth", 30, (16500.0, 2.5, 0.35)),
+    "PCEPILFE": ("MS", "growth", 30, (125.0, 2.2, 0.12)),
+    "HOUST": ("MS", "level", 18, (1400.0, 250.0, 500.0, 2300.0)),
+    "DGORDER": ("MS", "growth", 25, (290000.0, 3.0, 1.5)),
+    "DSPIC96": ("MS", "growth", 30, (17500.0, 2.3, 0.5)),
+    "TCU": ("MS", "level", 17, (78.0, 3.5, 60.0, 100.0)),
+    "IRSTCI01USM156N": ("MS", "level", 30, (3.5, 2.5, 0.0, 20.0)),
+    "NROU": ("QS", "level", 30, (5.0, 0.4, 3.5, 7.0)),
+    "FEDTARGLMD": ("QS", "level", 30, (3.0, 0.4, 2.0, 5.0)),
+    "NFCI": ("W-FRI", "level", 5, (-0.3, 0.4, -1.5, 3.0)),
+    "ICSA": ("W-SAT", "level", 5, (330000.0, 60000.0, 180000.0, 900000.0)),
+    "DFF": ("D", "level", 1, (3.5, 2.5, 0.0, 20.0)),
+    "T10Y2Y": ("D", "level", 1, (1.0, 1.0, -2.0, 3.5)),
+    "DEXCAUS": ("D", "level", 1, (1.25, 0.12, 0.9, 1.65)),
+    "DCOILWTICO": ("D", "level", 1, (65.0, 20.0, 15.0, 150.0)),
+    "CANPROINDMISMEI": ("MS", "growth", 60, (100.0, 1.0, 0.9)),
+    "LRHUTTTTCAM156S": ("MS", "level", 7, (7.2, 1.3, 3.0, 15.0)),
+    "IRSTCI01CAM156N": ("MS", "level", 30, (3.0, 2.0, 0.0, 15.0)),
+    "CPALTT01CAM659N": ("MS", "level", 20, (2.2, 1.2, -2.0, 12.0)),
+    "BSCACP02CAM659S": ("MS", "level", 60, (80.0, 3.5, 60.0, 100.0)),
+}
+
+# Series that fall when activity rises.
+COUNTERCYCLICAL = ("UNRATE", "LRHUTTTTCAM156S", "ICSA", "NFCI")
+# Deviation of a growth series' log level from trend (%) per unit of the
+# common component. The cycle is stationary, so the drift sets the trend.
+CYCLE_LEVEL = 2.0
+# Share of a level series' standard deviation driven by the common component.
+CYCLE_SHARE = 0.6
+# Monthly persistence of the idiosyncratic part of a level series.
+LEVEL_PERSISTENCE = 0.97
+
+# Months covered by one period of each frequency.
+_PERIOD_MONTHS = {"D": 1 / 30.4, "W-FRI": 7 / 30.4, "W-SAT": 7 / 30.4, "MS": 1.0, "QS": 3.0}
+# Days from first publication to the revised vintage.
+_REVISION_DAYS = {"D": 7, "W-FRI": 7, "W-SAT": 7, "MS": 30, "QS": 60}
+
+OPEN_END = np.datetime64("9999-12-31")
+
+
+@dataclass(frozen=True, eq=False)
+class SyntheticSeries:
+    """One series with both vintages of every observation."""
+
+    series_id: str
+    frequency: str
+    dates: np.ndarray
+    released: np.ndarray
+    revised: np.ndarray
+    first: np.ndarray
+    final: np.ndarray
+
+    def vintage_rows(self, realtime_start, realtime_end):
+        """(realtime_start, realtime_end, date, value) arrays overlapping the window."""
+        first_end = self.revised - np.timedelta64(1, "D")
+        rows = []
+        for start, end, values in (
+            (self.released, first_end, self.first),
+            (self.revised, np.full(len(self.dates), OPEN_END), self.final),
+        ):
+            keep = (start <= realtime_end) & (end >= realtime_start)
+            rows.append((start[keep], end[keep], self.dates[keep], values[keep]))
+        starts, ends, dates, values = (np.concatenate(parts) for parts in zip(*rows))
+        order = np.lexsort((starts, dates))
+        return starts[order], ends[order], dates[order], values[order]
+
+
+class SyntheticUniverse:
+    """Deterministic synthetic panel: catalogued series plus ``n_indicators`` extras."""
+
+    def __init__(
+        self,
+        n_indicators=0,
+        years=70,
+        end="2026-06-01",
+        today=None,
+        seed=0,
+        n_factors=3,
+        outlier_rate=0.002,
+        missing_rate=0.0005,
+        revision_scale=0.5,
+    ):
+        self.n_indicators = n_indicators
+        self.seed = seed
+        self.outlier_rate = outlier_rate
+        self.missing_rate = missing_rate
+        self.revision_scale = revision_scale
+        self.months = pd.date_range(end=end, periods=int(years * 12), freq="MS")
+        self.today = np.datetime64(
+            pd.Timestamp(today) if today else self.months[-1] + pd.offsets.MonthEnd(0) + pd.Timedelta(days=10),
+            "D",
+        )
+        self._month_index = self.months.to_numpy().astype("datetime64[M]")
+        self.catalog = dict(CATALOG)
+        for i in range(1, n_indicators + 1):
+            drift, vol = 1.0 + (i % 5) * 0.5, 0.3 + (i % 7) * 0.1
+            self.catalog[f"SYN{i:04d}"] = ("MS", "growth", 5 + (i * 7) % 40, (100.0, drift, vol))
+
+        rng = np.random.default_rng(seed)
+        phi = np.linspace(0.8, 0.5, n_factors)
+        shocks = rng.normal(0, 1, (len(self.months), n_factors))
+        self.factors = np.column_stack(
+            [
+                lfilter([np.sqrt(1 - p**2)], [1.0, -p], shocks[:, k])
+                for k, p in enumerate(phi)
+            ]
+        )
+        self._series = {}
+        self._lock = threading.Lock()
+
+    @property
+    def indicators(self):
+        """The synthetic monthly indicator ids, ``SYN0001`` first."""
+        return [f"SYN{i:04d}" for i in range(1, self.n_indicators + 1)]
+
+    def series(self, series_id):
+        """Generated series (cached); unknown ids raise KeyError as FRED rejects them."""
+        with self._lock:
+            if series_id not in self._series:
+                if series_id not in self.catalog:
+                    raise KeyError(series_id)
+                self._series[series_id] = self._generate(series_id)
+            return self._series[series_id]
+
+    def _generate(self, series_id):
+        freq, kind, lag_days, params = self.catalog[series_id]
+        rng = np.random.default_rng([self.seed, zlib.crc32(series_id.encode())])
+
+        # Calendar arithmetic on datetime64 months; pandas month offsets are
+        # slow enough to dominate generation of a 500-indicator panel.
+        months = self._month_index
+        if freq in ("D", "W-FRI", "W-SAT"):
+            days = pd.date_range(self.months[0], self.months[-1] + pd.offsets.MonthEnd(0), freq=freq)
+            dates = days.to_numpy().astype("datetime64[D]")
+            period_end = dates
+            month = dates.astype("datetime64[M]") - months[0]
+        else:
+            month = np.arange(len(months))
+            if freq == "QS":
+                month = month[months.astype(np.int64) % 3 == 0]
+            dates = months[month].astype("datetime64[D]")
+            period_end = (months[month] + int(round(_PERIOD_MONTHS[freq]))).astype("datetime64[D]")
+            period_end = period_end - np.timedelta64(1, "D")
+        month = np.asarray(month, dtype=np.int64)
+        common = self.factors[np.clip(month, 0, len(months) - 1)]
+
+        # Unit-variance common component, led by the first factor.
+        loadings = rng.normal(0, 1, self.factors.shape[1])
+        loadings[0] = abs(loadings[0]) + 1.0
+        loadings /= np.linalg.norm(loadings)
+        if series_id in COUNTERCYCLICAL:
+            loadings = -loadings
+        cycle = common @ loadings
+        step = _PERIOD_MONTHS[freq]
+        n = len(dates)
+        outliers = rng.random(n) < self.outlier_rate
+        jumps = rng.choice([-1.0, 1.0], outliers.sum())
+
+        if kind == "growth":
+            latest, drift, vol = params
+            noise = rng.normal(0, vol * np.sqrt(step), n)
+            noise[outliers] += jumps * 6 * vol * np.sqrt(step)
+            elapsed = (dates - dates[0]).astype(np.int64) / 30.4375
+            path = drift / 12 * elapsed + CYCLE_LEVEL * cycle + np.cumsum(noise)
+            final = latest * np.exp((path - path[-1]) / 100)
+            revision = rng.normal(0, self.revision_scale * vol * np.sqrt(step), n)
+            first = final * np.exp(revision / 100)
+        else:
+            mean, sd, lower, upper = params
+            phi = LEVEL_PERSISTENCE**step
+            idio = lfilter([np.sqrt(1 - phi**2)], [1.0, -phi], rng.normal(0, 1, n))
+            idio[outliers] += jumps * 3
+            deviation = CYCLE_SHARE * cycle + np.sqrt(1 - CYCLE_SHARE**2) * idio
+            final = np.clip(mean + sd * deviation, lower, upper)
+            revision = rng.normal(0, self.revision_scale * 0.1 * sd, n)
+            first = np.clip(final + revision, lower, upper)
+
+        missing = rng.random(len(dates)) < self.missing_rate
+        final[missing] = np.nan
+        first[missing] = np.nan
+        released = period_end + np.timedelta64(lag_days, "D")
+        return SyntheticSeries(
+            series_id=series_id,
+            frequency=freq,
+            dates=dates,
+            released=released,
+            revised=released + np.timedelta64(_REVISION_DAYS[freq], "D"),
+            first=first,
+            final=final,
+        )
+
+    def observations(
+        self,
+        series_id,
+        limit=100000,
+        offset=0,
+        sort_order="asc",
+        observation_start=None,
+        observation_end=None,
+        realtime_start=None,
+        realtime_end=None,
+    ):
+        """The JSON payload FRED returns for ``series/observations``."""
+        series = self.series(series_id)
+        rt_start = np.datetime64(realtime_start or self.today, "D")
+        rt_end = np.datetime64(realtime_end or realtime_start or self.today, "D")
+        starts, ends, dates, values = series.vintage_rows(rt_start, rt_end)
+        keep = np.ones(len(dates), dtype=bool)
+        if observation_start:
+            keep &= dates >= np.datetime64(observation_start, "D")
+        if observation_end:
+            keep &= dates <= np.datetime64(observation_end, "D")
+        starts, ends, dates, values = starts[keep], ends[keep], dates[keep], values[keep]
+        count = len(dates)
+        if sort_order == "desc":
+            starts, ends, dates, values = starts[::-1], ends[::-1], dates[::-1], values[::-1]
+        window = slice(offset, offset + limit)
+        starts, ends, dates, values = starts[window], ends[window], dates[window], values[window]
+
+        text = np.where(np.isnan(values), ".", np.char.mod("%.4f", np.nan_to_num(values)))
+        columns = (
+            np.datetime_as_string(starts).tolist(),
+            np.datetime_as_string(ends).tolist(),
+            np.datetime_as_string(dates).tolist(),
+            text.tolist(),
+        )
+        return {
+            "realtime_start": str(rt_start),
+            "realtime_end": str(rt_end),
+            "observation_start": observation_start or "1776-07-04",
+            "observation_end": observation_end or "9999-12-31",
+            "units": "lin",
+            "output_type": 1,
+            "file_type": "json",
+            "order_by": "observation_date",
+            "sort_order": sort_order,
+            "count": count,
+            "offset": offset,
+            "limit": limit,
+            "observations": [
+                {"realtime_start": a, "realtime_end": b, "date": d, "value": v}
+                for a, b, d, v in zip(*columns)
+            ],
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path.rstrip("/") != "/fred/series/observations":
+            return self._reply(404, {"error_code": 404, "error_message": "Not Found"})
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        status, payload = self.server.stub.handle(query)
+        self._reply(status, payload)
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class FredStubServer:
+    """Threaded local HTTP server answering ``/fred/series/observations``."""
+
+    def __init__(self, universe, host="127.0.0.1", port=0):
+        self.universe = universe
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.stub = self
+        self._thread = None
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    @property
+    def base_url(self):
+        """Value for ``FRED_BASE_URL``."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/fred"
+
+    def handle(self, query):
+        """(status, payload) for one request, with FRED's 400 errors."""
+        with self._lock:
+            self.requests += 1
+        if not query.get("api_key"):
+            return 400, self._error("Variable api_key is not set.")
+        if query.get("file_type", "xml") != "json":
+            return 400, self._error("Only file_type=json is served.")
+        try:
+            payload = self.universe.observations(
+                query.get("series_id", ""),
+                limit=int(query.get("limit", 100000)),
+                offset=int(query.get("offset", 0)),
+                sort_order=query.get("sort_order", "asc"),
+                observation_start=query.get("observation_start"),
+                observation_end=query.get("observation_end"),
+                realtime_start=query.get("realtime_start"),
+                realtime_end=query.get("realtime_end"),
+            )
+        except KeyError:
+            return 400, self._error("The series does not exist.")
+        except ValueError as exc:
+            return 400, self._error(str(exc))
+        return 200, payload
+
+    @staticmethod
+    def _error(message):
+        return {"error_code": 400, "error_message": f"Bad Request.  {message}"}
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,189 @@
+"""ALFRED-style vintage store with an interval index for as-of queries.
+
+Asked for ``realtime_start=1776-07-04`` and ``realtime_end=9999-12-31``,
+FRED's ``series/observations`` endpoint returns every vintage of a series.
+Each row is one value of one observation date, plus the real-time period
+``[realtime_start, realtime_end]`` during which it was the published value.
+
+``VintageSeries`` keeps those rows as arrays sorted by the composite key
+(observation date, realtime_start). The periods of one observation date do
+not overlap. The value published on day ``t`` is therefore the last row of
+that date whose ``realtime_start`` is on or before ``t``, provided its
+``realtime_end`` is not before ``t``. One ``searchsorted`` of the keys
+(date, t) for every observation date finds all of them at once. An as-of
+query costs O(dates x log rows) and never scans the vintages.
+
+A stored series is brought up to date by asking only for the real-time
+window after its newest vintage and splicing the answer in with ``update``.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from src.data_utils.macro_series import MacroSeries, infer_frequency
+
+
+# Real-time bounds that select every vintage.
+REALTIME_START = "1776-07-04"
+REALTIME_END = "9999-12-31"
+
+# Composite key = observation day * _STRIDE + realtime_start day + _OFFSET.
+# Real-time days since 1970 lie in [-70000, 2933000], inside [-_OFFSET, _OFFSET).
+_STRIDE = 1 << 23
+_OFFSET = 1 << 22
+
+
+def _days(values):
+    return np.asarray(values, dtype="datetime64[D]").astype(np.int64)
+
+
+@dataclass(frozen=True, eq=False)
+class VintageSeries:
+    """Every published vintage of one series, indexed by (date, realtime_start)."""
+
+    series_id: str
+    dates: np.ndarray
+    realtime_start: np.ndarray
+    realtime_end: np.ndarray
+    values: np.ndarray
+    keys: np.ndarray = field(init=False, repr=False)
+    observed: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        keys = _days(self.dates) * _STRIDE + _days(self.realtime_start) + _OFFSET
+        object.__setattr__(self, "keys", keys)
+        object.__setattr__(self, "observed", np.unique(_days(self.dates)))
+
+    @classmethod
+    def from_records(cls, records, series_id=""):
+        """Parse FRED rows carrying ``realtime_start`` / ``realtime_end``.
+
+        A ``"."`` value is kept as NaN, so an observation that was missing
+        at some date reads as missing then, not as an older vintage.
+        """
+        if not records:
+            return cls.empty(series_id)
+        dates = np.array([row["date"] for row in records], dtype="datetime64[D]")
+        starts = np.array([row["realtime_start"] for row in records], dtype="datetime64[D]")
+        ends = np.array([row["realtime_end"] for row in records], dtype="datetime64[D]")
+        values = np.array(
+            [np.nan if row["value"] == "." else row["value"] for row in records],
+            dtype=np.float64,
+        )
+        order = np.lexsort((starts, dates))
+        return cls(series_id, dates[order], starts[order], ends[order], values[order])
+
+    @classmethod
+    def empty(cls, series_id=""):
+        days = np.array([], dtype="datetime64[D]")
+        return cls(series_id, days, days, days, np.array([], dtype=np.float64))
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def newest_vintage(self):
+        """Latest ``realtime_start`` of the series, or None when empty."""
+        return self.realtime_start.max() if len(self) else None
+
+    def to_state(self):
+        """JSON-serialisable columns; dates are days since 1970."""
+        return {
+            "dates": _days(self.dates),
+            "realtime_start": _days(self.realtime_start),
+            "realtime_end": _days(self.realtime_end),
+            "values": self.values,
+        }
+
+    @classmethod
+    def from_state(cls, state, series_id=""):
+        def days(name):
+            return np.asarray(state[name], dtype=np.int64).astype("datetime64[D]")
+
+        return cls(
+            series_id,
+            days("dates"),
+            days("realtime_start"),
+            days("realtime_end"),
+            np.asarray(state["values"], dtype=np.float64),
+        )
+
+    def update(self, newer, since):
+        """Splice in rows fetched for the real-time window starting at ``since``.
+
+        Stored periods are cut off the day before ``since`` and fetched ones
+        start no earlier than it, so the two never overlap. A value that
+        carries on across ``since`` is then joined back into one period.
+        """
+        since = np.datetime64(since, "D")
+        cut = since - np.timedelta64(1, "D")
+        keep = self.realtime_start <= cut
+        fresh = newer.realtime_end >= since
+        dates = np.concatenate([self.dates[keep], newer.dates[fresh]])
+        starts = np.concatenate(
+            [self.realtime_start[keep], np.maximum(newer.realtime_start[fresh], since)]
+        )
+        ends = np.concatenate([np.minimum(self.realtime_end[keep], cut), newer.realtime_end[fresh]])
+        values = np.concatenate([self.values[keep], newer.values[fresh]])
+
+        order = np.lexsort((starts, dates))
+        dates, starts, ends, values = dates[order], starts[order], ends[order], values[order]
+        same = np.r_[
+            False,
+            (dates[1:] == dates[:-1])
+            & (starts[1:] == since)
+            & (ends[:-1] == cut)
+            & ((values[1:] == values[:-1]) | (np.isnan(values[1:]) & np.isnan(values[:-1]))),
+        ]
+        # Each run of merged rows keeps its first start and its last end.
+        first = np.flatnonzero(~same)
+        last = np.r_[first[1:] - 1, len(dates) - 1]
+        return VintageSeries(self.series_id, dates[first], starts[first], ends[last], values[first])
+
+    @property
+    def vintage_dates(self):
+        """Dates on which any value of the series was published or revised."""
+        return np.unique(self.realtime_start)
+
+    def as_of(self, when):
+        """MacroSeries of the values as published on ``when``."""
+        day = _days(np.datetime64(when, "D"))
+        if not len(self.keys):
+            return MacroSeries.empty(self.series_id)
+        probes = self.observed * _STRIDE + day + _OFFSET
+        rows = np.maximum(np.searchsorted(self.keys, probes, side="right") - 1, 0)
+        live = (
+            (self.keys[rows] <= probes)
+            & (_days(self.dates[rows]) == self.observed)
+            & (_days(self.realtime_end[rows]) >= day)
+        )
+        rows = rows[live]
+        rows = rows[~np.isnan(self.values[rows])]
+        dates = self.dates[rows]
+        return MacroSeries(self.series_id, dates, self.values[rows], infer_frequency(dates))
+
+
+@dataclass(eq=False)
+class VintageStore:
+    """Vintages of several series, queried together as of one date."""
+
+    series: dict = field(default_factory=dict)
+
+    def add(self, vintages):
+        if len(vintages):
+            self.series[vintages.series_id] = vintages
+
+    def __contains__(self, series_id):
+        return series_id in self.series
+
+    def __getitem__(self, series_id):
+        return self.series[series_id]
+
+    def __len__(self):
+        return len(self.series)
+
+    def as_of(self, when, series_ids=None):
+        """``{series_id: MacroSeries}`` as published on ``when``."""
+        wanted = self.series if series_ids is None else series_ids
+        return {sid: self.series[sid].as_of(when) for sid in wanted if sid in self.series}
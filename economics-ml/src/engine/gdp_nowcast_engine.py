@@ -1,37 +1,61 @@
 import os
-import requests
 import pandas as pd
 import numpy as np
-import statsmodels.api as sm
 import xml.etree.ElementTree as ET
 import re
 from datetime import datetime
-import pytz
 import warnings
 
-import sys
-import io
-
-if sys.stdout.encoding != "utf-8":
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+from src.core import deadline
+from src.core.bootstrap_intervals import (
+    BootstrapIntervalEngine,
+    block_bootstrap_draws,
+    residual_bootstrap_draws,
+)
+from src.core.linalg_kernels import add_intercept, ols, r_squared, ridge
+from src.core.model_snapshot import frame_fingerprint, save_snapshot
+from src.core.pipeline_graph import PipelineGraph
+from src.core.runtime import ensure_utf8_stdout, fred_observations_url
+from src.core.tracing import span, traced
+from src.data_utils.http_metrics import metered_get, record_fallback
+from src.engine.gdp_nowcast_report import (
+    DEFAULT_INTERVAL_METHOD,
+    default_snapshot_path,
+    format_report,
+    fresh_result,
+    get_toronto_now,
+    load_nowcast_snapshot,
+    snapshot_kind,
+)
 
 warnings.filterwarnings("ignore")
 FRED_API_KEY = os.getenv("FRED_API_KEY")
 
+# Canada guardrail: bridge readings beyond this size are shrunk toward the anchor.
+GUARDRAIL_THRESHOLD = 0.74
+GUARDRAIL_WEIGHT = 0.6
+GUARDRAIL_ANCHOR = 0.4
+
 
-def get_toronto_now():
-    """Returns the current time in America/Toronto."""
-    tz = pytz.timezone("America/Toronto")
-    return datetime.now(tz)
+def canada_guardrail(country, values):
+    """Canada shrinkage toward 0.4% for outsized bridge readings."""
+    if country != "Canada":
+        return values
+    shrunk = values * GUARDRAIL_WEIGHT + (1 - GUARDRAIL_WEIGHT) * GUARDRAIL_ANCHOR
+    return np.where(np.abs(values) > GUARDRAIL_THRESHOLD, shrunk, values)
 
 
 class GDPCastNowEngine:
     """GDP nowcast engine for US & Canada. Bridge model + measurement signals."""
 
-    def __init__(self, country="US"):
+    def __init__(self, country="US", snapshot_path=None, snapshot_max_age=0):
         self.country = country
-        self.fred_url = "https://api.stlouisfed.org/fred/series/observations"
+        self.fred_url = fred_observations_url()
         self.now = get_toronto_now()
+        self.interval_method = DEFAULT_INTERVAL_METHOD
+        self.interval_engine = BootstrapIntervalEngine()
+        self.snapshot_path = snapshot_path or default_snapshot_path(country)
+        self.snapshot_max_age = snapshot_max_age
 
         if country == "US":
             self.gdp_id = "GDPC1"
@@ -48,47 +72,100 @@ class GDPCastNowEngine:
                 "CANPROINDMISMEI": "Industrial_Production",
                 "LRHUTTTTCAM156S": "Unemployment",
             }
+        self.pipeline = self._build_pipeline()
 
     @staticmethod
     def _ridge_calibration_adjustment(
         combined, model, current_baseline, alpha=5.0, max_abs_adjustment=0.35
     ):
-        """Post-model ridge calibration; auxiliary, bounded, and not a forecast engine."""
-        if len(combined) < 24:
-            return 0.0
+        """Post-model ridge calibration; auxiliary, bounded, and not a forecast engine.
 
-        sample = combined.tail(40).copy()
-        fitted = model.predict(sm.add_constant(sample["Factor"]))
-        x = np.column_stack([np.ones(len(fitted)), np.asarray(fitted)])
-        y = sample["GDP"].to_numpy()
+        ``model`` is the bridge coefficient vector ``[const, Factor]`` or any
+        fitted results object exposing it as ``params``.
+        """
+        beta = GDPCastNowEngine._ridge_calibration_beta(combined, model, alpha)
+        if beta is None:
+            return 0.0
 
-        penalty = np.diag([0.0, alpha])
-        beta = np.linalg.solve(x.T @ x + penalty, x.T @ y)
         calibrated = beta[0] + beta[1] * current_baseline
         adjustment = calibrated - current_baseline
         return float(np.clip(adjustment, -max_abs_adjustment, max_abs_adjustment))
 
+    @staticmethod
+    def _ridge_calibration_beta(combined, model, alpha=5.0):
+        """Ridge map from bridge fitted values to GDP over the last 40 quarters."""
+        if len(combined) < 24:
+            return None
+
+        params = np.asarray(getattr(model, "params", model), dtype=float)
+        sample = combined.tail(40)
+        fitted = add_intercept(sample["Factor"].to_numpy(dtype=float)) @ params
+        y = sample["GDP"].to_numpy(dtype=float)
+        return ridge(add_intercept(fitted), y, alpha)
+
+    @staticmethod
+    def _quarter_weights(monthly_index, quarters):
+        """Matrix averaging monthly values into the given quarter-start dates."""
+        month_q = monthly_index.to_period("Q").to_timestamp().to_numpy()
+        weights = (month_q[None, :] == pd.DatetimeIndex(quarters).to_numpy()[:, None])
+        weights = weights.astype(float)
+        counts = weights.sum(axis=1, keepdims=True)
+        counts[counts == 0] = 1.0
+        return weights / counts
+
+    @traced("simulation", "bootstrap interval")
+    def _nowcast_interval(self, X, monthly_index, combined, current_q_factor, shift):
+        """Bootstrap quantiles for the calibrated nowcast."""
+        gdp = combined["GDP"].to_numpy(dtype=float)
+        if self.interval_method == "residual":
+            factor = combined["Factor"].to_numpy(dtype=float)
+
+            def draw_fn(n, rng):
+                return residual_bootstrap_draws(factor, gdp, current_q_factor, n, rng)
+
+        else:
+            quarter_weights = self._quarter_weights(monthly_index, combined.index)
+            current_weights = np.zeros(len(monthly_index))
+            current_weights[-3:] = 1.0 / min(3, len(monthly_index))
+
+            def draw_fn(n, rng):
+                return block_bootstrap_draws(
+                    X, quarter_weights, gdp, current_weights, n, rng
+                )
+
+        def transform(values):
+            return canada_guardrail(self.country, values) + shift
+
+        try:
+            return self.interval_engine.intervals(
+                draw_fn, transform=transform, method=self.interval_method
+            )
+        except np.linalg.LinAlgError:
+            return None
+
     @staticmethod
     def _quarter_label(timestamp):
         ts = pd.Timestamp(timestamp)
         return f"{ts.year} Q{ts.quarter}"
 
     def fetch_fred(self, sid, limit=160):
-        if not FRED_API_KEY:
-            return pd.DataFrame()
+        with span("fetch", f"FRED {sid}", limit=limit):
+            if not FRED_API_KEY:
+                return pd.DataFrame()
 
-        url = f"{self.fred_url}?series_id={sid}&api_key={FRED_API_KEY}&file_type=json&sort_order=desc&limit={limit}"
-        try:
-            r = requests.get(url, timeout=10).json()
-            if "observations" not in r:
+            url = f"{self.fred_url}?series_id={sid}&api_key={FRED_API_KEY}&file_type=json&sort_order=desc&limit={limit}"
+            try:
+                r = metered_get("fred", url, timeout=10).json()
+                if "observations" not in r:
+                    return pd.DataFrame()
+                df = pd.DataFrame(r["observations"])
+                df["date"] = pd.to_datetime(df["date"])
+                df["value"] = pd.to_numeric(df["value"], errors="coerce")
+                return df[["date", "value"]].sort_values("date").set_index("date")
+            except:
                 return pd.DataFrame()
-            df = pd.DataFrame(r["observations"])
-            df["date"] = pd.to_datetime(df["date"])
-            df["value"] = pd.to_numeric(df["value"], errors="coerce")
-            return df[["date", "value"]].sort_values("date").set_index("date")
-        except:
-            return pd.DataFrame()
 
+    @traced("fetch", "RSS newsflow")
     def fetch_measurement_adjustment(self):
         """Convert recent macro newsflow into a small structured measurement signal."""
         feeds = [
@@ -102,8 +179,8 @@ class GDPCastNowEngine:
 
         try:
             for url in feeds:
-                resp = requests.get(
-                    url, timeout=10, headers={"User-Agent": "Mozilla/5.0"}
+                resp = metered_get(
+                    "rss", url, timeout=10, headers={"User-Agent": "Mozilla/5.0"}
                 )
                 root = ET.fromstring(resp.content)
                 for item in root.findall(".//item"):
@@ -179,6 +256,7 @@ class GDPCastNowEngine:
         except:
             return 0.0
 
+    @traced("fetch", "StatCan outlook")
     def fetch_statcan_outlook(self):
         """Scrapes StatCan Daily for official flash estimates/outlook (Canada Only)."""
         if self.country != "Canada":
@@ -195,7 +273,7 @@ class GDPCastNowEngine:
             url = f"{base_url}/{date_str}/dq{date_str}a-eng.htm"
 
             try:
-                resp = requests.get(url, timeout=3)
+                resp = metered_get("statcan", url, timeout=3)
                 if (
                     resp.status_code == 200
                     and "Gross domestic product by industry" in resp.text
@@ -250,10 +328,34 @@ class GDPCastNowEngine:
 
         return val, found_date
 
-    def run_nowcast(self):
+    def _fetch_inputs(self):
+        """Raw FRED frames for every indicator plus GDP, keyed by series id."""
+        raw = {sid: self.fetch_fred(sid) for sid in self.indicators}
+        raw[self.gdp_id] = self.fetch_fred(self.gdp_id)
+        return raw
+
+    def _build_pipeline(self):
+        """Fit stages as a memoised graph: a GDP-only revision reuses the factor."""
+        graph = PipelineGraph()
+        for sid in [*self.indicators, self.gdp_id]:
+            graph.input(f"raw:{sid}")
+        graph.node("panel", self._indicator_panel, [f"raw:{sid}" for sid in self.indicators])
+        graph.node("factor", self._panel_factor, ["panel"])
+        graph.node("bridge", self._bridge_regression, ["factor", f"raw:{self.gdp_id}"])
+        graph.node("calibration", self._bridge_calibration, ["bridge"])
+        graph.node("interval", self._bridge_interval, ["panel", "bridge", "calibration"])
+        graph.node(
+            "state",
+            self._fitted_state,
+            ["panel", "factor", "bridge", "calibration", "interval"],
+        )
+        return graph
+
+    @traced("transform", "indicator panel")
+    def _indicator_panel(self, *frames):
+        """Monthly growth panel with AR(1)-filled ragged edge, plus its moments."""
         m_data = {}
-        for sid, name in self.indicators.items():
-            df = self.fetch_fred(sid)
+        for (sid, name), df in zip(self.indicators.items(), frames):
             if df.empty:
                 continue
             m_data[name] = (
@@ -278,100 +380,219 @@ class GDPCastNowEngine:
                 continue
             if pd.isna(df_m[col].iloc[-1]):
                 mu, phi = series.mean(), series.autocorr()
-                df_m[col].iloc[-1] = mu + phi * (series.iloc[-1] - mu)
+                df_m.loc[df_m.index[-1], col] = mu + phi * (series.iloc[-1] - mu)
+
+        moments_mu = df_m.mean()
+        moments_sd = df_m.std()
+        df_std = (df_m - moments_mu) / moments_sd
+        return {
+            "columns": list(m_data.keys()),
+            "index": df_m.index,
+            "mean": moments_mu,
+            "std": moments_sd,
+            "X": df_std.ffill().bfill().values,
+        }
 
-        df_std = (df_m - df_m.mean()) / df_m.std()
-        X = df_std.ffill().bfill().values
-        U, S, Vt = np.linalg.svd(X, full_matrices=False)
-        df_m["Factor"] = U[:, 0] * S[0]
+    @staticmethod
+    @traced("factor", "principal component")
+    def _panel_factor(panel):
+        U, S, Vt = np.linalg.svd(panel["X"], full_matrices=False)
+        return {
+            "factor": pd.Series(U[:, 0] * S[0], index=panel["index"]),
+            "loadings": Vt[0],
+        }
 
-        gdp_raw = self.fetch_fred(self.gdp_id)
+    @traced("regression", "bridge OLS")
+    def _bridge_regression(self, factor, gdp_raw):
         if gdp_raw.empty:
             raise RuntimeError("Insufficient FRED GDP data. Set FRED_API_KEY and retry.")
 
+        factor_m = factor["factor"]
         gdp_growth = (np.log(gdp_raw["value"]).diff() * 100).dropna()
-        q_factor = df_m["Factor"].resample("QS").mean()
+        q_factor = factor_m.resample("QS").mean()
         combined = pd.concat([gdp_growth, q_factor], axis=1).dropna()
         combined.columns = ["GDP", "Factor"]
 
-        model = sm.OLS(combined["GDP"], sm.add_constant(combined["Factor"])).fit()
+        x_bridge = add_intercept(combined["Factor"].to_numpy(dtype=float))
+        y_bridge = combined["GDP"].to_numpy(dtype=float)
+        params = ols(x_bridge, y_bridge)
 
-        current_q_factor = (
-            df_m["Factor"].rolling(window=3).mean().resample("QS").last().iloc[-1]
-        )
-        quant_val = model.params["const"] + model.params["Factor"] * current_q_factor
+        current_q_factor = factor_m.rolling(window=3).mean().resample("QS").last().iloc[-1]
+        quant_val = params[0] + params[1] * current_q_factor
+        return {
+            "combined": combined,
+            "params": params,
+            "current_factor": current_q_factor,
+            "quant_val": float(canada_guardrail(self.country, quant_val)),
+            "r2": r_squared(y_bridge, x_bridge @ params),
+        }
 
-        if self.country == "Canada" and abs(quant_val) > 0.74:
-            quant_val = quant_val * 0.6 + 0.4 * 0.4
+    @traced("calibration", "ridge calibration")
+    def _bridge_calibration(self, bridge):
+        combined, params = bridge["combined"], bridge["params"]
+        return {
+            "ridge_beta": self._ridge_calibration_beta(combined, params),
+            "adjustment": self._ridge_calibration_adjustment(
+                combined, params, bridge["quant_val"]
+            ),
+        }
 
-        measurement_adjustment = self.fetch_measurement_adjustment()
-        ml_calibration_adjustment = self._ridge_calibration_adjustment(
-            combined, model, quant_val
+    def _bridge_interval(self, panel, bridge, calibration):
+        return self._nowcast_interval(
+            panel["X"],
+            panel["index"],
+            bridge["combined"],
+            bridge["current_factor"],
+            shift=calibration["adjustment"],
         )
 
-        statcan_outlook = None
-        statcan_date = None
-        if self.country == "Canada":
-            outlook_val, s_date = self.fetch_statcan_outlook()
-            if outlook_val is not None:
-                statcan_outlook = outlook_val * 100
-                statcan_date = s_date
-                diff = statcan_outlook - quant_val
-                measurement_adjustment += diff * 0.8
-
-        final_prediction = quant_val + measurement_adjustment
-        calibrated_prediction = final_prediction + ml_calibration_adjustment
-
-        data_thru = df_m.index[-1]
-
+    def _fitted_state(self, panel, factor, bridge, calibration, interval):
+        data_thru = panel["index"][-1]
+        ridge_beta = calibration["ridge_beta"]
         return {
-            "quant_val": quant_val,
-            "measurement_adjustment": measurement_adjustment,
-            "ml_calibration_adjustment": ml_calibration_adjustment,
-            "final_val": final_prediction,
-            "calibrated_val": calibrated_prediction,
-            "r2": model.rsquared,
+            "columns": panel["columns"],
+            "mean": panel["mean"].tolist(),
+            "std": panel["std"].tolist(),
+            "loadings": factor["loadings"].tolist(),
+            "params": bridge["params"].tolist(),
+            "ridge_beta": None if ridge_beta is None else ridge_beta.tolist(),
+            "current_factor": float(bridge["current_factor"]),
+            "quant_val": bridge["quant_val"],
+            "ml_calibration_adjustment": calibration["adjustment"],
+            "r2": bridge["r2"],
             "data_thru": data_thru.strftime("%Y-%m"),
             "target_q": self._quarter_label(data_thru),
-            "statcan_outlook": statcan_outlook,
-            "statcan_date": statcan_date,
+            "interval": interval,
         }
 
+    def _fit_bridge(self, raw):
+        """Factor extraction, bridge OLS, ridge calibration and bootstrap interval.
 
-def format_report(country, res):
-    now_str = get_toronto_now().strftime("%Y-%m-%d %H:%M")
+        Returns the JSON-serialisable fitted state stored in model snapshots.
+        Stages whose inputs are unchanged since the last fit are reused.
+        """
+        inputs = {
+            f"raw:{sid}": raw.get(sid, pd.DataFrame())
+            for sid in [*self.indicators, self.gdp_id]
+        }
+        return self.pipeline.run(inputs, targets=["state"])["state"]
+
+    def _snapshot_fingerprints(self, raw):
+        return {sid: frame_fingerprint(df) for sid, df in sorted(raw.items())}
 
-    extra_section = ""
-    if country == "Canada" and res.get("statcan_outlook") is not None:
-        extra_section = f"\n- **🇨🇦 StatCan Official Outlook**: `{res['statcan_outlook']:.2f}%` (Released on {res['statcan_date']})"
+    def _load_fitted_state(self, raw, fingerprints):
+        """Reuse the snapshot when every input fingerprint matches, else refit."""
+        snapshot = self._load_snapshot()
+        if snapshot and snapshot["fingerprints"] == fingerprints:
+            return snapshot["state"], "fingerprint match"
+        return self._fit_bridge(raw), "refit"
 
-    return f"""
-# GDPCastNow | Real GDP Forecast ({country})
+    def _snapshot_kind(self):
+        return snapshot_kind(self.country, self.interval_method)
 
-**Generated At**: {now_str} (Toronto Time)
-**Target Quarter**: {res["target_q"]} Real GDP Growth (Q/Q)
+    def _load_snapshot(self):
+        return load_nowcast_snapshot(self.snapshot_path, self._snapshot_kind())
 
----
+    @staticmethod
+    def _shift_interval(interval, delta):
+        if not interval:
+            return interval
+        shifted = dict(interval)
+        shifted["quantiles"] = {
+            level: value + delta for level, value in interval["quantiles"].items()
+        }
+        shifted["lower"] = interval["lower"] + delta
+        shifted["upper"] = interval["upper"] + delta
+        return shifted
+
+    def run_nowcast(self, max_age=None):
+        """Bridge nowcast plus live measurement signals.
+
+        The fitted bridge is restored from the model snapshot when the raw
+        inputs are unchanged. With ``max_age`` (seconds), a snapshot younger
+        than that is answered directly without touching the network.
+        """
+        if max_age is None:
+            max_age = self.snapshot_max_age
+
+        result = fresh_result(self.snapshot_path, self._snapshot_kind(), max_age)
+        if result is not None:
+            return result
+        return self._nowcast(self._live_inputs())
+
+    def _live_inputs(self):
+        """FRED frames plus the live measurement signals behind one nowcast.
+
+        The optional signals are fetched concurrently with FRED. Under a run
+        deadline, a signal that is not back in time is skipped and listed.
+        """
+        optional = {"newsflow": self.fetch_measurement_adjustment}
+        if self.country == "Canada":
+            optional["statcan_outlook"] = self.fetch_statcan_outlook
+        pending = deadline.schedule(optional)
+        raw = self._fetch_inputs()
+        signals, skipped = pending.collect(
+            {"newsflow": 0.0, "statcan_outlook": (None, None)}
+        )
+        for name in skipped:
+            record_fallback(self.country, name)
+
+        live = {
+            "raw": raw,
+            "measurement_adjustment": signals["newsflow"],
+            "statcan_outlook": None,
+            "statcan_date": None,
+            "skipped": skipped,
+        }
+        outlook_val, s_date = signals.get("statcan_outlook", (None, None))
+        if outlook_val is not None:
+            live["statcan_outlook"] = outlook_val * 100
+            live["statcan_date"] = s_date
+        return live
+
+    def _nowcast(self, live):
+        raw = live["raw"]
+        fingerprints = self._snapshot_fingerprints(raw)
+        state, status = self._load_fitted_state(raw, fingerprints)
+        quant_val = state["quant_val"]
+        ml_calibration_adjustment = state["ml_calibration_adjustment"]
+
+        measurement_adjustment = live["measurement_adjustment"]
+        statcan_outlook = live["statcan_outlook"]
+        if statcan_outlook is not None:
+            diff = statcan_outlook - quant_val
+            measurement_adjustment += diff * 0.8
 
-### Core Forecast Data
-- **Quant Baseline Nowcast**: `{res["quant_val"]:.2f}%`
-- **Measurement Adjustment**: `{res["measurement_adjustment"]:+.2f}%` (newsflow + official outlook parsed into structured variables){extra_section}
-- **Structural + Measurement Nowcast**: **{res["final_val"]:.2f}%**
-- **ML Auxiliary Calibration**: `{res["ml_calibration_adjustment"]:+.2f}%` (bounded ridge post-calibration; ML is auxiliary calibration, not the main predictor)
-- **Final Calibrated Nowcast**: **{res["calibrated_val"]:.2f}%**
-- **Model Confidence (R²)**: {res["r2"]:.2f}
+        final_prediction = quant_val + measurement_adjustment
+        calibrated_prediction = final_prediction + ml_calibration_adjustment
 
-### Runtime Status
-- **Data Through**: {res["data_thru"]}
-- **Sources**: FRED API, StatCan, BEA, Investing RSS
-- **Methodology**: Bridge Equation (SVD Factor Extraction) + measurement layer + auxiliary ridge calibration
+        result = {
+            "quant_val": quant_val,
+            "measurement_adjustment": measurement_adjustment,
+            "ml_calibration_adjustment": ml_calibration_adjustment,
+            "final_val": final_prediction,
+            "calibrated_val": calibrated_prediction,
+            "r2": state["r2"],
+            "data_thru": state["data_thru"],
+            "target_q": state["target_q"],
+            "statcan_outlook": statcan_outlook,
+            "statcan_date": live["statcan_date"],
+            "interval": self._shift_interval(state["interval"], measurement_adjustment),
+            "interval_method": self.interval_method,
+            "skipped": live.get("skipped", []),
+        }
 
----
-*Generated by GDPCastNow-skill v1.1*
-"""
+        # One write per run, skipped when a matching snapshot already holds this result.
+        if self.snapshot_path and state.get("live") != result:
+            state = dict(state)
+            state["live"] = result
+            save_snapshot(self.snapshot_path, self._snapshot_kind(), fingerprints, state)
+        result["snapshot_status"] = status
+        return result
 
 
 if __name__ == "__main__":
+    ensure_utf8_stdout()
     for c in ["US", "Canada"]:
         engine = GDPCastNowEngine(c)
         res = engine.run_nowcast()
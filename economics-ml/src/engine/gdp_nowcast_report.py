@@ -0,0 +1,119 @@
+"""GDP nowcast report and model-snapshot lookup, free of the modelling stack.
+
+A nowcast answered from a fresh snapshot needs only the stored result and the
+report template. Both live here, importing neither pandas nor requests, so
+``main.py gdp --max-age`` loads ``gdp_nowcast_engine`` only when it has to refit
+or refresh the live signals.
+"""
+
+import os
+from datetime import datetime
+
+from src.core.model_snapshot import load_snapshot, snapshot_age
+from src.core.runtime import cache_dir
+from src.core.tracing import traced
+
+# Report labels of the optional measurement sources.
+OPTIONAL_SOURCES = {
+    "newsflow": "RSS newsflow",
+    "statcan_outlook": "StatCan outlook",
+}
+
+DEFAULT_INTERVAL_METHOD = "block"
+
+
+def get_toronto_now():
+    """Returns the current time in America/Toronto."""
+    import pytz
+
+    tz = pytz.timezone("America/Toronto")
+    return datetime.now(tz)
+
+
+def default_snapshot_path(country):
+    """Default model-snapshot file of a country's nowcast."""
+    return os.path.join(cache_dir("snapshots"), f"gdp_nowcast_{country.lower()}.json")
+
+
+def snapshot_kind(country, interval_method=DEFAULT_INTERVAL_METHOD):
+    return f"gdp_nowcast:{country}:{interval_method}"
+
+
+def load_nowcast_snapshot(path, kind):
+    """Snapshot payload with interval quantile levels as floats again.
+
+    JSON object keys are strings, so ``{0.5: ...}`` is stored as ``{"0.5": ...}``.
+    """
+    snapshot = load_snapshot(path, kind)
+    if not snapshot:
+        return snapshot
+    state = snapshot["state"]
+    for holder in (state, state.get("live") or {}):
+        interval = holder.get("interval")
+        if interval:
+            interval["quantiles"] = {
+                float(level): value for level, value in interval["quantiles"].items()
+            }
+    return snapshot
+
+
+def fresh_result(path, kind, max_age):
+    """The stored nowcast if its snapshot is younger than ``max_age`` seconds, else None."""
+    if not max_age or max_age <= 0:
+        return None
+    snapshot = load_nowcast_snapshot(path, kind)
+    if not snapshot or snapshot_age(snapshot) > max_age or "live" not in snapshot["state"]:
+        return None
+    result = dict(snapshot["state"]["live"])
+    result["snapshot_status"] = "fresh snapshot"
+    return result
+
+
+@traced("report", "nowcast report")
+def format_report(country, res):
+    now_str = get_toronto_now().strftime("%Y-%m-%d %H:%M")
+
+    extra_section = ""
+    interval_line = ""
+    interval = res.get("interval")
+    if interval:
+        interval_line = f"\n- **Bootstrap {interval['coverage']:.0%} Interval**: `[{interval['lower']:.2f}%, {interval['upper']:.2f}%]` ({interval['method']} bootstrap, {interval['n_draws']} draws)"
+
+    interval_method = res.get("interval_method", DEFAULT_INTERVAL_METHOD)
+
+    snapshot_line = ""
+    if res.get("snapshot_status"):
+        snapshot_line = f"\n- **Model State**: {res['snapshot_status']}"
+
+    skipped_line = ""
+    if res.get("skipped"):
+        names = ", ".join(OPTIONAL_SOURCES.get(name, name) for name in res["skipped"])
+        skipped_line = f"\n- **Skipped Adjustments**: {names} (not back within the run deadline; left out of the measurement adjustment)"
+
+    if country == "Canada" and res.get("statcan_outlook") is not None:
+        extra_section = f"\n- **🇨🇦 StatCan Official Outlook**: `{res['statcan_outlook']:.2f}%` (Released on {res['statcan_date']})"
+
+    return f"""
+# GDPCastNow | Real GDP Forecast ({country})
+
+**Generated At**: {now_str} (Toronto Time)
+**Target Quarter**: {res["target_q"]} Real GDP Growth (Q/Q)
+
+---
+
+### Core Forecast Data
+- **Quant Baseline Nowcast**: `{res["quant_val"]:.2f}%`
+- **Measurement Adjustment**: `{res["measurement_adjustment"]:+.2f}%` (newsflow + official outlook parsed into structured variables){extra_section}{skipped_line}
+- **Structural + Measurement Nowcast**: **{res["final_val"]:.2f}%**
+- **ML Auxiliary Calibration**: `{res["ml_calibration_adjustment"]:+.2f}%` (bounded ridge post-calibration; ML is auxiliary calibration, not the main predictor)
+- **Final Calibrated Nowcast**: **{res["calibrated_val"]:.2f}%**{interval_line}
+- **Model Confidence (R²)**: {res["r2"]:.2f}
+
+### Runtime Status
+- **Data Through**: {res["data_thru"]}{snapshot_line}
+- **Sources**: FRED API, StatCan, BEA, Investing RSS
+- **Methodology**: Bridge Equation (SVD Factor Extraction) + measurement layer + auxiliary ridge calibration + {interval_method} bootstrap intervals
+
+---
+*Generated by GDPCastNow-skill v1.1*
+"""
@@ -1,29 +1,56 @@
-from statsmodels.tsa.filters.hp_filter import hpfilter
+import dataclasses
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from src.data_utils.macro_data_fetcher import MacroDataFetcher
+from src.data_utils.http_metrics import record_fallback
+from src.data_utils.macro_series import MacroSeries
+from src.data_utils.series_cache import SharedSeriesCache
+from src.core import deadline
+from src.core.linalg_kernels import add_intercept, ols
 from src.core.modeling_core import PolicyOracle
+from src.core.output_gap import GAP_NAMES, OutputGapEnsemble
+from src.core.pipeline_graph import PipelineGraph
+from src.core.policy_results import CentralBankSpec, PolicyAnalysis, PolicyInputs
+from src.core.rolling_enhancement import enhanced_rate_history
+from src.core.policy_simulation import PolicyRateSimulator, summarize_position
+from src.core.tracing import propagate, span, traced
+from src.core.taylor_history import TaylorPathGenerator, TaylorPathPanel, deviation_stats
 from src.core.visual_oracle import plot_taylor_sensitivity
 import os
+import threading
 
 
 class PolicyRateEngine:
     def __init__(self):
-        self.fetcher = MacroDataFetcher()
+        # One shared, single-flight fetch layer for every analysis this engine runs.
+        self.fetcher = SharedSeriesCache(MacroDataFetcher())
         self.engine = PolicyOracle()
+        # Seeded so unchanged inputs give the same report and cached chart.
+        self.simulator = PolicyRateSimulator(seed=0)
+        # Uncertainty around each point input, in percentage points.
+        self.simulation_sd = {"inflation": 0.2, "output_gap": 0.5}
+        # Counterfactual rule paths per country, extended as new months arrive.
+        self.taylor_paths = {}
+        # Months in the rolling enhancement fit; None uses an expanding window.
+        self.enhancement_window = None
+        # Output-gap estimators, cached per data vintage.
+        self.gap_ensemble = OutputGapEnsemble()
+        # Memoised analysis stage graph per country.
+        self._pipelines = {}
+        self._pipelines_lock = threading.Lock()
 
     @staticmethod
     def _latest_percent_observation(data, fallback):
         """Return the latest observation when a source is already a percent rate."""
-        if isinstance(data, list) and data:
-            try:
-                return float(data[0]["value"])
-            except (KeyError, TypeError, ValueError):
-                return fallback
-        return fallback
+        return PolicyRateEngine._latest_float(data, fallback)
 
     @staticmethod
     def _latest_float(data, fallback=0.0):
+        """Newest value of a MacroSeries or of FRED records (newest first)."""
+        if isinstance(data, MacroSeries):
+            return data.latest(fallback)
         if isinstance(data, list) and data:
             try:
                 return float(data[0]["value"])
@@ -33,6 +60,8 @@ class PolicyRateEngine:
 
     @staticmethod
     def _recent_change(data, fallback=0.0, periods=3):
+        if isinstance(data, MacroSeries):
+            return data.change(periods, fallback)
         if isinstance(data, list) and len(data) > periods:
             try:
                 return float(data[0]["value"]) - float(data[periods]["value"])
@@ -42,63 +71,72 @@ class PolicyRateEngine:
 
     @staticmethod
     def _records_to_series(data):
-        if not isinstance(data, list) or not data:
-            return pd.Series(dtype=float)
-        rows = []
-        for row in data:
-            try:
-                rows.append((pd.Timestamp(row["date"]), float(row["value"])))
-            except (KeyError, TypeError, ValueError):
-                continue
-        if not rows:
-            return pd.Series(dtype=float)
-        series = pd.Series(dict(rows)).sort_index()
-        return series[~series.index.duplicated(keep="last")]
+        """Dated ``pd.Series`` from a MacroSeries or from FRED records."""
+        if not isinstance(data, MacroSeries):
+            data = MacroSeries.from_records(data)
+        if not len(data):
+            return pd.Series(dtype=float, index=pd.DatetimeIndex([]))
+        return data.to_pandas()
+
+    def _fetch_series(self, series_id, limit):
+        """One FRED series as a MacroSeries; any fetcher with ``fetch_fred_series`` works."""
+        return MacroSeries.from_records(
+            self.fetcher.fetch_fred_series(series_id, limit=limit), series_id
+        )
+
+    # Raw monthly-history inputs per country: name -> (FRED series, limit).
+    HISTORY_SERIES = {
+        "US": {
+            "actual": ("IRSTCI01USM156N", 220),
+            "price": ("PCEPILFE", 220),
+            "unrate": ("UNRATE", 220),
+            "nrou": ("NROU", 80),
+            "financial": ("NFCI", 220),
+            "labor": ("ICSA", 1000),
+        },
+        "Canada": {
+            "actual": ("IRSTCI01CAM156N", 220),
+            "price": ("CPALTT01CAM659N", 220),
+            "unrate": ("LRHUTTTTCAM156S", 220),
+            "cad": ("DEXCAUS", 1000),
+            "oil": ("DCOILWTICO", 1000),
+        },
+    }
+
+    def _fetch_history_series(self, country):
+        """Fetch the raw histories behind the calibration inputs as dated series."""
+        return {
+            name: self._fetch_series(series_id, limit).to_pandas()
+            for name, (series_id, limit) in self.HISTORY_SERIES[country].items()
+        }
+
+    def _policy_history_inputs(self, country, r_star_real_mid, raw=None):
+        """Monthly rule inputs and enhancement features over the fetched history.
 
-    def _build_policy_calibration_frame(self, country, r_star_real_mid):
+        ``raw`` takes pre-fetched (e.g. as-of filtered) series keyed like
+        ``HISTORY_SERIES``; by default they are fetched.
+        """
         def monthly(series):
             if series.empty:
                 return series
             return series.resample("MS").mean().ffill()
 
+        if raw is None:
+            raw = self._fetch_history_series(country)
+
+        actual = monthly(raw["actual"])
+        price = monthly(raw["price"])
+        unrate = monthly(raw["unrate"])
         if country == "US":
-            actual = monthly(self._records_to_series(
-                self.fetcher.fetch_fred_series("IRSTCI01USM156N", limit=220)
-            ))
-            price = monthly(self._records_to_series(
-                self.fetcher.fetch_fred_series("PCEPILFE", limit=220)
-            ))
-            unrate = monthly(self._records_to_series(
-                self.fetcher.fetch_fred_series("UNRATE", limit=220)
-            ))
-            nrou = monthly(self._records_to_series(
-                self.fetcher.fetch_fred_series("NROU", limit=80)
-            ))
-            financial = monthly(self._records_to_series(
-                self.fetcher.fetch_fred_series("NFCI", limit=220)
-            ))
-            labor = self._records_to_series(
-                self.fetcher.fetch_fred_series("ICSA", limit=1000)
-            ).resample("MS").mean()
+            nrou = monthly(raw["nrou"])
+            financial = monthly(raw["financial"])
+            labor = raw["labor"].resample("MS").mean()
             external = pd.Series(0.0, index=actual.index)
         else:
-            actual = monthly(self._records_to_series(
-                self.fetcher.fetch_fred_series("IRSTCI01CAM156N", limit=220)
-            ))
-            price = monthly(self._records_to_series(
-                self.fetcher.fetch_fred_series("CPALTT01CAM659N", limit=220)
-            ))
-            unrate = monthly(self._records_to_series(
-                self.fetcher.fetch_fred_series("LRHUTTTTCAM156S", limit=220)
-            ))
             nrou = unrate.rolling(60, min_periods=24).mean()
             financial = pd.Series(0.0, index=actual.index)
-            cad = self._records_to_series(
-                self.fetcher.fetch_fred_series("DEXCAUS", limit=1000)
-            ).resample("MS").mean()
-            oil = self._records_to_series(
-                self.fetcher.fetch_fred_series("DCOILWTICO", limit=1000)
-            ).resample("MS").mean()
+            cad = raw["cad"].resample("MS").mean()
+            oil = raw["oil"].resample("MS").mean()
             external = cad.pct_change(3) * 100 + oil.pct_change(3) * 10
 
         if country == "US":
@@ -107,24 +145,49 @@ class PolicyRateEngine:
             inflation = price
 
         output_gap = -2.0 * (unrate - nrou.ffill())
-        inflation_gap = inflation - 2.0
-        adjusted_gap = pd.Series(
-            np.where(inflation > 2.5, inflation_gap * 1.5, inflation_gap),
-            index=inflation.index,
-        )
-        base_rate = r_star_real_mid + inflation + 0.5 * adjusted_gap + output_gap
+        if country == "US":
+            labor_cooling = labor.pct_change(12).mul(100)
+        else:
+            labor_cooling = pd.Series(0.0, index=actual.index)
 
-        frame = pd.concat(
+        inputs = pd.concat(
             [
                 actual.rename("actual_rate"),
-                base_rate.rename("base_rate"),
-                output_gap.rename("activity_gap"),
-                (inflation - 2.0).rename("inflation_pressure"),
-                financial.rename("financial_conditions"),
+                inflation.rename("inflation"),
+                output_gap.rename("output_gap"),
+                financial.rename("financial_stress"),
                 external.rename("external_pressure"),
-                labor.pct_change(12).mul(100).rename("labor_cooling")
-                if country == "US"
-                else pd.Series(0.0, index=actual.index).rename("labor_cooling"),
+                labor_cooling.rename("labor_cooling"),
+            ],
+            axis=1,
+            sort=True,
+        )
+        inputs.insert(0, "r_star", float(r_star_real_mid))
+        return inputs
+
+    def _taylor_history(self, country, inputs):
+        """Update and return the cached counterfactual rule panel for a country."""
+        if country not in self.taylor_paths:
+            self.taylor_paths[country] = TaylorPathPanel(
+                TaylorPathGenerator(self.engine.models)
+            )
+        return self.taylor_paths[country].update(inputs)
+
+    @traced("transform", "calibration frame")
+    def _build_policy_calibration_frame(self, country, r_star_real_mid, inputs=None):
+        if inputs is None:
+            inputs = self._policy_history_inputs(country, r_star_real_mid)
+        history = self._taylor_history(country, inputs)
+
+        frame = pd.concat(
+            [
+                inputs["actual_rate"],
+                history["nonlinear"].rename("base_rate"),
+                inputs["output_gap"].rename("activity_gap"),
+                (inputs["inflation"] - 2.0).rename("inflation_pressure"),
+                inputs["financial_stress"].rename("financial_conditions"),
+                inputs["external_pressure"],
+                inputs["labor_cooling"],
             ],
             axis=1,
         ).dropna()
@@ -141,6 +204,7 @@ class PolicyRateEngine:
         ]
 
     @staticmethod
+    @traced("calibration", "data-enhanced rule")
     def _data_enhanced_taylor_rate(
         base_rate,
         current_features,
@@ -159,8 +223,7 @@ class PolicyRateEngine:
         sd = x_hist.std(axis=0)
         sd[sd == 0] = 1.0
         x_std = (x_hist - mu) / sd
-        x = np.column_stack([np.ones(len(x_std)), x_std])
-        beta = np.linalg.pinv(x) @ y_hist
+        beta = ols(add_intercept(x_std), y_hist)
 
         current = np.array(
             [float(current_features.get(col, 0.0)) for col in feature_cols],
@@ -185,239 +248,478 @@ class PolicyRateEngine:
         contributions["n"] = float(len(sample))
         return base_rate + total, contributions
 
-    def generate_analysis(self, country="US"):
-        """Run full pipeline: fetch -> model -> visualize -> report."""
-        print(f"--- Initiating Oracle Sequence for {country} ---")
+    @staticmethod
+    def _enhanced_track_record(enhanced_history, calibration_frame):
+        """Mean absolute miss of the real-time enhanced and base rates, in bps."""
+        if enhanced_history.empty:
+            return None
+        actual = enhanced_history["base_rate"] + calibration_frame[
+            "target_adjustment"
+        ].reindex(enhanced_history.index)
+        return {
+            "since": enhanced_history.index[0],
+            "n": int(len(enhanced_history)),
+            "base_mae_bps": float((actual - enhanced_history["base_rate"]).abs().mean() * 100),
+            "enhanced_mae_bps": float(
+                (actual - enhanced_history["enhanced_rate"]).abs().mean() * 100
+            ),
+        }
 
-        if country == "US":
-            print("   > Fetching BLS & FRED data...")
-            unrate_data = self.fetcher.fetch_bls_unemployment()
-            pce_data = self.fetcher.fetch_fred_series("PCEPILFE", limit=20)
-            dff_data = self.fetcher.fetch_fred_series("DFF", limit=5)
-
-            gdp_real_long = self.fetcher.fetch_fred_series("GDPC1", limit=100)
-            cap_util = self.fetcher.fetch_fred_series("TCU", limit=240)
-            nrou_data = self.fetcher.fetch_fred_series("NROU", limit=5)
-            nfci_data = self.fetcher.fetch_fred_series("NFCI", limit=5)
-            claims_data = self.fetcher.fetch_fred_series("ICSA", limit=20)
-
-            u_actual = 4.4
-            if isinstance(unrate_data, dict):
-                try:
-                    u_actual = float(unrate_data["value"])
-                except:
-                    pass
-
-            current_pi = 2.8
-            if len(pce_data) >= 13:
-                latest = float(pce_data[0]["value"])
-                year_ago = float(pce_data[12]["value"])
-                current_pi = (latest / year_ago - 1) * 100
-
-            actual_rate = 3.64
-            if len(dff_data) > 0:
-                actual_rate = float(dff_data[0]["value"])
-
-            u_star = 4.2
-            if nrou_data and len(nrou_data) > 0:
-                u_star = float(nrou_data[0]["value"])
-            gap_okun = -2.0 * (u_actual - u_star)
-
-            gap_hp = -0.5
-            if gdp_real_long and len(gdp_real_long) > 20:
-                try:
-                    data_list = [
-                        {"date": x["date"], "value": float(x["value"])}
-                        for x in gdp_real_long
-                    ]
-                    df_gdp = pd.DataFrame(data_list).sort_values("date")
-                    df_gdp["log_gdp"] = np.log(df_gdp["value"])
-                    cycle, trend = hpfilter(df_gdp["log_gdp"], lamb=1600)
-                    gap_hp = cycle.iloc[-1] * 100
-                except Exception as e:
-                    print(f"   > HP Filter Error: {e}")
-
-            gap_cap = -0.3
-            if cap_util and len(cap_util) > 120:
-                try:
-                    curr_cap = float(cap_util[0]["value"])
-                    vals = [float(x["value"]) for x in cap_util if x["value"] != "."]
-                    avg_cap = sum(vals) / len(vals)
-                    gap_cap = curr_cap - avg_cap
-                except:
-                    pass
-
-            print(
-                f"   > Gaps Calculated: Okun={gap_okun:.2f}%, HP_Filter={gap_hp:.2f}%, CapUtil={gap_cap:.2f}%"
-            )
+    @traced("simulation", "policy Monte Carlo")
+    def _simulate_policy_distribution(
+        self, r_star_real_range, current_pi, gap_estimates, threshold
+    ):
+        """Monte Carlo rate distribution over r*, inflation and gap uncertainty."""
+        gap_sd = self.simulation_sd["output_gap"]
+        return self.simulator.simulate(
+            r_star=("uniform", r_star_real_range[0], r_star_real_range[1]),
+            pi=("normal", current_pi, self.simulation_sd["inflation"]),
+            gaps={name: ("normal", gap, gap_sd) for name, gap in gap_estimates.items()},
+            threshold=threshold,
+            stress_multiplier=1.5,
+        )
 
-            sep_long = self.fetcher.fetch_fred_series("FEDTARGLMD", limit=5)
-            r_star_nominal_mid = 2.6
-            if sep_long and len(sep_long) > 0:
-                try:
-                    r_star_nominal_mid = float(sep_long[0]["value"])
-                except:
-                    pass
+    # Inputs of each central bank; a new bank is a new entry, not a new branch.
+    CENTRAL_BANKS = {
+        "US": CentralBankSpec(
+            country="US",
+            title="Federal Reserve (US)",
+            gap_source="HP Filter / Okun's Law estimate",
+            policy_rate="DFF",
+            inflation=("yoy_index", "PCEPILFE"),
+            unemployment="BLS",
+            unemployment_history="UNRATE",
+            natural_rate=("series", "NROU"),
+            gdp="GDPC1",
+            capacity="TCU",
+            r_star=("series", "FEDTARGLMD", 0.3),
+            financial="NFCI",
+            claims="ICSA",
+            fallbacks={
+                "policy_rate": 3.64,
+                "inflation": 2.8,
+                "unemployment": 4.4,
+                "natural_rate": 4.2,
+                "hp": -0.5,
+                "caputil": -0.3,
+                "r_star_nominal": 2.6,
+            },
+            show_unemployment=True,
+        ),
+        "Canada": CentralBankSpec(
+            country="Canada",
+            title="Bank of Canada",
+            gap_source="BoC Extended Filter proxy",
+            policy_rate="BOC",
+            inflation=("percent", "CPALTT01CAM659N"),
+            unemployment="LRHUTTTTCAM156S",
+            natural_rate=("mean", "LRHUTTTTCAM156S", 120),
+            gdp="NGDPRSAXDCCAQ",
+            capacity="BSCACP02CAM659S",
+            r_star=("boc",),
+            external=(("DEXCAUS", 10.0), ("DCOILWTICO", 0.1)),
+            fallbacks={
+                "policy_rate": 2.25,
+                "inflation": 2.4,
+                "unemployment": 6.8,
+                "natural_rate": 6.2,
+                "hp": -1.0,
+                "caputil": -0.5,
+                "neutral_rate": [2.25, 3.25],
+            },
+        ),
+    }
+
+    # Report labels of the scraped inputs that a run deadline may skip.
+    OPTIONAL_SOURCES = {
+        "boc": "Bank of Canada rates",
+        "bls_unemployment": "BLS unemployment",
+    }
+
+    GAP_SCENARIOS = (
+        ("okun", "Labor Model (Okun: {:.1f}%)"),
+        ("hp", "Statistical Trend (HP Filter: {:.1f}%)"),
+        ("caputil", "Industrial Model (CapUtil: {:.1f}%)"),
+    )
+
+    def _spec(self, country):
+        if country not in self.CENTRAL_BANKS:
+            raise ValueError(f"Unknown central bank: {country}")
+        return self.CENTRAL_BANKS[country]
 
-            r_star_real_mid = r_star_nominal_mid - 2.0
-            r_star_real_range = [r_star_real_mid - 0.3, r_star_real_mid + 0.3]
+    @staticmethod
+    def _input_series(spec):
+        """FRED series behind the point inputs: role -> (series id, limit)."""
+        series = {
+            "inflation": (spec.inflation[1], 20),
+            "gdp": (spec.gdp, 100),
+            "capacity": (spec.capacity, 240),
+        }
+        if spec.policy_rate != "BOC":
+            series["policy_rate"] = (spec.policy_rate, 5)
+        if spec.unemployment != "BLS":
+            series["unemployment"] = (spec.unemployment, 5)
+        series["unemployment_history"] = (
+            spec.unemployment_history or spec.unemployment,
+            220,
+        )
+        if spec.natural_rate[0] == "mean":
+            series["natural_rate"] = (spec.natural_rate[1], spec.natural_rate[2])
+        else:
+            series["natural_rate"] = (spec.natural_rate[1], 80)
+        if spec.r_star[0] == "series":
+            series["r_star"] = (spec.r_star[1], 5)
+        if spec.financial:
+            series["financial"] = (spec.financial, 5)
+        if spec.claims:
+            series["claims"] = (spec.claims, 20)
+        for series_id, _scale in spec.external:
+            series[f"external:{series_id}"] = (series_id, 20)
+        return series
+
+    def _fetch_plan(self, countries):
+        """Largest limit needed per FRED series across the given countries."""
+        plan = {}
+        for country in countries:
+            requests = list(self._input_series(self._spec(country)).values())
+            requests += list(self.HISTORY_SERIES.get(country, {}).values())
+            for series_id, limit in requests:
+                plan[series_id] = max(limit, plan.get(series_id, 0))
+        return plan
+
+    @traced("fetch", "prefetch")
+    def _prefetch(self, countries):
+        prefetch = getattr(self.fetcher, "prefetch", None)
+        if prefetch is not None:
+            prefetch(self._fetch_plan(countries))
+
+    @traced("transform", "policy inputs")
+    def _collect_inputs(self, spec):
+        """Fetch the latest point inputs of one central bank, with fallbacks."""
+        fallbacks = spec.fallbacks
+        optional = {}
+        if spec.policy_rate == "BOC" or spec.r_star[0] == "boc":
+            optional["boc"] = self.fetcher.fetch_boc_data
+        if spec.unemployment == "BLS":
+            optional["bls_unemployment"] = self.fetcher.fetch_bls_unemployment
+        pending = deadline.schedule(optional)
+        data = {
+            role: self._fetch_series(series_id, limit)
+            for role, (series_id, limit) in self._input_series(spec).items()
+        }
+        for role, series in data.items():
+            if not len(series):
+                record_fallback(spec.country, role)
+        scraped, skipped = pending.collect({"boc": {}, "bls_unemployment": {}})
+        for name in skipped:
+            record_fallback(spec.country, name)
+        boc_data = scraped.get("boc", {})
+        if "error" in boc_data:
+            record_fallback(spec.country, "boc")
+
+        if spec.policy_rate == "BOC":
+            actual_rate = boc_data.get("policy_rate", fallbacks["policy_rate"])
+        else:
+            actual_rate = self._latest_float(data["policy_rate"], fallbacks["policy_rate"])
 
-            threshold_val = 2.5
+        prices = data["inflation"]
+        current_pi = fallbacks["inflation"]
+        if spec.inflation[0] == "yoy_index":
+            if len(prices) >= 13 and prices.values[-13] != 0:
+                current_pi = (prices.values[-1] / prices.values[-13] - 1) * 100
+        else:
+            current_pi = self._latest_percent_observation(prices, current_pi)
 
-            gap_scenarios = {
-                f"Labor Model (Okun: {gap_okun:.1f}%)": gap_okun,
-                f"Statistical Trend (HP Filter: {gap_hp:.1f}%)": gap_hp,
-                f"Industrial Model (CapUtil: {gap_cap:.1f}%)": gap_cap,
-            }
-            output_gap = gap_hp
-            activity_gap_enhanced = float(np.median([gap_okun, gap_hp, gap_cap]))
-            financial_stress = self._latest_float(nfci_data, 0.0)
-            claims_pressure = self._recent_change(claims_data, 0.0, periods=12)
-            inflation_pressure = current_pi - 2.0
-            labor_cooling = claims_pressure / 1000.0
-            external_pressure = 0.0
-            title = "Federal Reserve (US)"
-
-        elif country == "Canada":
-            print("   > Fetching BoC & FRED data for Canada...")
-            boc_data = self.fetcher.fetch_boc_data()
-            actual_rate = boc_data.get("policy_rate", 2.25)
-
-            unrate_data = self.fetcher.fetch_fred_series("LRHUTTTTCAM156S", limit=5)
-            gdp_real_long = self.fetcher.fetch_fred_series("NGDPRSAXDCCAQ", limit=100)
-            cap_util = self.fetcher.fetch_fred_series("BSCACP02CAM659S", limit=240)
-            cpi_data = self.fetcher.fetch_fred_series("CPALTT01CAM659N", limit=20)
-            cad_data = self.fetcher.fetch_fred_series("DEXCAUS", limit=20)
-            oil_data = self.fetcher.fetch_fred_series("DCOILWTICO", limit=20)
-
-            u_actual = 6.8
-            if isinstance(unrate_data, list) and len(unrate_data) > 0:
-                try:
-                    u_actual = float(unrate_data[0]["value"])
-                except:
-                    pass
-
-            u_star = 6.2
+        u_actual = fallbacks["unemployment"]
+        if spec.unemployment == "BLS":
             try:
-                unrate_long = self.fetcher.fetch_fred_series(
-                    "LRHUTTTTCAM156S", limit=120
-                )
-                if unrate_long:
-                    vals = [float(x["value"]) for x in unrate_long]
-                    u_star = sum(vals) / len(vals)
-            except:
-                pass
-
-            gap_okun = -2.0 * (u_actual - u_star)
-
-            current_pi = 2.4
-            current_pi = self._latest_percent_observation(cpi_data, current_pi)
-
-            gap_hp = -1.0
-            if gdp_real_long and len(gdp_real_long) > 20:
-                try:
-                    data_list = [
-                        {"date": x["date"], "value": float(x["value"])}
-                        for x in gdp_real_long
-                    ]
-                    df_gdp = pd.DataFrame(data_list).sort_values("date")
-                    df_gdp["log_gdp"] = np.log(df_gdp["value"])
-                    cycle, trend = hpfilter(df_gdp["log_gdp"], lamb=1600)
-                    gap_hp = cycle.iloc[-1] * 100
-                except:
-                    pass
-
-            gap_cap = -0.5
-            if cap_util and len(cap_util) > 120:
-                try:
-                    curr_cap = float(cap_util[0]["value"])
-                    vals = [float(x["value"]) for x in cap_util if x["value"] != "."]
-                    avg_cap = sum(vals) / len(vals)
-                    gap_cap = curr_cap - avg_cap
-                except:
-                    pass
-
-            r_star_nominal_range = boc_data.get("neutral_rate", [2.25, 3.25])
-            r_star_nominal_mid = sum(r_star_nominal_range) / 2
-
-            r_star_real_mid = r_star_nominal_mid - 2.0
-            r_star_real_range = [x - 2.0 for x in r_star_nominal_range]
-
-            threshold_val = 2.5
-
-            gap_scenarios = {
-                f"Labor Model (Okun: {gap_okun:.1f}%)": gap_okun,
-                f"Statistical Trend (HP Filter: {gap_hp:.1f}%)": gap_hp,
-                f"Industrial Model (CapUtil: {gap_cap:.1f}%)": gap_cap,
-            }
-            output_gap = gap_hp
-            activity_gap_enhanced = float(np.median([gap_okun, gap_hp, gap_cap]))
-            financial_stress = 0.0
-            inflation_pressure = current_pi - 2.0
-            cad_pressure = self._recent_change(cad_data, 0.0, periods=3) * 10
-            oil_pressure = self._recent_change(oil_data, 0.0, periods=3) / 10
-            external_pressure = cad_pressure + oil_pressure
-            labor_cooling = 0.0
-            title = "Bank of Canada"
-
-        rec_rate = self.engine.models.taylor_nonlinear(
-            r_star_real_mid,
-            current_pi,
-            output_gap,
-            threshold=threshold_val,
-            stress_multiplier=1.5,
+                u_actual = float(scraped["bls_unemployment"]["value"])
+            except (KeyError, TypeError, ValueError):
+                if "bls_unemployment" not in skipped:
+                    record_fallback(spec.country, "bls_unemployment")
+        else:
+            u_actual = self._latest_float(data["unemployment"], u_actual)
+
+        u_star = fallbacks["natural_rate"]
+        if spec.natural_rate[0] == "mean":
+            if len(data["natural_rate"]):
+                u_star = float(data["natural_rate"].values.mean())
+        else:
+            u_star = self._latest_float(data["natural_rate"], u_star)
+
+        natural_history = None
+        window = 120
+        if spec.natural_rate[0] == "mean":
+            window = spec.natural_rate[2]
+        else:
+            natural_history = self._records_to_series(data["natural_rate"])
+        estimates = self.gap_ensemble.estimate(
+            gdp=self._records_to_series(data["gdp"]),
+            unemployment=self._records_to_series(data["unemployment_history"]),
+            natural_rate=natural_history,
+            capacity=self._records_to_series(data["capacity"]),
+            window=window,
+        )
+        # Estimators without enough history fall back to the point readings.
+        gaps = {
+            "okun": -2.0 * (u_actual - u_star),
+            "hp": fallbacks["hp"],
+            "caputil": fallbacks["caputil"],
+        }
+        gaps.update(estimates.latest)
+        gaps = {name: gaps[name] for name in GAP_NAMES if name in gaps}
+        print(
+            "   > Gaps Calculated: "
+            + ", ".join(f"{GAP_NAMES[name]}={gap:.2f}%" for name, gap in gaps.items())
+        )
+
+        if spec.r_star[0] == "boc":
+            neutral = boc_data.get("neutral_rate", fallbacks["neutral_rate"])
+            r_star_mid = sum(neutral) / 2 - 2.0
+            r_star_range = [x - 2.0 for x in neutral]
+        else:
+            nominal = self._latest_float(data["r_star"], fallbacks["r_star_nominal"])
+            r_star_mid = nominal - 2.0
+            half_width = spec.r_star[2]
+            r_star_range = [r_star_mid - half_width, r_star_mid + half_width]
+
+        external_pressure = sum(
+            self._recent_change(data[f"external:{series_id}"], 0.0, periods=3) * scale
+            for series_id, scale in spec.external
         )
+        return PolicyInputs(
+            country=spec.country,
+            title=spec.title,
+            actual_rate=float(actual_rate),
+            inflation=float(current_pi),
+            unemployment=u_actual,
+            natural_rate=u_star,
+            gaps=gaps,
+            r_star_mid=r_star_mid,
+            r_star_range=r_star_range,
+            financial_stress=(
+                self._latest_float(data["financial"], 0.0) if spec.financial else 0.0
+            ),
+            labor_cooling=(
+                self._recent_change(data["claims"], 0.0, periods=12) / 1000.0
+                if spec.claims
+                else 0.0
+            ),
+            external_pressure=float(external_pressure),
+            skipped=tuple(skipped),
+        )
+
+    @staticmethod
+    def _policy_stance(gap_bps):
+        if gap_bps > 25:
+            return "Restrictive"
+        if gap_bps < -25:
+            return "Accommodative"
+        return "Neutral"
+
+    def _rule_rates(self, inputs):
+        """Nonlinear and 1999 rules at the HP gap, and the nonlinear rule over the gap ensemble."""
+        models = self.engine.models
+
+        def rule_at(gap):
+            return models.taylor_nonlinear(
+                inputs.r_star_mid,
+                inputs.inflation,
+                gap,
+                threshold=inputs.threshold,
+                stress_multiplier=1.5,
+            )
 
-        lin_rate = self.engine.models.taylor_1999(
-            r_star_real_mid, current_pi, output_gap
+        ensemble_rates = sorted(rule_at(gap) for gap in inputs.gaps.values())
+        return {
+            "base": rule_at(inputs.output_gap),
+            "linear": models.taylor_1999(
+                inputs.r_star_mid, inputs.inflation, inputs.output_gap
+            ),
+            "ensemble": rule_at(inputs.activity_gap),
+            "ensemble_range": (ensemble_rates[0], ensemble_rates[-1]),
+        }
+
+    def _calibration_stage(self, country, inputs, raw):
+        history_inputs = self._policy_history_inputs(country, inputs.r_star_mid, raw=raw)
+        frame = self._build_policy_calibration_frame(
+            country, inputs.r_star_mid, history_inputs
+        )
+        return {"frame": frame, "history": self.taylor_paths[country].panel}
+
+    def _enhancement_stage(self, inputs, rules, calibration):
+        return self._data_enhanced_taylor_rate(
+            base_rate=rules["base"],
+            current_features=inputs.features,
+            calibration_frame=calibration["frame"],
         )
 
-        gap_bps = (actual_rate - rec_rate) * 100
-        nonlinear_premium = (rec_rate - lin_rate) * 100
-        calibration_frame = self._build_policy_calibration_frame(country, r_star_real_mid)
-        current_features = {
-            "activity_gap": activity_gap_enhanced,
-            "inflation_pressure": inflation_pressure,
-            "financial_conditions": financial_stress,
-            "external_pressure": external_pressure,
-            "labor_cooling": labor_cooling,
+    def _enhanced_history_stage(self, calibration):
+        with span("calibration", "rolling enhancement"):
+            enhanced_history = enhanced_rate_history(
+                calibration["history"]["nonlinear"],
+                calibration["frame"],
+                window=self.enhancement_window,
+            )
+        return {
+            "history": enhanced_history,
+            "track": self._enhanced_track_record(enhanced_history, calibration["frame"]),
         }
-        enhanced_rate, enhanced_adjustments = self._data_enhanced_taylor_rate(
-            base_rate=rec_rate,
-            current_features=current_features,
-            calibration_frame=calibration_frame,
+
+    def _simulation_stage(self, inputs):
+        return self._simulate_policy_distribution(
+            inputs.r_star_range, inputs.inflation, inputs.gaps, inputs.threshold
         )
-        enhanced_gap_bps = (actual_rate - enhanced_rate) * 100
-
-        filename = f"{country.lower()}_oracle_chart.png"
-        plot_taylor_sensitivity(
-            country_name=title,
-            current_pi=current_pi,
-            gap_scenarios=gap_scenarios,
-            r_star_mid=r_star_real_mid,
-            r_star_range=r_star_real_range,
-            actual_rate=actual_rate,
-            output_filename=filename,
+
+    def _analysis_stage(self, inputs, rules, calibration, enhancement, enhanced, simulation):
+        enhanced_rate, contributions = enhancement
+        history = calibration["history"]
+        return PolicyAnalysis(
+            inputs=inputs,
+            base_rate=rules["base"],
+            linear_rate=rules["linear"],
+            enhanced_rate=enhanced_rate,
+            contributions=contributions,
+            stance=self._policy_stance((inputs.actual_rate - rules["base"]) * 100),
+            ensemble_rate=rules["ensemble"],
+            ensemble_range=rules["ensemble_range"],
+            simulation=simulation,
+            history=history,
+            history_stats=deviation_stats(history),
+            enhanced_history=enhanced["history"],
+            enhanced_track=enhanced["track"],
+        )
+
+    def _chart_stage(self, country, analysis):
+        inputs = analysis.inputs
+        simulation = analysis.simulation
+        return plot_taylor_sensitivity(
+            country_name=inputs.title,
+            current_pi=inputs.inflation,
+            gap_scenarios={
+                label.format(inputs.gaps[name]): inputs.gaps[name]
+                for name, label in self.GAP_SCENARIOS
+            },
+            r_star_mid=inputs.r_star_mid,
+            r_star_range=inputs.r_star_range,
+            actual_rate=inputs.actual_rate,
+            output_filename=f"{country.lower()}_oracle_chart.png",
+            fan_offsets=(
+                simulation["variants"]["level_shift"]["quantiles"] if simulation else None
+            ),
         )
 
-        report = self._write_economist_report(
-            country,
-            title,
-            current_pi,
-            output_gap,
-            actual_rate,
-            rec_rate,
-            gap_bps,
-            threshold_val,
-            nonlinear_premium,
-            u_actual if country == "US" else None,
-            enhanced_rate,
-            enhanced_gap_bps,
-            enhanced_adjustments,
+    def _report_stage(self, spec, analysis):
+        inputs = analysis.inputs
+        return self._write_economist_report(
+            spec.country,
+            inputs.title,
+            inputs.inflation,
+            inputs.output_gap,
+            inputs.actual_rate,
+            analysis.base_rate,
+            analysis.gap_bps,
+            inputs.threshold,
+            analysis.nonlinear_premium,
+            inputs.unemployment if spec.show_unemployment else None,
+            analysis.enhanced_rate,
+            analysis.enhanced_gap_bps,
+            analysis.contributions,
+            analysis.simulation,
+            analysis.history_stats,
+            analysis.enhanced_track,
+            gap_source=spec.gap_source,
+            gap_ensemble={
+                "gaps": inputs.gaps,
+                "median": inputs.activity_gap,
+                "spread": inputs.gap_spread,
+                "rate": analysis.ensemble_rate,
+                "range": analysis.ensemble_range,
+            },
+            skipped=inputs.skipped,
         )
 
-        return {"image_path": os.path.abspath(filename), "report": report}
+    def _pipeline(self, country):
+        """Memoised stage graph of one central bank, built on first use."""
+        with self._pipelines_lock:
+            if country in self._pipelines:
+                return self._pipelines[country]
+            spec = self._spec(country)
+            graph = PipelineGraph()
+            graph.source("inputs", partial(self._collect_inputs, spec))
+            graph.source("history_raw", partial(self._fetch_history_series, country))
+            graph.node("rules", self._rule_rates, ["inputs"])
+            graph.node(
+                "calibration",
+                partial(self._calibration_stage, country),
+                ["inputs", "history_raw"],
+            )
+            graph.node("enhancement", self._enhancement_stage, ["inputs", "rules", "calibration"])
+            graph.node("enhanced_history", self._enhanced_history_stage, ["calibration"])
+            graph.node("simulation", self._simulation_stage, ["inputs"])
+            graph.node(
+                "analysis",
+                self._analysis_stage,
+                [
+                    "inputs",
+                    "rules",
+                    "calibration",
+                    "enhancement",
+                    "enhanced_history",
+                    "simulation",
+                ],
+            )
+            graph.node("chart", partial(self._chart_stage, country), ["analysis"])
+            graph.node("report", partial(self._report_stage, spec), ["analysis"])
+            self._pipelines[country] = graph
+            return graph
+
+    def analyze(self, country="US"):
+        """Run the full pipeline for one central bank; returns a PolicyAnalysis.
+
+        Stages run as a memoised graph: calling again with unchanged inputs
+        only re-fetches, and the rule history, simulation and chart paths run
+        concurrently.
+        """
+        self._spec(country)
+        print(f"--- Initiating Oracle Sequence for {country} ---")
+        self._prefetch([country])
+        values = self._pipeline(country).run()
+        return dataclasses.replace(
+            values["analysis"],
+            chart=values["chart"],
+            image_path=os.path.abspath(f"{country.lower()}_oracle_chart.png"),
+            report=values["report"],
+        )
+
+    def analyze_many(self, countries=("US", "Canada"), max_workers=None):
+        """Analyse several central banks concurrently over one shared fetch layer.
+
+        The union of their series is prefetched first, so a series needed by
+        two banks (or by the point inputs and the history) is downloaded once.
+        Returns ``{country: PolicyAnalysis}`` in the order given.
+        """
+        countries = list(countries)
+        for country in countries:
+            self._spec(country)
+        self._prefetch(countries)
+        with ThreadPoolExecutor(max_workers=max_workers or len(countries) or 1) as pool:
+            analyses = list(pool.map(propagate(self.analyze), countries))
+        return dict(zip(countries, analyses))
+
+    def generate_analysis(self, country="US"):
+        """Run full pipeline: fetch -> model -> visualize -> report."""
+        analysis = self.analyze(country)
+        return {
+            "image_path": analysis.image_path,
+            "chart": analysis.chart,
+            "report": analysis.report,
+            "history": analysis.history,
+            "enhanced_history": analysis.enhanced_history,
+            "analysis": analysis,
+        }
 
+    @traced("report", "policy report")
     def _write_economist_report(
         self,
         country,
@@ -433,6 +735,12 @@ class PolicyRateEngine:
         enhanced_rate=None,
         enhanced_gap_bps=None,
         enhanced_adjustments=None,
+        simulation=None,
+        history_stats=None,
+        enhanced_track=None,
+        gap_source=None,
+        gap_ensemble=None,
+        skipped=(),
     ):
         """Generate macro report."""
         if enhanced_rate is None:
@@ -442,8 +750,8 @@ class PolicyRateEngine:
         if enhanced_adjustments is None:
             enhanced_adjustments = {}
 
-        if gap_bps > 25:
-            stance = "Restrictive"
+        stance = self._policy_stance(gap_bps)
+        if stance == "Restrictive":
             deviation_desc = "Actual rate is above the model-implied level"
             direction_needed = "cut"
             gap_desc = (
@@ -452,14 +760,12 @@ class PolicyRateEngine:
                 else "Inflationary pressure"
             )
             constraint_desc = "The policy remains clearly restrictive. The current rate level continues to act as a constraint on economic recovery in the model sense."
-        elif gap_bps < -25:
-            stance = "Accommodative"
+        elif stance == "Accommodative":
             deviation_desc = "Actual rate is below the model-implied level"
             direction_needed = "hike"
             gap_desc = "Inflation/Overheating risk"
             constraint_desc = "The policy shows clear stimulative characteristics. The current rate level may lead to economic overheating or persistent inflation."
         else:
-            stance = "Neutral"
             deviation_desc = (
                 "Actual rate is broadly aligned with the model-implied level"
             )
@@ -481,11 +787,57 @@ class PolicyRateEngine:
 
         u_line = f"*   **Unemployment Rate:** {u_rate}%\n" if u_rate else ""
 
-        gap_source = "statistical trend model"
-        if country == "Canada":
-            gap_source = "BoC Extended Filter proxy"
-        elif country == "US":
-            gap_source = "HP Filter / Okun's Law estimate"
+        gap_names = "Okun / HP / CapUtil"
+        ensemble_line = ""
+        if gap_ensemble:
+            gap_names = " / ".join(GAP_NAMES.get(name, name) for name in gap_ensemble["gaps"])
+            low, high = gap_ensemble["range"]
+            ensemble_line = f"*   **Output-Gap Ensemble:** median {gap_ensemble['median']:+.2f}% across {len(gap_ensemble['gaps'])} estimators ({gap_names}; spread {gap_ensemble['spread']:.2f} pp); the nonlinear rule at the median gap is {gap_ensemble['rate']:.2f}% (range {low:.2f}% to {high:.2f}% across estimators).\n"
+
+        if simulation:
+            quantiles = simulation["variants"]["nonlinear"]["quantiles"]
+            position = summarize_position(simulation, rate)
+            z_score = position["z_score"]
+            is_central = abs(z_score) < 1.0
+            interval_line = f"*   **95% Interval (Monte Carlo, {simulation['n_draws']:,} draws):** Drawing $r^*$, inflation and the {gap_names} gap estimates from their uncertainty ranges, the model's desired rate lies in **[{quantiles[0.025]:.2f}%, {quantiles[0.975]:.2f}%]** (median {quantiles[0.5]:.2f}%)."
+            percentile_text = f", {position['percentile']:.0f}th percentile"
+        else:
+            z_score = gap_bps / 50
+            is_central = abs(gap_bps) < 25
+            interval_line = f"*   **95% Confidence Interval:** Based on the volatility range of $r^*$ and the Gap, the model's desired rate interval is approximately **[{min(rec_rate - 0.5, rate - 0.25):.2f}%, {max(rec_rate + 0.5, rate + 0.25):.2f}%]**."
+            percentile_text = ""
+
+        track_line = ""
+        if enhanced_track:
+            track_line = f"*   **Real-Time Track Record:** fitted month by month on prior data since {enhanced_track['since']:%Y-%m}, the enhanced rate missed the actual rate by {enhanced_track['enhanced_mae_bps']:.0f} bps on average versus {enhanced_track['base_mae_bps']:.0f} bps for the base rule (n={enhanced_track['n']}).\n"
+
+        history_section = ""
+        if history_stats:
+            rule_names = {
+                "taylor_1993": "Taylor 1993",
+                "taylor_1999": "Taylor 1999",
+                "nonlinear": "Nonlinear",
+                "post_08": "Post-2008 (NFCI)",
+                "smoothed": "Smoothed (rho=0.8)",
+            }
+            lines = [
+                f"*   **{rule_names.get(rule, rule)}:** mean {s['mean_bps']:+.0f} bps, RMSE {s['rmse_bps']:.0f} bps, latest {s['latest_bps']:+.0f} bps ({s['percentile']:.0f}th percentile since {s['since']:%Y-%m})"
+                for rule, s in history_stats.items()
+            ]
+            history_section = (
+                "\n### 2B. Historical Deviation (actual minus rule)\n"
+                + "\n".join(lines)
+                + "\n"
+            )
+
+        skipped_line = ""
+        if skipped:
+            names = ", ".join(self.OPTIONAL_SOURCES.get(name, name) for name in skipped)
+            skipped_line = f"*   **Skipped Inputs:** {names} not back within the run deadline; the fallback values were used.\n"
+
+        if gap_source is None:
+            spec = self.CENTRAL_BANKS.get(country)
+            gap_source = spec.gap_source if spec else "statistical trend model"
 
         report = f"""
 # Central Bank Policy Report: {title}
@@ -497,7 +849,7 @@ class PolicyRateEngine:
 *   **Core Inflation:** {pi:.2f}%
 *   **Output Gap:** {gap:.2f}% ({gap_source})
 *   **Current Policy Rate:** {rate:.2f}%
-{u_line}
+{u_line}{skipped_line}
 ### 2. Model Conclusion
 Under the specified assumptions, the base Taylor Rule implies a desired policy rate of approximately **{rec_rate:.2f}%**.
 {conclusion_text}
@@ -506,19 +858,19 @@ Under the specified assumptions, the base Taylor Rule implies a desired policy r
 *   **Base Taylor Rate:** {rec_rate:.2f}% ({gap_bps:+.0f} bps versus actual)
 *   **Data-Enhanced Taylor Rate:** {enhanced_rate:.2f}% ({enhanced_gap_bps:+.0f} bps versus actual)
 *   **Enhancement Decomposition:** intercept {enhanced_adjustments.get("intercept", 0.0):+.2f} pp; activity gap {enhanced_adjustments.get("activity_gap", 0.0):+.2f} pp; inflation pressure {enhanced_adjustments.get("inflation_pressure", 0.0):+.2f} pp; financial conditions {enhanced_adjustments.get("financial_conditions", 0.0):+.2f} pp; external pressure {enhanced_adjustments.get("external_pressure", 0.0):+.2f} pp; labor cooling {enhanced_adjustments.get("labor_cooling", 0.0):+.2f} pp; total {enhanced_adjustments.get("total", 0.0):+.2f} pp; sample n={enhanced_adjustments.get("n", 0.0):.0f}.
-
+{ensemble_line}{track_line}{history_section}
 ### 3. Economic Interpretation
 *   **Chart Signal:** The current policy rate ({rate:.2f}%), indicated by the black dashed line, is {chart_signal} the model-implied paths under the three output gap scenarios.
 *   **Policy Implications:** {constraint_desc}
 
 ### 4. Empirical Uncertainty Check
 **Statistical Facts:**
-*   **95% Confidence Interval:** Based on the volatility range of $r^*$ and the Gap, the model's desired rate interval is approximately **[{min(rec_rate - 0.5, rate - 0.25):.2f}%, {max(rec_rate + 0.5, rate + 0.25):.2f}%]**.
+{interval_line}
 *   **Current Observation:** Actual rate is **{rate:.2f}%**.
-*   **Statistical Positioning:** The observation is at the **{"center" if abs(gap_bps) < 25 else "edge/outlier region"}** of the confidence interval (Z-Score $\approx$ {gap_bps / 50:.1f}).
+*   **Statistical Positioning:** The observation is at the **{"center" if is_central else "edge/outlier region"}** of the confidence interval (Z-Score $\approx$ {z_score:.1f}{percentile_text}).
 
 **Inference Conclusion:**
-{"The observation sits near the central range of the model distribution, so the base Taylor signal and current policy rate are broadly consistent under this specification." if abs(gap_bps) < 25 else "The deviation from the central range is large enough to treat the signal as a policy diagnostic rather than a mechanical rate prescription."}
+{"The observation sits near the central range of the model distribution, so the base Taylor signal and current policy rate are broadly consistent under this specification." if is_central else "The deviation from the central range is large enough to treat the signal as a policy diagnostic rather than a mechanical rate prescription."}
 
 ---
 *Generated by Economics ML Skill v2.5*
@@ -528,6 +880,9 @@ Under the specified assumptions, the base Taylor Rule implies a desired policy r
 
 
 if __name__ == "__main__":
+    from src.core.runtime import ensure_utf8_stdout
+
+    ensure_utf8_stdout()
     engine = PolicyRateEngine()
     result = engine.generate_analysis("US")
     print(result["report"])
@@ -0,0 +1,71 @@
+"""Synthetic FRED-shaped frames shared by the offline engine tests."""
+
+import numpy as np
+import pandas as pd
+
+
+def synthetic_fred_frames(n_months=160, seed=0):
+    """Monthly indicator levels and quarterly GDP levels driven by one factor."""
+    rng = np.random.default_rng(seed)
+    months = pd.date_range("2012-01-01", periods=n_months, freq="MS")
+    factor = np.cumsum(rng.normal(0, 0.3, n_months)) * 0.1 + rng.normal(0, 1, n_months)
+    frames = {}
+    for i, sid in enumerate(["INDPRO", "PAYEMS", "RSAFS", "UNRATE", "PCEC96"]):
+        growth = 0.2 * factor * (1 + 0.2 * i) + rng.normal(0, 0.3, n_months)
+        level = (
+            5.0 + np.cumsum(growth) * 0.05
+            if sid == "UNRATE"
+            else 100 * np.exp(np.cumsum(growth) / 100)
+        )
+        frames[sid] = pd.DataFrame({"value": level}, index=months.rename("date"))
+    q_factor = pd.Series(factor, index=months).resample("QS").mean()
+    quarters = q_factor.index
+    q_factor = q_factor.to_numpy()
+    gdp_growth = 0.5 + 0.4 * q_factor + rng.normal(0, 0.2, len(quarters))
+    gdp = 100 * np.exp(np.cumsum(gdp_growth) / 100)
+    frames["GDPC1"] = pd.DataFrame({"value": gdp}, index=quarters.rename("date"))
+    return frames
+
+
+FRED_LEVELS = {
+    "GDPC1": (22000.0, "QS", "growth"),
+    "NGDPRSAXDCCAQ": (2200000.0, "QS", "growth"),
+    "PCEPILFE": (120.0, "MS", "growth"),
+    "UNRATE": (4.2, "MS", "level"),
+    "LRHUTTTTCAM156S": (6.5, "MS", "level"),
+    "NROU": (4.3, "QS", "level"),
+    "NFCI": (-0.4, "W-FRI", "level"),
+    "ICSA": (230000.0, "W-SAT", "level"),
+    "DFF": (3.6, "D", "level"),
+    "IRSTCI01USM156N": (3.6, "MS", "level"),
+    "IRSTCI01CAM156N": (2.5, "MS", "level"),
+    "CPALTT01CAM659N": (2.4, "MS", "level"),
+    "DEXCAUS": (1.37, "D", "level"),
+    "DCOILWTICO": (70.0, "D", "level"),
+    "TCU": (77.0, "MS", "level"),
+    "BSCACP02CAM659S": (80.0, "MS", "level"),
+    "FEDTARGLMD": (3.0, "QS", "level"),
+}
+
+
+def fake_fred_records(series_id, limit=20, end="2026-06-01", seed=None, history=1200):
+    """FRED-style observation dicts (newest first) for the policy-engine series.
+
+    Every call slices the same ``history``-long path, so a small ``limit`` returns
+    exactly the newest rows of a larger one, as FRED does.
+    """
+    base, freq, kind = FRED_LEVELS.get(series_id, (100.0, "MS", "growth"))
+    if seed is None:
+        seed = sum(map(ord, series_id))
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(end=end, periods=history, freq=freq)
+    if kind == "growth":
+        values = base * np.exp(np.cumsum(rng.normal(0.002, 0.004, history)) - 0.002 * history)
+    else:
+        values = base + np.cumsum(rng.normal(0, abs(base) * 0.01 + 0.02, history)) * 0.3
+        values = values - values[-1] + base
+    limit = min(limit, history)
+    return [
+        {"date": d.strftime("%Y-%m-%d"), "value": f"{v:.4f}"}
+        for d, v in zip(dates[::-1][:limit], values[::-1][:limit])
+    ]
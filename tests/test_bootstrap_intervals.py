@@ -0,0 +1,120 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from macro_fixtures import synthetic_fred_frames
+
+from src.core.bootstrap_intervals import (
+    BootstrapIntervalEngine,
+    block_bootstrap_draws,
+    moving_block_indices,
+    residual_bootstrap_draws,
+)
+
+
+class BootstrapIntervalTests(unittest.TestCase):
+    def test_moving_block_indices_stay_in_range_and_keep_runs(self):
+        rng = np.random.default_rng(1)
+        idx = moving_block_indices(20, 4, 50, rng)
+
+        self.assertEqual(idx.shape, (50, 20))
+        self.assertTrue(((idx >= 0) & (idx < 20)).all())
+        self.assertTrue((np.diff(idx[:, :4], axis=1) == 1).all())
+
+    def test_residual_bootstrap_centres_on_the_point_forecast(self):
+        rng = np.random.default_rng(2)
+        factor = rng.normal(size=60)
+        gdp = 0.5 + 0.8 * factor + rng.normal(0, 0.1, 60)
+
+        draws = residual_bootstrap_draws(factor, gdp, 1.0, 4000, rng)
+
+        self.assertAlmostEqual(np.median(draws), 1.3, delta=0.05)
+        self.assertLess(np.quantile(draws, 0.95) - np.quantile(draws, 0.05), 0.6)
+
+    def test_block_bootstrap_covers_factor_and_bridge_uncertainty(self):
+        rng = np.random.default_rng(3)
+        n_months = 120
+        signal = rng.normal(size=n_months)
+        panel = np.column_stack([signal + rng.normal(0, 0.3, n_months) for _ in range(4)])
+        panel = (panel - panel.mean(axis=0)) / panel.std(axis=0)
+        quarter_weights = np.kron(np.eye(n_months // 3), np.full(3, 1 / 3))
+        factor_q = quarter_weights @ (panel @ np.linalg.svd(panel)[2][0])
+        gdp = 0.4 + 0.3 * np.sign(factor_q.sum() or 1) * factor_q + rng.normal(0, 0.1, len(factor_q))
+        current_weights = np.zeros(n_months)
+        current_weights[-3:] = 1 / 3
+
+        draws = block_bootstrap_draws(panel, quarter_weights, gdp, current_weights, 500, rng)
+
+        self.assertEqual(draws.shape, (500,))
+        self.assertTrue(np.isfinite(draws).all())
+
+    def test_engine_returns_ordered_quantiles_within_budget(self):
+        engine = BootstrapIntervalEngine(n_boot=20000, chunk_size=500, budget_seconds=0.5, seed=4)
+        factor = np.linspace(-1, 1, 40)
+        gdp = 0.5 + factor
+
+        start = time.perf_counter()
+        interval = engine.intervals(
+            lambda n, rng: residual_bootstrap_draws(factor, gdp, 0.0, n, rng)
+        )
+        elapsed = time.perf_counter() - start
+
+        quantiles = list(interval["quantiles"].values())
+        self.assertEqual(quantiles, sorted(quantiles))
+        self.assertLess(elapsed, 1.0)
+        self.assertGreater(interval["n_draws"], 0)
+
+    def test_run_nowcast_reports_bootstrap_interval_within_one_second(self):
+        from src.engine.gdp_nowcast_engine import GDPCastNowEngine, format_report
+
+        frames = synthetic_fred_frames()
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = GDPCastNowEngine("US", snapshot_path=os.path.join(tmp, "s.json"))
+            engine.fetch_fred = lambda sid, limit=160: frames[sid].copy()
+            engine.fetch_measurement_adjustment = lambda: 0.0
+
+            start = time.perf_counter()
+            res = engine.run_nowcast()
+            elapsed = time.perf_counter() - start
+
+        interval = res["interval"]
+        self.assertLess(elapsed, 1.5)
+        self.assertLessEqual(interval["lower"], interval["quantiles"][0.5])
+        self.assertLessEqual(interval["quantiles"][0.5], interval["upper"])
+        self.assertIn("Bootstrap 90% Interval", format_report("US", res))
+        self.assertIn("+ block bootstrap intervals", format_report("US", res))
+        residual = format_report("US", dict(res, interval_method="residual"))
+        self.assertIn("+ residual bootstrap intervals", residual)
+
+    def test_backtest_interval_coverage_summary(self):
+        from backtest_engine import BacktestEngine
+
+        df = pd.DataFrame(
+            {
+                "Actual": [0.0, 1.0, 2.0, 3.0],
+                "PI_Lower": [-1.0, 0.5, 2.5, np.nan],
+                "PI_Upper": [1.0, 1.5, 3.5, np.nan],
+            }
+        )
+
+        coverage = BacktestEngine._interval_coverage(df, 0.9)
+
+        self.assertEqual(coverage["n"], 3)
+        self.assertAlmostEqual(coverage["empirical"], 2 / 3)
+        self.assertAlmostEqual(coverage["below"], 1 / 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
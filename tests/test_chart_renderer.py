@@ -0,0 +1,100 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+import pandas as pd
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+
+from src.core.chart_renderer import ChartRenderer, payload_fingerprint
+
+
+class ChartRendererTests(unittest.TestCase):
+    def test_fingerprint_tracks_plotted_data(self):
+        payload = {"title": "US", "rates": np.linspace(1, 2, 5)}
+        same = {"rates": np.linspace(1, 2, 5), "title": "US"}
+        changed = {"title": "US", "rates": np.linspace(1, 2.01, 5)}
+
+        self.assertEqual(payload_fingerprint(payload), payload_fingerprint(same))
+        self.assertNotEqual(payload_fingerprint(payload), payload_fingerprint(changed))
+
+    def test_renders_off_thread_and_serves_unchanged_charts_from_cache(self):
+        calls = []
+
+        def draw(fig, payload):
+            calls.append(threading.current_thread().name)
+            fig.add_subplot().plot(payload["x"], payload["y"])
+
+        payload = {"x": np.arange(10.0), "y": np.arange(10.0) ** 2}
+        with tempfile.TemporaryDirectory() as tmp:
+            renderer = ChartRenderer(cache_directory=os.path.join(tmp, "cache"))
+            first = renderer.submit(draw, payload, os.path.join(tmp, "a.png"))
+            self.assertEqual(first.result(timeout=30), os.path.join(tmp, "a.png"))
+
+            second = renderer.submit(draw, dict(payload), os.path.join(tmp, "b.png"))
+
+            self.assertTrue(second.done())
+            self.assertEqual(len(calls), 1)
+            self.assertNotEqual(calls[0], threading.current_thread().name)
+            with open(os.path.join(tmp, "a.png"), "rb") as a, open(
+                os.path.join(tmp, "b.png"), "rb"
+            ) as b:
+                self.assertEqual(a.read(), b.read())
+
+    def test_cache_keeps_the_most_recently_used_images(self):
+        def draw(fig, payload):
+            fig.add_subplot().plot(payload["y"])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = os.path.join(tmp, "cache")
+            renderer = ChartRenderer(cache_directory=cache, max_cached=2)
+
+            def render(scale):
+                out = os.path.join(tmp, f"{scale}.png")
+                renderer.submit(draw, {"y": np.arange(5.0) * scale}, out).result(timeout=30)
+                return sorted(os.listdir(cache))
+
+            first = render(1)
+            both = render(2)
+            render(1)  # cache hit: now the most recently used
+            last = render(3)
+
+        self.assertEqual(len(both), 2)
+        self.assertIn(first[0], last)
+        self.assertEqual(len(last), 2)
+        self.assertNotIn(sorted(set(both) - set(first))[0], last)
+
+    def test_backtest_dashboard_renders_through_the_pool(self):
+        from backtest_engine import BacktestEngine
+
+        dates = pd.date_range("2016-01-01", periods=12, freq="QS")
+        actual = np.linspace(-1, 2, 12)
+        df = pd.DataFrame(
+            {
+                "Date": dates,
+                "Actual": actual,
+                "Predicted": actual + 0.2,
+                "ML_Calibrated": actual + 0.1,
+                "Residual": np.full(12, -0.2),
+            }
+        )
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                future = BacktestEngine().plot_dashboard(
+                    "US", {"df": df, "oos_r2": 0.5}, renderer=ChartRenderer(tmp)
+                )
+                path = future.result(timeout=30)
+                self.assertGreater(os.path.getsize(path), 0)
+            finally:
+                os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    unittest.main()
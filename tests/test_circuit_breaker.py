@@ -0,0 +1,125 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import requests
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+
+from src.core.deadline import Deadline, OptionalSources
+from src.data_utils.circuit_breaker import CircuitBreaker
+from src.data_utils.http_metrics import REGISTRY
+from src.data_utils.macro_data_fetcher import MacroDataFetcher
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.now = 1000.0
+        self.calls = 0
+
+    def breaker(self):
+        # A new instance per call behaves like a new process over the same state file.
+        return CircuitBreaker(
+            "bls", threshold=2, cooldown=60, directory=self.tmp.name, clock=lambda: self.now
+        )
+
+    def fetch(self, result):
+        def run():
+            self.calls += 1
+            return result
+
+        return run
+
+    def call(self, result):
+        return self.breaker().call(
+            self.fetch(result),
+            failed=lambda value: value is None,
+            fallback=lambda: "fallback",
+        )
+
+    def test_opens_after_repeated_failures_and_fails_fast(self):
+        self.assertIsNone(self.call(None))
+        self.assertIsNone(self.call(None))
+        self.assertEqual(self.breaker().load()["state"], "open")
+
+        self.assertEqual(self.call({"value": "4.1"}), "fallback")
+        self.assertEqual(self.calls, 2)
+
+    def test_open_breaker_serves_the_last_good_result(self):
+        self.call({"value": "4.1"})
+        self.call(None)
+        self.assertEqual(self.call(None), {"value": "4.1"})
+
+        self.assertEqual(self.call({"value": "9.9"}), {"value": "4.1"})
+        self.assertEqual(self.calls, 3)
+
+    def test_half_open_probe_after_cooldown(self):
+        self.call(None)
+        self.call(None)
+
+        self.now += 61
+        self.assertIsNone(self.call(None))
+        self.assertEqual(self.calls, 3)
+        self.assertEqual(self.breaker().load()["state"], "open")
+        self.assertEqual(self.call({"value": "4.2"}), "fallback")
+
+        self.now += 61
+        self.assertEqual(self.call({"value": "4.2"}), {"value": "4.2"})
+        self.assertEqual(self.breaker().load()["state"], "closed")
+        self.assertEqual(self.call({"value": "4.3"}), {"value": "4.3"})
+
+    def test_stale_last_good_result_is_not_served(self):
+        self.call({"value": "4.1"})
+        REGISTRY.reset()
+        self.assertEqual(self.call(None), {"value": "4.1"})
+        self.assertEqual(REGISTRY.to_json()["fallbacks"][0]["input"], "stale_last_good")
+
+        self.now += 86401
+        self.assertIsNone(self.call(None))
+        self.assertEqual(self.call({"value": "4.3"}), "fallback")
+
+    def test_deadline_cut_calls_do_not_open_the_breaker(self):
+        def slow_page(url, timeout=None, **kwargs):
+            if timeout < 0.3:
+                raise requests.Timeout("read timed out")
+            raise AssertionError("request sent without a deadline cap")
+
+        with patch.dict(os.environ, {"ECONOMICS_ML_CACHE_DIR": self.tmp.name}):
+            with patch(
+                "src.data_utils.http_metrics.requests.get", side_effect=slow_page
+            ) as get:
+                for _ in range(4):
+                    fetcher = MacroDataFetcher()
+                    pending = OptionalSources(
+                        {"bls": fetcher.fetch_bls_unemployment}, Deadline(0.2, reserve=0)
+                    )
+                    results, _ = pending.collect()
+
+            state = fetcher.breakers["bls"].load()
+
+        self.assertEqual(get.call_count, 4)
+        self.assertEqual(state["state"], "closed")
+        self.assertEqual(state["failures"], 0)
+        self.assertTrue(results["bls"].startswith("Error"))
+
+    def test_unreachable_boc_page_is_not_requested_again_while_open(self):
+        with patch.dict(os.environ, {"ECONOMICS_ML_CACHE_DIR": self.tmp.name}):
+            with patch(
+                "src.data_utils.http_metrics.requests.get",
+                side_effect=requests.ConnectionError("down"),
+            ) as get:
+                for _ in range(4):
+                    data = MacroDataFetcher().fetch_boc_data()
+
+        self.assertEqual(get.call_count, 3)
+        self.assertEqual(data, {"error": "BoC circuit open"})
+
+
+if __name__ == "__main__":
+    unittest.main()
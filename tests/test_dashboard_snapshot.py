@@ -0,0 +1,112 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from macro_fixtures import fake_fred_records, synthetic_fred_frames
+
+DASHBOARD_SNAPSHOT = os.path.join(SKILL_ROOT, "..", "dashboard", "public", "snapshot.json")
+
+
+class DashboardSnapshotTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "snapshot.json")
+        shutil.copyfile(DASHBOARD_SNAPSHOT, self.path)
+        self.frames = synthetic_fred_frames(n_months=200)
+
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        frames = self.frames
+
+        def fetch_frame(_engine, sid, limit=160):
+            return frames[sid].copy() if sid in frames else pd.DataFrame()
+
+        for patcher in (
+            mock.patch.dict(os.environ, {"ECONOMICS_ML_CACHE_DIR": self.tmp.name}),
+            mock.patch("src.engine.gdp_nowcast_engine.GDPCastNowEngine.fetch_fred", fetch_frame),
+            mock.patch("backtest_engine.BacktestEngine.fetch_fred", fetch_frame),
+            mock.patch(
+                "src.engine.gdp_nowcast_engine.GDPCastNowEngine.fetch_measurement_adjustment",
+                lambda _engine: 0.1,
+            ),
+            mock.patch(
+                "src.engine.gdp_nowcast_engine.GDPCastNowEngine.fetch_statcan_outlook",
+                lambda _engine: (None, None),
+            ),
+            mock.patch(
+                "src.data_utils.statcan_fetcher.StatCanDataFetcher.fetch_canada_retail_sales",
+                lambda _fetcher: pd.DataFrame(),
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def builder(self, **kwargs):
+        from dashboard_snapshot import DashboardSnapshotBuilder
+
+        builder = DashboardSnapshotBuilder(output_path=self.path, **kwargs)
+        fetcher = builder.cache.fetcher
+        fetcher.fetch_fred_series = lambda sid, limit=20: fake_fred_records(sid, limit)
+        fetcher.fetch_bls_unemployment = lambda: {"value": "4.3"}
+        fetcher.fetch_boc_data = lambda: {"policy_rate": 2.75, "neutral_rate": [2.25, 3.25]}
+        return builder
+
+    def test_build_writes_sections_and_keeps_failed_ones(self):
+        with open(self.path, encoding="utf-8") as handle:
+            before = json.load(handle)
+
+        status = self.builder().build()
+
+        with open(self.path, encoding="utf-8") as handle:
+            snapshot = json.load(handle)
+        self.assertEqual(status["liveSnapshot.usGrowth"], "rebuilt")
+        self.assertEqual(status["liveSnapshot.policyStance"], "rebuilt")
+        self.assertEqual(status["backtest.us"], "rebuilt")
+        # No Canadian frames in the fixture: those sections keep their old values.
+        self.assertEqual(status["liveSnapshot.canadaGrowth"], "failed")
+        self.assertEqual(
+            snapshot["liveSnapshot"]["canadaGrowth"], before["liveSnapshot"]["canadaGrowth"]
+        )
+        self.assertEqual(snapshot["liveSnapshot"]["policyStance"]["boc"]["actualRate"], 2.75)
+        self.assertEqual(set(snapshot["backtest"]["us"]), set(before["backtest"]["us"]))
+        self.assertEqual(set(snapshot["liveSnapshot"]["usGrowth"]), set(before["liveSnapshot"]["usGrowth"]))
+
+    def test_unchanged_inputs_skip_the_section(self):
+        self.builder().build()
+        with open(self.path, encoding="utf-8") as handle:
+            first = handle.read()
+
+        builder = self.builder()
+        builder.backtest.run_expanding_window = mock.Mock(side_effect=AssertionError)
+        status = builder.build()
+
+        self.assertEqual(status["backtest.us"], "unchanged")
+        self.assertEqual(status["liveSnapshot.policyStance"], "unchanged")
+        with open(self.path, encoding="utf-8") as handle:
+            self.assertEqual(handle.read(), first)
+
+        self.frames["GDPC1"].iloc[-1, 0] *= 1.01
+        status = self.builder().build()
+
+        self.assertEqual(status["backtest.us"], "rebuilt")
+        self.assertEqual(status["liveSnapshot.usGrowth"], "rebuilt")
+        self.assertEqual(status["liveSnapshot.policyStance"], "unchanged")
+
+
+if __name__ == "__main__":
+    unittest.main()
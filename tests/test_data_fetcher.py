@@ -23,7 +23,7 @@ class MacroDataFetcherTests(unittest.TestCase):
         response.raise_for_status.return_value = None
         response.json.return_value = {"observations": observations}
 
-        with patch("src.data_utils.macro_data_fetcher.requests.get", return_value=response):
+        with patch("src.data_utils.http_metrics.requests.get", return_value=response):
             fetcher = MacroDataFetcher(fred_api_key="test-key")
             result = fetcher.fetch_fred_series("TEST", limit=8)
 
@@ -49,7 +49,7 @@ class MacroDataFetcherTests(unittest.TestCase):
 
     def test_fetch_fred_series_error_returns_empty_list(self):
         with patch(
-            "src.data_utils.macro_data_fetcher.requests.get",
+            "src.data_utils.http_metrics.requests.get",
             side_effect=RuntimeError("network down"),
         ):
             fetcher = MacroDataFetcher(fred_api_key="test-key")
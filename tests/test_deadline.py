@@ -0,0 +1,108 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from macro_fixtures import synthetic_fred_frames
+
+from src.core import deadline
+from src.data_utils.http_metrics import REGISTRY, metered_get
+
+
+class DeadlineTests(unittest.TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+        self.addCleanup(deadline.clear)
+        REGISTRY.reset()
+        self.addCleanup(REGISTRY.reset)
+
+    def slow(self, value):
+        def fetch():
+            self.release.wait(5)
+            return value
+
+        return fetch
+
+    def test_parse_duration(self):
+        self.assertEqual(deadline.parse_duration("5s"), 5.0)
+        self.assertEqual(deadline.parse_duration("250ms"), 0.25)
+        self.assertEqual(deadline.parse_duration("1.5"), 1.5)
+        self.assertEqual(deadline.parse_duration("2m"), 120.0)
+        for text in ("", "5h", "0s", "-1"):
+            with self.assertRaises(ValueError):
+                deadline.parse_duration(text)
+
+    def test_late_sources_are_skipped_at_the_deadline(self):
+        deadline.start(0.3, reserve=0.1)
+        start = time.perf_counter()
+
+        pending = deadline.schedule({"fast": lambda: 1.0, "slow": self.slow(2.0)})
+        results, skipped = pending.collect({"slow": 0.0})
+
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(results, {"fast": 1.0, "slow": 0.0})
+        self.assertEqual(skipped, ["slow"])
+
+    def test_without_deadline_every_source_is_awaited(self):
+        self.release.set()
+        results, skipped = deadline.schedule({"slow": self.slow(2.0)}).collect()
+
+        self.assertEqual((results, skipped), ({"slow": 2.0}, []))
+
+    def test_requests_in_optional_sources_are_capped_at_the_budget(self):
+        deadline.start(30, reserve=0)
+        response = Mock(status_code=200, content=b"ok")
+        with patch("src.data_utils.http_metrics.requests.get", return_value=response) as get:
+            metered_get("rss", "https://example.com/feed", timeout=10)
+            self.assertEqual(get.call_args.kwargs["timeout"], 10)
+
+            deadline.schedule(
+                {"rss": lambda: metered_get("rss", "https://example.com/feed", timeout=60)}
+            ).collect()
+            self.assertLessEqual(get.call_args.kwargs["timeout"], 30)
+
+            deadline.start(0.01, reserve=0)
+            time.sleep(0.02)
+            pending = deadline.schedule(
+                {"rss": lambda: metered_get("rss", "https://example.com/feed", timeout=10)}
+            )
+            with self.assertRaises(requests.Timeout):
+                pending.collect()
+            self.assertEqual(get.call_count, 2)
+
+        (rss,) = REGISTRY.to_json()["sources"]
+        self.assertEqual(rss["outcomes"], {"deadline": 1, "ok": 2})
+
+    def test_nowcast_report_marks_skipped_adjustments(self):
+        from src.engine.gdp_nowcast_engine import GDPCastNowEngine, format_report
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        frames = synthetic_fred_frames()
+        engine = GDPCastNowEngine("US", snapshot_path=os.path.join(tmp.name, "nowcast.json"))
+        engine.fetch_fred = lambda sid, limit=160: frames[sid].copy()
+        engine.fetch_measurement_adjustment = self.slow(0.1)
+
+        deadline.start(0.5, reserve=0.1)
+        result = engine.run_nowcast()
+
+        self.assertEqual(result["skipped"], ["newsflow"])
+        self.assertEqual(result["measurement_adjustment"], 0.0)
+        self.assertIn("**Skipped Adjustments**: RSS newsflow", format_report("US", result))
+
+
+if __name__ == "__main__":
+    unittest.main()
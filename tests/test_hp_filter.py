@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+
+from src.core.hp_filter import (
+    RealTimeHPFilter,
+    _hp_factor,
+    hp_filter,
+    one_sided_hp_filter,
+)
+
+
+def log_gdp(n=160, seed=0):
+    rng = np.random.default_rng(seed)
+    return 10.0 + np.cumsum(rng.normal(0.005, 0.01, n))
+
+
+class HPFilterTests(unittest.TestCase):
+    def test_two_sided_filter_matches_statsmodels(self):
+        from statsmodels.tsa.filters.hp_filter import hpfilter
+
+        y = pd.Series(log_gdp(), index=pd.date_range("1986-01-01", periods=160, freq="QS"))
+
+        cycle, trend = hp_filter(y, lamb=1600)
+        expected_cycle, expected_trend = hpfilter(y, lamb=1600)
+
+        np.testing.assert_allclose(trend.to_numpy(), expected_trend.to_numpy(), atol=1e-10)
+        np.testing.assert_allclose(cycle.to_numpy(), expected_cycle.to_numpy(), atol=1e-10)
+        self.assertTrue(trend.index.equals(y.index))
+
+    def test_factorisation_is_cached_per_length_and_lambda(self):
+        _hp_factor.cache_clear()
+        hp_filter(log_gdp(seed=1))
+        hp_filter(log_gdp(seed=2))
+        hp_filter(log_gdp(seed=2), lamb=100)
+
+        info = _hp_factor.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+
+    def test_one_sided_trend_equals_two_sided_endpoints(self):
+        y = log_gdp(80, seed=3)
+
+        _, trend = one_sided_hp_filter(y)
+        endpoints = np.array([hp_filter(y[: t + 1])[1][-1] for t in range(len(y))])
+
+        np.testing.assert_allclose(trend, endpoints, atol=1e-9)
+
+    def test_incremental_updates_match_a_single_pass(self):
+        y = log_gdp(60, seed=4)
+        stream = RealTimeHPFilter()
+
+        pieces = [stream.update(chunk) for chunk in np.array_split(y, [1, 2, 25, 40])]
+
+        np.testing.assert_allclose(np.concatenate(pieces), one_sided_hp_filter(y)[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+
+from src.data_utils.html_extract import find_table_row
+from src.data_utils.macro_data_fetcher import MacroDataFetcher
+
+BLS_PAGE = """<html><body><p>Employment Situation</p>
+<table><thead><tr><th>Category</th><th>Jan</th><th>Feb</th></tr></thead>
+<tbody><tr><th><p>Civilian labor force</p></th><td>170,000</td><td>171,000</td></tr>
+<tr><th>Unemployment rate</th><td>4.1</td><td>4.3<sup>(p)</sup></td></tr>
+<tr><td>Not in labor force</td><td>100</td><td>101</td></tr></tbody></table>
+</body></html>"""
+
+
+def page(text, status=200, headers=None):
+    response = Mock(status_code=status, text=text, content=text.encode(), headers=headers or {})
+    response.raise_for_status = Mock()
+    return response
+
+
+class TableRowFinderTests(unittest.TestCase):
+    def test_scan_stops_at_the_target_row(self):
+        seen = []
+
+        def match(cells):
+            seen.append(cells[0])
+            return cells[0] == "Unemployment rate"
+
+        finder = find_table_row(BLS_PAGE + "<table>" * 10000, match)
+
+        self.assertEqual(finder.row, ["Unemployment rate", "4.1", "4.3(p)"])
+        self.assertEqual(seen, ["Category", "Civilian labor force", "Unemployment rate"])
+
+    def test_search_can_be_limited_to_the_first_tables(self):
+        markup = "<table><tr><td>a</td></tr></table><table><tr><td>b</td></tr></table>"
+
+        self.assertIsNone(find_table_row(markup, lambda c: c[0] == "b", max_tables=1).row)
+        self.assertEqual(find_table_row(markup, lambda c: c[0] == "b").row, ["b"])
+
+    def test_boc_output_gap_reads_the_latest_reading(self):
+        markup = (
+            "<table><tr><td>Current MPR output gap estimate</td>"
+            "<td>Historical</td><td>Q2 -1.25%</td><td>-1.0</td><td>n/a</td><td>5</td></tr></table>"
+        )
+
+        self.assertEqual(MacroDataFetcher._boc_output_gap(markup), -1.0)
+        self.assertIsNone(MacroDataFetcher._boc_output_gap("<table></table>"))
+
+
+class ConditionalPageTests(unittest.TestCase):
+    def test_unchanged_page_is_served_from_the_extract_cache(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        responses = [
+            page(BLS_PAGE, headers={"ETag": '"v1"'}),
+            page("", status=304),
+        ]
+        with patch.dict(os.environ, {"ECONOMICS_ML_CACHE_DIR": tmp.name}):
+            fetcher = MacroDataFetcher()
+            with patch(
+                "src.data_utils.http_metrics.requests.get", side_effect=responses
+            ) as get, patch.object(
+                MacroDataFetcher, "_bls_unemployment_cell", wraps=fetcher._bls_unemployment_cell
+            ) as parse:
+                first = fetcher.fetch_bls_unemployment()
+                second = fetcher.fetch_bls_unemployment()
+
+        self.assertEqual(first["value"], "4.3(p)")
+        self.assertEqual(second, first)
+        self.assertEqual(parse.call_count, 1)
+        self.assertNotIn("If-None-Match", get.call_args_list[0].kwargs["headers"])
+        self.assertEqual(get.call_args_list[1].kwargs["headers"]["If-None-Match"], '"v1"')
+
+    def test_missing_row_is_reported_and_not_cached(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with patch.dict(os.environ, {"ECONOMICS_ML_CACHE_DIR": tmp.name}):
+            with patch(
+                "src.data_utils.http_metrics.requests.get",
+                return_value=page("<p>maintenance</p>", headers={"ETag": '"v2"'}),
+            ):
+                result = MacroDataFetcher().fetch_bls_unemployment()
+
+            self.assertEqual(result, "Error: BLS table not found.")
+            self.assertFalse(os.path.exists(os.path.join(tmp.name, "pages", "bls.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()
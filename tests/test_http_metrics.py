@@ -0,0 +1,84 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+
+from src.data_utils.http_metrics import REGISTRY, HttpMetrics
+from src.data_utils.macro_data_fetcher import MacroDataFetcher
+
+
+class HttpMetricsTests(unittest.TestCase):
+    def setUp(self):
+        REGISTRY.reset()
+        self.addCleanup(REGISTRY.reset)
+
+    def test_fetcher_calls_are_recorded_per_source_and_outcome(self):
+        response = Mock(status_code=200, content=b'{"observations": []}')
+        response.json.return_value = {"observations": [{"date": "2026-01-01", "value": "1"}]}
+        fetcher = MacroDataFetcher(fred_api_key="test-key")
+
+        with patch("src.data_utils.http_metrics.requests.get", return_value=response):
+            fetcher.fetch_fred_series("TEST")
+            fetcher.fetch_fred_series("TEST")
+        with patch(
+            "src.data_utils.http_metrics.requests.get",
+            side_effect=requests.Timeout("slow"),
+        ):
+            self.assertEqual(fetcher.fetch_fred_series("TEST"), [])
+
+        (fred,) = REGISTRY.to_json()["sources"]
+        self.assertEqual((fred["source"], fred["host"]), ("fred", "api.stlouisfed.org"))
+        self.assertEqual(fred["outcomes"], {"ok": 2, "timeout": 1})
+        self.assertEqual(fred["bytes"], 2 * len(response.content))
+
+    def test_prometheus_histogram_buckets_are_cumulative(self):
+        metrics = HttpMetrics(buckets=(0.1, 1.0))
+        metrics.observe("bls", "www.bls.gov", 0.05, 100, "ok")
+        metrics.observe("bls", "www.bls.gov", 0.5, 200, "http_error")
+        metrics.record_fallback("US", "bls_unemployment")
+
+        text = metrics.to_prometheus()
+
+        labels = 'source="bls",host="www.bls.gov"'
+        self.assertIn(f'economics_ml_http_request_duration_seconds_bucket{{{labels},le="0.1"}} 1', text)
+        self.assertIn(f'economics_ml_http_request_duration_seconds_bucket{{{labels},le="1.0"}} 2', text)
+        self.assertIn(f'economics_ml_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2', text)
+        self.assertIn(f"economics_ml_http_request_duration_seconds_count{{{labels}}} 2", text)
+        self.assertIn(f"economics_ml_http_response_bytes_total{{{labels}}} 300", text)
+        self.assertIn(
+            'economics_ml_fallbacks_total{scope="US",input="bls_unemployment"} 1', text
+        )
+
+    def test_policy_inputs_report_the_fallbacks_they_use(self):
+        from src.engine.policy_rate_engine import PolicyRateEngine
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with patch.dict(os.environ, {"ECONOMICS_ML_CACHE_DIR": tmp.name}):
+            engine = PolicyRateEngine()
+        engine.gap_ensemble.cache_directory = tmp.name
+        engine.fetcher = Mock()
+        engine.fetcher.fetch_fred_series.return_value = []
+        engine.fetcher.fetch_bls_unemployment.return_value = "Error: BLS table not found."
+
+        inputs = engine._collect_inputs(engine._spec("US"))
+
+        fallbacks = {
+            entry["input"]: entry["count"]
+            for entry in REGISTRY.to_json()["fallbacks"]
+            if entry["scope"] == "US"
+        }
+        self.assertEqual(inputs.unemployment, engine._spec("US").fallbacks["unemployment"])
+        self.assertEqual(fallbacks["bls_unemployment"], 1)
+        self.assertEqual(fallbacks["policy_rate"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
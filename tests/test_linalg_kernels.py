@@ -0,0 +1,69 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+
+from src.core.linalg_kernels import (
+    add_intercept,
+    ols,
+    ols_batched,
+    r_squared,
+    ridge,
+    ridge_batched,
+    wls,
+)
+
+
+class LinalgKernelTests(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = add_intercept(rng.normal(size=(50, 3)))
+        self.y = self.x @ np.array([0.5, 1.0, -2.0, 0.3]) + rng.normal(0, 0.1, 50)
+
+    def test_ols_matches_lstsq_for_one_and_many_right_hand_sides(self):
+        expected = np.linalg.lstsq(self.x, self.y, rcond=None)[0]
+        many = np.column_stack([self.y, 2 * self.y])
+
+        np.testing.assert_allclose(ols(self.x, self.y), expected, atol=1e-10)
+        np.testing.assert_allclose(ols(self.x, many)[:, 1], 2 * expected, atol=1e-10)
+
+    def test_ols_rank_deficient_design_returns_minimum_norm_solution(self):
+        x = np.column_stack([self.x, self.x[:, 1]])
+
+        np.testing.assert_allclose(ols(x, self.y), np.linalg.pinv(x) @ self.y, atol=1e-8)
+
+    def test_ridge_leaves_intercept_unpenalised(self):
+        penalty = np.diag([0.0, 5.0, 5.0, 5.0])
+        expected = np.linalg.solve(self.x.T @ self.x + penalty, self.x.T @ self.y)
+
+        np.testing.assert_allclose(ridge(self.x, self.y, 5.0), expected, atol=1e-10)
+
+    def test_wls_with_unit_weights_is_ols(self):
+        np.testing.assert_allclose(
+            wls(self.x, self.y, np.ones(len(self.y))), ols(self.x, self.y), atol=1e-10
+        )
+
+    def test_batched_solvers_match_per_problem_solves(self):
+        rng = np.random.default_rng(1)
+        xs = add_intercept(rng.normal(size=(20, 30, 2)))
+        ys = rng.normal(size=(20, 30))
+
+        batched = ols_batched(xs, ys)
+        ridged = ridge_batched(xs, ys, 2.0)
+
+        for b in range(20):
+            np.testing.assert_allclose(batched[b], ols(xs[b], ys[b]), atol=1e-7)
+            np.testing.assert_allclose(ridged[b], ridge(xs[b], ys[b], 2.0), atol=1e-10)
+
+    def test_r_squared(self):
+        self.assertAlmostEqual(r_squared([1.0, 2.0, 3.0], [1.0, 2.0, 3.0]), 1.0)
+        self.assertTrue(np.isnan(r_squared([1.0, 1.0], [1.0, 1.0])))
+
+
+if __name__ == "__main__":
+    unittest.main()
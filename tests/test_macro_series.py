@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from macro_fixtures import fake_fred_records
+
+from src.data_utils.macro_series import MacroSeries
+from src.engine.policy_rate_engine import PolicyRateEngine
+
+
+class MacroSeriesTests(unittest.TestCase):
+    def test_records_are_parsed_into_ascending_typed_arrays(self):
+        records = [
+            {"date": "2024-03-01", "value": "3.5"},
+            {"date": "2024-02-01", "value": "."},
+            {"date": "2024-01-01", "value": "3.1"},
+            {"date": "not a date", "value": "9"},
+            {"date": "2023-12-01", "value": "3.0"},
+        ]
+
+        series = MacroSeries.from_records(records, "DFF")
+
+        self.assertEqual(series.dates.dtype, np.dtype("datetime64[D]"))
+        self.assertEqual(series.values.dtype, np.float64)
+        self.assertEqual(series.dates.astype(str).tolist(), ["2023-12-01", "2024-01-01", "2024-03-01"])
+        self.assertEqual(series.values.tolist(), [3.0, 3.1, 3.5])
+        self.assertEqual(series.frequency, "M")
+        self.assertEqual(series.latest(), 3.5)
+        self.assertAlmostEqual(series.change(2), 0.5)
+        self.assertEqual(series.change(3, fallback=-1.0), -1.0)
+
+    def test_frequency_is_inferred_from_date_spacing(self):
+        for sid, code in (("DFF", "D"), ("ICSA", "W"), ("UNRATE", "M"), ("GDPC1", "Q")):
+            self.assertEqual(MacroSeries.from_records(fake_fred_records(sid, 40), sid).frequency, code)
+        self.assertIsNone(MacroSeries.from_records([]).frequency)
+
+    def test_policy_helpers_give_the_same_answer_for_records_and_series(self):
+        records = fake_fred_records("UNRATE", 120)
+        series = MacroSeries.from_records(records)
+
+        self.assertEqual(
+            PolicyRateEngine._latest_float(records), PolicyRateEngine._latest_float(series)
+        )
+        self.assertAlmostEqual(
+            PolicyRateEngine._recent_change(records, periods=12),
+            PolicyRateEngine._recent_change(series, periods=12),
+        )
+        legacy = pd.Series(
+            {pd.Timestamp(row["date"]): float(row["value"]) for row in records}
+        ).sort_index()
+        pd.testing.assert_series_equal(PolicyRateEngine._records_to_series(series), legacy)
+        pd.testing.assert_series_equal(PolicyRateEngine._records_to_series(records), legacy)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from macro_fixtures import synthetic_fred_frames
+
+
+class NowcastSnapshotTests(unittest.TestCase):
+    def setUp(self):
+        from src.engine.gdp_nowcast_engine import GDPCastNowEngine
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "nowcast_us.json")
+        self.frames = synthetic_fred_frames()
+        self.fetches = []
+        self.engine = GDPCastNowEngine("US", snapshot_path=self.path)
+        self.engine.fetch_fred = self._fetch
+        self.engine.fetch_measurement_adjustment = lambda: 0.1
+
+    def _fetch(self, sid, limit=160):
+        self.fetches.append(sid)
+        return self.frames[sid].copy()
+
+    def test_unchanged_inputs_reuse_the_fitted_bridge(self):
+        first = self.engine.run_nowcast()
+
+        def fail(_raw):
+            raise AssertionError("bridge should not be refitted")
+
+        self.engine._fit_bridge = fail
+        second = self.engine.run_nowcast()
+
+        self.assertEqual(first["snapshot_status"], "refit")
+        self.assertEqual(second["snapshot_status"], "fingerprint match")
+        self.assertAlmostEqual(first["calibrated_val"], second["calibrated_val"])
+        self.assertAlmostEqual(first["interval"]["upper"], second["interval"]["upper"])
+        self.assertEqual(list(first["interval"]["quantiles"]), list(second["interval"]["quantiles"]))
+
+    def test_each_run_writes_the_snapshot_at_most_once(self):
+        from src.engine import gdp_nowcast_engine
+
+        with mock.patch.object(
+            gdp_nowcast_engine, "save_snapshot", wraps=gdp_nowcast_engine.save_snapshot
+        ) as save:
+            self.engine.run_nowcast()
+            self.assertEqual(save.call_count, 1)
+            self.assertIn("live", save.call_args.args[3])
+
+            self.engine.run_nowcast()
+            self.assertEqual(save.call_count, 1)
+
+            self.engine.fetch_measurement_adjustment = lambda: 0.2
+            self.engine.run_nowcast()
+            self.assertEqual(save.call_count, 2)
+
+    def test_changed_input_fingerprint_triggers_refit(self):
+        self.engine.run_nowcast()
+        self.frames["INDPRO"].iloc[-1, 0] *= 1.01
+
+        result = self.engine.run_nowcast()
+
+        self.assertEqual(result["snapshot_status"], "refit")
+
+    def test_fresh_snapshot_answers_without_fetching(self):
+        first = self.engine.run_nowcast()
+        self.fetches.clear()
+
+        cached = self.engine.run_nowcast(max_age=3600)
+
+        self.assertEqual(self.fetches, [])
+        self.assertEqual(cached["snapshot_status"], "fresh snapshot")
+        self.assertAlmostEqual(cached["final_val"], first["final_val"])
+        self.assertIn(0.5, cached["interval"]["quantiles"])
+
+    def test_snapshot_is_versioned_compact_json(self):
+        self.engine.run_nowcast()
+
+        with open(self.path, encoding="utf-8") as handle:
+            payload = json.load(handle)
+
+        self.assertEqual(payload["version"], 1)
+        self.assertEqual(set(payload["fingerprints"]), set(self.frames))
+        for key in ("mean", "std", "loadings", "params", "ridge_beta", "data_thru"):
+            self.assertIn(key, payload["state"])
+
+        payload["version"] = 0
+        with open(self.path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        self.assertEqual(self.engine.run_nowcast()["snapshot_status"], "refit")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import sys
+import time
+import unittest
+
+import numpy as np
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+
+from src.core.modeling_core import PolicyOracle, TaylorRuleModels
+
+
+class TaylorRuleModelTests(unittest.TestCase):
+    def setUp(self):
+        self.models = TaylorRuleModels()
+
+    def test_scalar_inputs_return_plain_floats(self):
+        rate = self.models.taylor_nonlinear(0.6, 3.0, -0.5)
+
+        self.assertIsInstance(rate, float)
+        self.assertAlmostEqual(rate, 0.6 + 3.0 + 0.5 * 1.0 * 1.5 - 0.5)
+        self.assertAlmostEqual(self.models.taylor_nonlinear(0.6, 2.2, 0.0), 0.6 + 2.2 + 0.1)
+
+    def test_nonlinear_rule_broadcasts_over_every_argument(self):
+        pi = np.linspace(1.5, 4.0, 11)[:, None]
+        threshold = np.array([2.0, 2.5, 3.0])[None, :]
+
+        rates = self.models.taylor_nonlinear(0.5, pi, -0.3, threshold=threshold, stress_multiplier=2.0)
+
+        self.assertEqual(rates.shape, (11, 3))
+        for i, p in enumerate(pi[:, 0]):
+            for j, t in enumerate(threshold[0]):
+                multiplier = 2.0 if p > t else 1.0
+                expected = 0.5 + p + 0.5 * (p - 2.0) * multiplier - 0.3
+                self.assertAlmostEqual(rates[i, j], expected)
+
+    def test_post_08_and_smoothing_accept_arrays(self):
+        stress = np.array([0.0, 1.0, 2.0])
+
+        adjusted = self.models.post_08_adjusted(0.5, 2.5, 0.0, financial_stress=stress)
+        smoothed = self.models.apply_smoothing(adjusted, np.array([3.0, 3.0, 3.0]))
+
+        np.testing.assert_allclose(np.diff(adjusted), [-0.25, -0.25])
+        np.testing.assert_allclose(smoothed, 0.8 * 3.0 + 0.2 * adjusted)
+
+
+class PolicyOracleTests(unittest.TestCase):
+    def test_generate_matrix_returns_labelled_dense_grid(self):
+        surface = PolicyOracle().generate_matrix(
+            [0.3, 0.6], np.linspace(2.0, 3.0, 5), {"Okun": -1.0, "HP": 0.5}
+        )
+
+        self.assertEqual(surface.shape, (2, 2, 5))
+        self.assertEqual(surface.dims, ("r_star", "gap", "pi"))
+        self.assertEqual(surface.gap_labels, ["Okun", "HP"])
+        self.assertAlmostEqual(
+            surface.sel(r_star=0.6, gap=0.5, pi=3.0),
+            TaylorRuleModels().taylor_1999(0.6, 3.0, 0.5),
+        )
+        self.assertEqual(surface.sel(r_star=0.3).shape, (2, 5))
+
+    def test_million_cell_surface_is_fast(self):
+        oracle = PolicyOracle()
+        start = time.perf_counter()
+        surface = oracle.generate_matrix(
+            np.linspace(0, 2, 100),
+            np.linspace(0, 6, 100),
+            np.linspace(-3, 3, 100),
+            rule="taylor_nonlinear",
+        )
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(surface.values.size, 1_000_000)
+        self.assertLess(elapsed, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from macro_fixtures import fake_fred_records
+
+from src.core import output_gap
+from src.core.output_gap import (
+    OutputGapEnsemble,
+    _uc_filter,
+    baxter_king_gap,
+    hamilton_gap,
+    okun_gap,
+)
+from src.engine.policy_rate_engine import PolicyRateEngine
+
+
+def series(series_id, limit):
+    return PolicyRateEngine._records_to_series(fake_fred_records(series_id, limit))
+
+
+class OutputGapEstimatorTests(unittest.TestCase):
+    def setUp(self):
+        self.log_gdp = np.log(series("GDPC1", 100)) * 100
+
+    def test_baxter_king_matches_statsmodels_away_from_the_ends(self):
+        from statsmodels.tsa.filters.bk_filter import bkfilter
+
+        expected = bkfilter(self.log_gdp.to_numpy(), 6, 32, 12)
+        result = baxter_king_gap(self.log_gdp)
+
+        self.assertEqual(len(result), len(self.log_gdp))
+        np.testing.assert_allclose(result.to_numpy()[12:-12], expected, atol=1e-9)
+
+    def test_hamilton_residuals_are_orthogonal_to_the_lags(self):
+        gap = hamilton_gap(self.log_gdp, h=8, p=4)
+        y = self.log_gdp.to_numpy()
+
+        self.assertEqual(gap.index[-1], self.log_gdp.index[-1])
+        self.assertEqual(len(gap), len(y) - 8 - 3)
+        lag0 = y[3 : len(y) - 8]
+        self.assertAlmostEqual(float(gap.sum()), 0.0, places=8)
+        self.assertAlmostEqual(float(gap.to_numpy() @ lag0) / len(gap), 0.0, places=6)
+
+    def test_uc_smoother_matches_statsmodels_state_space(self):
+        import statsmodels.api as sm
+
+        params = np.array([np.log(0.08), np.log(0.6), np.arctanh(0.9), np.arctanh(-0.5)])
+        r1, r2 = np.tanh(params[2:])
+        model = sm.tsa.UnobservedComponents(
+            self.log_gdp.to_numpy(), level="smooth trend", autoregressive=2
+        )
+        expected = model.smooth(
+            [1e-12, np.exp(params[0]) ** 2, np.exp(params[1]) ** 2, r1 * (1 - r2), r2]
+        ).autoregressive.smoothed
+
+        # The two diffuse initialisations differ slightly over the first decade.
+        np.testing.assert_allclose(
+            _uc_filter(self.log_gdp.to_numpy(), params, smooth=True)[40:],
+            expected[40:],
+            atol=1e-4,
+        )
+
+    def test_okun_uses_published_natural_rate_as_of_each_month(self):
+        index = pd.date_range("2024-01-01", periods=6, freq="MS")
+        unemployment = pd.Series([4.0, 4.1, 4.2, 4.3, 4.4, 4.5], index=index)
+        natural = pd.Series([4.0, 4.2], index=pd.DatetimeIndex(["2024-01-01", "2024-04-01"]))
+
+        gap = okun_gap(unemployment, natural)
+
+        np.testing.assert_allclose(gap.to_numpy(), [0.0, -0.2, -0.4, -0.2, -0.4, -0.6])
+
+
+class OutputGapEnsembleTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.inputs = {
+            "gdp": series("GDPC1", 100),
+            "unemployment": series("UNRATE", 220),
+            "natural_rate": series("NROU", 80),
+            "capacity": series("TCU", 240),
+        }
+
+    def test_vintage_is_estimated_once_then_served_from_cache(self):
+        ensemble = OutputGapEnsemble(cache_directory=self.tmp.name)
+        first = ensemble.estimate(**self.inputs)
+
+        self.assertEqual(
+            list(first.latest), ["okun", "hp", "hamilton", "baxter_king", "uc", "caputil"]
+        )
+        self.assertGreaterEqual(first.spread, 0.0)
+        self.assertIs(ensemble.estimate(**self.inputs), first)
+
+        # A new process reads the stored vintage instead of re-fitting.
+        with mock.patch.object(output_gap, "uc_trend_gap", side_effect=AssertionError):
+            restored = OutputGapEnsemble(cache_directory=self.tmp.name).estimate(**self.inputs)
+        self.assertEqual(restored.latest, first.latest)
+
+        self.inputs["gdp"] = self.inputs["gdp"].iloc[:-1]
+        self.assertNotEqual(ensemble.estimate(**self.inputs).vintage, first.vintage)
+
+    def test_snapshot_directory_keeps_only_the_newest_vintages(self):
+        ensemble = OutputGapEnsemble(cache_directory=self.tmp.name, memory_size=2)
+        gdp = self.inputs["gdp"].iloc[-30:]
+
+        vintages = [ensemble.estimate(gdp=gdp.iloc[: len(gdp) - lag]).vintage for lag in range(3)]
+
+        self.assertEqual(
+            sorted(os.listdir(self.tmp.name)), sorted(f"{v}.json" for v in vintages[1:])
+        )
+
+    def test_short_histories_leave_out_estimators(self):
+        ensemble = OutputGapEnsemble(cache_directory=self.tmp.name)
+
+        estimates = ensemble.estimate(gdp=self.inputs["gdp"].iloc[-30:])
+
+        self.assertEqual(list(estimates.latest), ["hp", "hamilton"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import sys
+import threading
+import unittest
+
+import pandas as pd
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from macro_fixtures import synthetic_fred_frames
+
+from src.core.pipeline_graph import PipelineGraph, value_fingerprint
+
+
+class PipelineGraphTests(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        graph = PipelineGraph()
+        graph.input("a")
+        graph.input("b")
+        graph.node("sign", self.track("sign", lambda a: a > 0), ["a"], cutoff=True)
+        graph.node("left", self.track("left", lambda sign: "pos" if sign else "neg"), ["sign"])
+        graph.node("right", self.track("right", lambda b: b * 2), ["b"])
+        graph.node("both", self.track("both", lambda left, right: f"{left}:{right}"), ["left", "right"])
+        self.graph = graph
+
+    def track(self, name, fn):
+        def wrapped(*args):
+            self.calls.append(name)
+            return fn(*args)
+
+        return wrapped
+
+    def test_only_nodes_downstream_of_changed_inputs_rerun(self):
+        self.assertEqual(self.graph.run({"a": 1, "b": 2})["both"], "pos:4")
+        self.calls.clear()
+
+        self.assertEqual(self.graph.run({"a": 1, "b": 3})["both"], "pos:6")
+        self.assertEqual(sorted(self.calls), ["both", "right"])
+        self.assertEqual(self.graph.status["left"], "memo")
+
+    def test_unchanged_cutoff_output_stops_propagation(self):
+        self.graph.run({"a": 1, "b": 2})
+        self.calls.clear()
+
+        self.graph.run({"a": 5, "b": 2})
+
+        self.assertEqual(self.calls, ["sign"])
+
+    def test_independent_nodes_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        graph = PipelineGraph(max_workers=2)
+        graph.input("x")
+        graph.node("p", lambda x: barrier.wait() + x, ["x"])
+        graph.node("q", lambda x: barrier.wait() + x, ["x"])
+
+        values = graph.run({"x": 10}, targets=["p", "q"])
+
+        self.assertEqual(sorted([values["p"], values["q"]]), [10, 11])
+
+    def test_failure_is_raised_and_not_memoised(self):
+        graph = PipelineGraph()
+        graph.input("x")
+        graph.node("div", lambda x: 1 / x, ["x"])
+        graph.node("after", self.track("after", lambda div: div), ["div"])
+
+        with self.assertRaises(ZeroDivisionError):
+            graph.run({"x": 0})
+        self.assertEqual(graph.status["div"], "failed")
+        self.assertEqual(self.calls, [])
+        self.assertEqual(graph.run({"x": 4})["after"], 0.25)
+
+    def test_frames_are_fingerprinted_by_content(self):
+        frame = pd.DataFrame({"value": [1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=2))
+
+        self.assertEqual(value_fingerprint({"f": frame}), value_fingerprint({"f": frame.copy()}))
+        changed = frame.copy()
+        changed.iloc[-1, 0] = 2.5
+        self.assertNotEqual(value_fingerprint(frame), value_fingerprint(changed))
+
+
+class NowcastPipelineTests(unittest.TestCase):
+    def test_gdp_revision_reuses_the_indicator_factor(self):
+        from src.engine.gdp_nowcast_engine import GDPCastNowEngine
+
+        frames = synthetic_fred_frames()
+        engine = GDPCastNowEngine("US")
+        first = engine._fit_bridge(frames)
+
+        frames["GDPC1"].iloc[-1, 0] *= 1.01
+        second = engine._fit_bridge(frames)
+
+        status = engine.pipeline.status
+        self.assertEqual((status["panel"], status["factor"]), ("memo", "memo"))
+        self.assertEqual(status["bridge"], "computed")
+        self.assertEqual(first["loadings"], second["loadings"])
+        self.assertNotEqual(first["params"], second["params"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from macro_fixtures import fake_fred_records
+
+from policy_backtest_engine import LAYERS, PolicyBacktestEngine
+from src.engine.policy_rate_engine import PolicyRateEngine
+
+
+def offline_raw(backtest, country):
+    policy = PolicyRateEngine()
+    policy.fetcher.fetch_fred_series = lambda sid, limit=20: fake_fred_records(sid, limit)
+    return backtest._fetch_raw(country, policy)
+
+
+class PolicyBacktestTests(unittest.TestCase):
+    def test_decision_calendar_has_eight_meetings_a_year(self):
+        backtest = PolicyBacktestEngine()
+
+        for country in ("US", "Canada"):
+            dates = backtest.decision_dates(country, "2023-01-01", "2023-12-31")
+            self.assertEqual(len(dates), 8)
+            self.assertTrue((dates.dayofweek == 2).all())
+
+    def test_inputs_are_filtered_by_publication_lag(self):
+        backtest = PolicyBacktestEngine()
+        index = pd.date_range("2024-01-01", periods=6, freq="MS")
+        series = pd.Series(np.arange(6.0), index=index)
+
+        # March PCE (lag 30 days after month end) is not out by 15 April.
+        filtered = backtest._as_of("US", "price", series, pd.Timestamp("2024-04-15"))
+
+        self.assertEqual(filtered.index[-1], pd.Timestamp("2024-02-01"))
+
+    def test_parallel_blocks_match_serial_run(self):
+        serial = PolicyBacktestEngine(max_workers=1)
+        raw = offline_raw(serial, "US")
+
+        expected = serial.run_backtest("US", start="2022-01-01", raw=raw)
+        result = PolicyBacktestEngine(max_workers=2).run_backtest(
+            "US", start="2022-01-01", raw=raw
+        )
+
+        pd.testing.assert_frame_equal(result["df"], expected["df"])
+        self.assertLess(result["df"]["Data_Through"].sub(result["df"].index).max(), pd.Timedelta(0))
+
+    def test_layer_statistics_score_every_rule_layer(self):
+        backtest = PolicyBacktestEngine(max_workers=1)
+        results = backtest.run_backtest(
+            "Canada", start="2023-01-01", raw=offline_raw(backtest, "Canada")
+        )
+
+        self.assertEqual(set(results["stats"]), set(LAYERS))
+        for stats in results["stats"].values():
+            self.assertGreaterEqual(stats["hit_rate"], 0.0)
+            self.assertLessEqual(stats["hit_rate"], 1.0)
+            self.assertGreaterEqual(stats["rmse_bps"], stats["mae_bps"])
+        self.assertIn("Bank of Canada decisions", backtest.format_report(results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from macro_fixtures import fake_fred_records
+
+from src.core.policy_simulation import (
+    PolicyRateSimulator,
+    StreamingHistogram,
+    summarize_position,
+)
+
+
+class PolicySimulationTests(unittest.TestCase):
+    def test_streaming_histogram_quantiles_match_exact_quantiles(self):
+        values = np.random.default_rng(0).normal(1.0, 2.0, 200_000)
+        hist = StreamingHistogram(-15, 17, bins=4000)
+        for chunk in np.array_split(values, 7):
+            hist.add(chunk)
+
+        np.testing.assert_allclose(
+            hist.quantile([0.025, 0.5, 0.975]),
+            np.quantile(values, [0.025, 0.5, 0.975]),
+            atol=0.01,
+        )
+        self.assertAlmostEqual(hist.mean, values.mean())
+        self.assertAlmostEqual(hist.cdf(1.0), (values <= 1.0).mean(), places=2)
+
+    def test_million_draws_within_sub_second_budget(self):
+        simulator = PolicyRateSimulator(n_draws=1_000_000, chunk_size=125_000, seed=1)
+
+        start = time.perf_counter()
+        result = simulator.simulate(
+            r_star=("uniform", 0.3, 0.9),
+            pi=("normal", 2.8, 0.2),
+            gaps={"okun": ("normal", -0.4, 0.5), "hp": ("normal", 0.3, 0.5)},
+        )
+        elapsed = time.perf_counter() - start
+
+        quantiles = list(result["variants"]["nonlinear"]["quantiles"].values())
+        self.assertEqual(result["n_draws"], 1_000_000)
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(quantiles, sorted(quantiles))
+        expected_median = 0.6 + 2.8 + 0.5 * 0.8 * 1.5 - 0.05
+        self.assertAlmostEqual(quantiles[3], expected_median, delta=0.05)
+
+    def test_policy_report_uses_simulated_interval(self):
+        from src.engine.policy_rate_engine import PolicyRateEngine
+
+        simulation = PolicyRateSimulator(n_draws=200_000, chunk_size=50_000, seed=2).simulate(
+            r_star=("uniform", 0.3, 0.9),
+            pi=("normal", 2.8, 0.2),
+            gaps={"okun": ("normal", -0.4, 0.5)},
+        )
+        position = summarize_position(simulation, 3.6)
+
+        report = PolicyRateEngine()._write_economist_report(
+            country="US",
+            title="Federal Reserve",
+            pi=2.8,
+            gap=-0.4,
+            rate=3.6,
+            rec_rate=3.6,
+            gap_bps=0,
+            threshold=2.5,
+            premium=0,
+            simulation=simulation,
+        )
+
+        self.assertIn("Monte Carlo, 200,000 draws", report)
+        self.assertIn(f"Z-Score approx {position['z_score']:.1f}", report)
+        self.assertNotIn("approximately **[", report)
+
+    def test_chart_draws_fan_bands(self):
+        from src.core.visual_oracle import plot_taylor_sensitivity
+
+        from src.core.chart_renderer import ChartRenderer
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "chart.png")
+            future = plot_taylor_sensitivity(
+                "Test",
+                2.8,
+                {"Okun": -0.4, "HP": 0.3},
+                0.6,
+                [0.3, 0.9],
+                3.6,
+                output_filename=path,
+                fan_offsets={0.05: -1.0, 0.25: -0.4, 0.75: 0.4, 0.95: 1.0},
+                renderer=ChartRenderer(cache_directory=tmp),
+            )
+            self.assertEqual(future.result(timeout=30), path)
+            self.assertGreater(os.path.getsize(path), 0)
+
+    def test_generate_analysis_end_to_end_with_offline_data(self):
+        from src.engine.policy_rate_engine import PolicyRateEngine
+
+        engine = PolicyRateEngine()
+        engine.fetcher.fetch_fred_series = lambda sid, limit=20: fake_fred_records(sid, limit)
+        engine.fetcher.fetch_bls_unemployment = lambda: {"value": "4.3"}
+        engine.fetcher.fetch_boc_data = lambda: {}
+        engine.simulator = PolicyRateSimulator(n_draws=100_000, chunk_size=50_000, seed=3)
+
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                with mock.patch.dict(os.environ, {"ECONOMICS_ML_CACHE_DIR": tmp}):
+                    result = engine.generate_analysis("US")
+                    result["chart"].result(timeout=30)
+            finally:
+                os.chdir(cwd)
+
+        self.assertIn("Monte Carlo, 100,000 draws", result["report"])
+
+
+if __name__ == "__main__":
+    unittest.main()
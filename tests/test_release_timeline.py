@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+
+import pandas as pd
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from macro_fixtures import synthetic_fred_frames
+
+
+class ReleaseTimelineTests(unittest.TestCase):
+    def setUp(self):
+        from backtest_engine import BacktestEngine
+
+        frames = synthetic_fred_frames(n_months=200)
+        self.engine = BacktestEngine()
+        self.engine.fetch_fred = lambda sid, limit=1000: frames.get(sid, pd.DataFrame()).copy()
+        self.engine.countries["US"]["aux_indicators"] = {}
+        self.bundle = self.engine.prepare_data("US")
+
+    def test_release_calendar_uses_configured_lags(self):
+        df_m = pd.DataFrame(
+            {"Fast": [1.0, 2.0], "Slow": [3.0, 4.0]},
+            index=pd.to_datetime(["2026-01-01", "2026-02-01"]),
+        )
+
+        events = self.engine._release_calendar(
+            df_m,
+            {"Fast": 5, "Slow": 40},
+            pd.Timestamp("2026-01-31"),
+            pd.Timestamp("2026-03-10"),
+        )
+
+        self.assertEqual(
+            [(d.strftime("%Y-%m-%d"), col) for d, col, _ in events],
+            [("2026-02-05", "Fast"), ("2026-03-05", "Fast")],
+        )
+
+    def test_timeline_ends_at_the_full_as_of_nowcast(self):
+        target = pd.Timestamp("2027-04-01")
+        timeline = self.engine.run_release_timeline("US", quarter=target, data_bundle=self.bundle)
+
+        release_lags = self.engine.countries["US"]["release_lags"]
+        as_of = target + pd.Timedelta(days=self.engine.backtest_as_of_day)
+        df_m = self.engine._filter_by_release_lag(self.bundle["indicators"], as_of, release_lags)
+        df_m = df_m.dropna(axis=1, thresh=12)
+        for col in df_m.columns:
+            df_m[col] = self.engine.nowcast_missing(df_m[col])
+        direct = self.engine._bridge_nowcast(
+            "US", self.engine._extract_factor(df_m), self.bundle["gdp"], target
+        )
+
+        self.assertEqual(timeline.attrs["target_quarter"], "2027 Q2")
+        self.assertTrue(timeline["Release_Date"].is_monotonic_increasing)
+        self.assertAlmostEqual(timeline["Nowcast"].iloc[-1], direct["pred"], places=8)
+        self.assertIn("Release Timeline", self.engine.format_timeline_report("US", timeline))
+
+
+if __name__ == "__main__":
+    unittest.main()
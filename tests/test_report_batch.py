@@ -0,0 +1,93 @@
+import collections
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from macro_fixtures import fake_fred_records
+
+
+class ReportBatchTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.addCleanup(os.chdir, cwd)
+
+        for patcher in (
+            mock.patch.dict(os.environ, {"ECONOMICS_ML_CACHE_DIR": self.tmp.name}),
+            mock.patch(
+                "src.engine.gdp_nowcast_engine.GDPCastNowEngine.fetch_measurement_adjustment",
+                lambda _engine: 0.1,
+            ),
+            mock.patch(
+                "src.engine.gdp_nowcast_engine.GDPCastNowEngine.fetch_statcan_outlook",
+                lambda _engine: (None, None),
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def batch(self, **kwargs):
+        from report_batch import ReportBatch
+
+        batch = ReportBatch(**kwargs)
+        self.calls = collections.Counter()
+        lock = threading.Lock()
+
+        def fetch(sid, limit=20):
+            with lock:
+                self.calls[sid] += 1
+            return fake_fred_records(sid, limit)
+
+        fetcher = batch.cache.fetcher
+        fetcher.fetch_fred_series = fetch
+        fetcher.fetch_bls_unemployment = lambda: {"value": "4.3"}
+        fetcher.fetch_boc_data = lambda: {"policy_rate": 2.75, "neutral_rate": [2.25, 3.25]}
+        return batch
+
+    def test_every_report_is_built_with_each_series_fetched_once(self):
+        from report_batch import ReportBatch
+
+        batch = self.batch()
+        reports = batch.run()
+
+        self.assertEqual(
+            list(reports),
+            [("policy", "US"), ("policy", "Canada"), ("gdp", "US"), ("gdp", "Canada")],
+        )
+        for report in reports.values():
+            self.assertNotIn("[ERROR]", report)
+        # Shared between the policy and GDP jobs, yet downloaded once.
+        for sid in ("UNRATE", "GDPC1", "LRHUTTTTCAM156S", "NGDPRSAXDCCAQ"):
+            self.assertEqual(self.calls[sid], 1, sid)
+        self.assertEqual(max(self.calls.values()), 1)
+
+        paths = ReportBatch.write(reports, os.path.join(self.tmp.name, "reports"))
+        self.assertEqual(
+            sorted(os.path.basename(path) for path in paths),
+            ["gdp_canada.md", "gdp_us.md", "policy_canada.md", "policy_us.md"],
+        )
+
+    def test_a_failing_job_does_not_stop_the_others(self):
+        batch = self.batch(countries=("US",), tasks=("gdp", "policy"))
+        batch.nowcasts["US"].run_nowcast = mock.Mock(side_effect=RuntimeError("no data"))
+
+        reports = batch.run()
+
+        self.assertEqual(reports[("gdp", "US")], "[ERROR] gdp US: no data")
+        self.assertIn("Federal Reserve", reports[("policy", "US")])
+
+
+if __name__ == "__main__":
+    unittest.main()
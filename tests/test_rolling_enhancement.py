@@ -0,0 +1,86 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+
+from src.core.rolling_enhancement import RunningNormalEquations, enhanced_rate_history
+
+FEATURES = [
+    "activity_gap",
+    "inflation_pressure",
+    "financial_conditions",
+    "external_pressure",
+    "labor_cooling",
+]
+
+
+def calibration_frame(n_months=120, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2010-01-01", periods=n_months, freq="MS")
+    frame = pd.DataFrame(rng.normal(size=(n_months, 5)), index=index, columns=FEATURES)
+    frame["external_pressure"] = 0.0
+    frame.insert(
+        0,
+        "target_adjustment",
+        frame.to_numpy() @ np.array([0.3, -0.2, 0.1, 0.0, 0.05])
+        + rng.normal(0, 0.3, n_months),
+    )
+    base = pd.Series(rng.normal(3.0, 1.0, n_months), index=index)
+    return frame, base
+
+
+class RollingEnhancementTests(unittest.TestCase):
+    def test_running_moments_match_standardised_regression(self):
+        rng = np.random.default_rng(1)
+        x = rng.normal(5.0, 2.0, size=(40, 3))
+        y = x @ np.array([0.5, -1.0, 0.2]) + rng.normal(size=40)
+        moments = RunningNormalEquations(3)
+        for row, target in zip(x, y):
+            moments.add(row, target)
+
+        x_mean, y_mean, slopes = moments.solve()
+        z = (x - x.mean(axis=0)) / x.std(axis=0)
+        beta = np.linalg.lstsq(np.column_stack([np.ones(40), z]), y, rcond=None)[0]
+
+        self.assertAlmostEqual(y_mean, beta[0])
+        np.testing.assert_allclose(slopes * x.std(axis=0), beta[1:], atol=1e-10)
+
+    def test_expanding_history_matches_point_in_time_refits(self):
+        from src.engine.policy_rate_engine import PolicyRateEngine
+
+        frame, base = calibration_frame()
+        history = enhanced_rate_history(base, frame)
+
+        self.assertEqual(history.index[0], frame.index[len(FEATURES) + 2])
+        for t in (7, 60, 119):
+            rate, parts = PolicyRateEngine._data_enhanced_taylor_rate(
+                base.iloc[t], frame.iloc[t][FEATURES].to_dict(), frame.iloc[:t]
+            )
+            row = history.loc[frame.index[t]]
+            self.assertAlmostEqual(row["enhanced_rate"], rate)
+            self.assertAlmostEqual(row["intercept"], parts["intercept"])
+            for col in FEATURES:
+                self.assertAlmostEqual(row[col], parts[col])
+
+    def test_rolling_window_drops_old_months(self):
+        from src.engine.policy_rate_engine import PolicyRateEngine
+
+        frame, base = calibration_frame(seed=2)
+        history = enhanced_rate_history(base, frame, window=36)
+
+        t = 100
+        rate, _ = PolicyRateEngine._data_enhanced_taylor_rate(
+            base.iloc[t], frame.iloc[t][FEATURES].to_dict(), frame.iloc[t - 36 : t]
+        )
+        self.assertAlmostEqual(history.loc[frame.index[t], "enhanced_rate"], rate)
+        self.assertEqual(history["n"].max(), 36)
+
+
+if __name__ == "__main__":
+    unittest.main()
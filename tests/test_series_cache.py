@@ -0,0 +1,123 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from macro_fixtures import fake_fred_records
+
+from src.core.policy_results import PolicyAnalysis
+from src.data_utils.series_cache import SharedSeriesCache
+
+
+class CountingFetcher:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def fetch_fred_series(self, series_id, limit=20):
+        with self._lock:
+            self.calls.append((series_id, limit))
+        time.sleep(self.delay)
+        return fake_fred_records(series_id, limit)
+
+    def fetch_bls_unemployment(self):
+        self.calls.append(("BLS", None))
+        return {"value": "4.3"}
+
+    def fetch_boc_data(self):
+        self.calls.append(("BOC", None))
+        return {"policy_rate": 2.75, "neutral_rate": [2.25, 3.25]}
+
+
+class SharedSeriesCacheTests(unittest.TestCase):
+    def test_concurrent_requests_share_one_download(self):
+        fetcher = CountingFetcher(delay=0.05)
+        cache = SharedSeriesCache(fetcher)
+
+        threads = [
+            threading.Thread(target=cache.fetch_fred_series, args=("UNRATE", 20))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(fetcher.calls, [("UNRATE", 20)])
+
+    def test_smaller_limits_are_sliced_from_the_largest_fetch(self):
+        fetcher = CountingFetcher()
+        cache = SharedSeriesCache(fetcher)
+
+        long = cache.fetch_fred_series("UNRATE", limit=120)
+        short = cache.fetch_fred_series("UNRATE", limit=5)
+        longer = cache.fetch_fred_series("UNRATE", limit=200)
+
+        self.assertEqual(short, long[:5])
+        self.assertEqual(short, fake_fred_records("UNRATE", 5))
+        self.assertEqual(len(longer), 200)
+        self.assertEqual(fetcher.calls, [("UNRATE", 120), ("UNRATE", 200)])
+
+    def test_empty_results_are_not_cached(self):
+        fetcher = CountingFetcher()
+        fetcher.fetch_fred_series = lambda sid, limit=20: fetcher.calls.append(sid) or []
+        cache = SharedSeriesCache(fetcher)
+
+        self.assertEqual(cache.fetch_fred_series("DFF", 5), [])
+        self.assertEqual(cache.fetch_fred_series("DFF", 5), [])
+        self.assertEqual(fetcher.calls, ["DFF", "DFF"])
+
+
+class AnalyzeManyTests(unittest.TestCase):
+    def test_batch_returns_typed_results_from_one_fetch_per_series(self):
+        from src.engine.policy_rate_engine import PolicyRateEngine
+
+        engine = PolicyRateEngine()
+        fetcher = CountingFetcher()
+        engine.fetcher = SharedSeriesCache(fetcher)
+
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                with mock.patch.dict(os.environ, {"ECONOMICS_ML_CACHE_DIR": tmp}):
+                    results = engine.analyze_many(["US", "Canada"])
+                    for analysis in results.values():
+                        analysis.chart.result(timeout=30)
+            finally:
+                os.chdir(cwd)
+
+        self.assertEqual(list(results), ["US", "Canada"])
+        series_ids = [sid for sid, _limit in fetcher.calls]
+        self.assertEqual(len(series_ids), len(set(series_ids)))
+        for country, analysis in results.items():
+            self.assertIsInstance(analysis, PolicyAnalysis)
+            self.assertEqual(analysis.inputs.country, country)
+            self.assertLessEqual({"okun", "hp", "hamilton", "uc", "caputil"}, set(analysis.inputs.gaps))
+            self.assertAlmostEqual(
+                analysis.enhanced_rate - analysis.base_rate, analysis.contributions["total"]
+            )
+            self.assertIn(f"**Policy Stance:** {analysis.stance}", analysis.report)
+            self.assertEqual(analysis.summary()["stance"], analysis.stance)
+        self.assertEqual(results["Canada"].inputs.actual_rate, 2.75)
+
+    def test_unknown_central_bank_is_rejected(self):
+        from src.engine.policy_rate_engine import PolicyRateEngine
+
+        with self.assertRaises(ValueError):
+            PolicyRateEngine().analyze_many(["US", "ECB"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+HEAVY_MODULES = (
+    "pandas",
+    "numpy",
+    "statsmodels",
+    "scipy",
+    "matplotlib",
+    "bs4",
+    "requests",
+    "pytz",
+)
+
+# Wall-clock ceiling for `main.py --help`, in seconds. Interpreter start-up is
+# ~0.05 s and pandas alone costs ~0.4 s, so an eager scientific import in the
+# CLI path blows through this budget on any reasonable machine.
+STARTUP_BUDGET = float(os.getenv("ECONOMICS_ML_STARTUP_BUDGET", "0.6"))
+
+
+def _run(args, env=None):
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=SKILL_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env=env,
+    )
+
+
+class StartupTests(unittest.TestCase):
+    def test_importing_main_loads_no_heavy_dependencies(self):
+        probe = (
+            "import sys, main; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        result = _run(["-c", probe])
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_importing_main_does_not_rewrap_stdout(self):
+        probe = "import sys; before = sys.stdout; import main; print(sys.stdout is before)"
+        result = _run(["-c", probe])
+
+        self.assertEqual(result.stdout.strip(), "True")
+
+    def test_help_startup_time_within_budget(self):
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            result = _run(["main.py", "--help"])
+            timings.append(time.perf_counter() - start)
+            self.assertEqual(result.returncode, 0, result.stderr)
+
+        self.assertLess(min(timings), STARTUP_BUDGET, f"--help timings: {timings}")
+
+    def test_fresh_gdp_snapshot_is_answered_without_the_engine(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(os.environ, ECONOMICS_ML_CACHE_DIR=tmp)
+            seed = (
+                f"import sys; sys.path[:0] = [{SKILL_ROOT!r}, {TESTS_ROOT!r}]; "
+                "from macro_fixtures import synthetic_fred_frames; "
+                "from src.engine.gdp_nowcast_engine import GDPCastNowEngine; "
+                "frames = synthetic_fred_frames(); engine = GDPCastNowEngine('US'); "
+                "engine.fetch_fred = lambda sid, limit=160: frames[sid].copy(); "
+                "engine.fetch_measurement_adjustment = lambda: 0.0; engine.run_nowcast()"
+            )
+            self.assertEqual(_run(["-c", seed], env).returncode, 0)
+
+            probe = (
+                "import runpy, sys; sys.argv = ['main.py', 'gdp', '--max-age', '3600']; "
+                "runpy.run_path('main.py', run_name='__main__'); "
+                f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules and m != 'pytz'), "
+                "file=sys.stderr)"
+            )
+            result = _run(["-c", probe], env)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("**Model State**: fresh snapshot", result.stdout)
+        self.assertEqual(result.stderr.strip(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
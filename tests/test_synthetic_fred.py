@@ -0,0 +1,116 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import requests
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+
+from src.data_utils.macro_data_fetcher import MacroDataFetcher
+from src.data_utils.synthetic_fred import FredStubServer, SyntheticUniverse
+from src.engine.gdp_nowcast_engine import GDPCastNowEngine
+
+
+class SyntheticUniverseTests(unittest.TestCase):
+    def test_generation_is_deterministic_per_seed(self):
+        first = SyntheticUniverse(n_indicators=3, years=20).observations("SYN0002")
+        again = SyntheticUniverse(n_indicators=3, years=20).observations("SYN0002")
+        other = SyntheticUniverse(n_indicators=3, years=20, seed=1).observations("SYN0002")
+
+        self.assertEqual(first, again)
+        self.assertNotEqual(first["observations"], other["observations"])
+        with self.assertRaises(KeyError):
+            SyntheticUniverse(n_indicators=3, years=20).series("SYN0004")
+
+    def test_series_stay_in_plausible_ranges(self):
+        universe = SyntheticUniverse(n_indicators=5, years=30)
+        ranges = {"UNRATE": (2.0, 15.0), "TCU": (55.0, 100.0), "NROU": (3.0, 7.5), "DFF": (0.0, 20.0)}
+        for sid, (lower, upper) in ranges.items():
+            values = universe.series(sid).final
+            values = values[~np.isnan(values)]
+            self.assertGreaterEqual(values.min(), lower, sid)
+            self.assertLessEqual(values.max(), upper, sid)
+
+        for sid in ("GDPC1", "PAYEMS", "PCEPILFE", "DSPIC96", *universe.indicators):
+            series = universe.series(sid)
+            keep = ~np.isnan(series.final)
+            years = (series.dates[keep][-1] - series.dates[keep][0]).astype(int) / 365.25
+            growth = np.log(series.final[keep][-1] / series.final[keep][0]) / years * 100
+            drift = universe.catalog[sid][3][1]
+            self.assertGreater(growth, 0.0, sid)
+            self.assertLess(abs(growth - drift), 1.5, sid)
+
+    def test_ragged_edge_and_revised_vintages(self):
+        universe = SyntheticUniverse(years=20, end="2026-06-01", today="2026-07-10")
+
+        latest = {
+            sid: universe.observations(sid, sort_order="desc", limit=1)["observations"][0]["date"]
+            for sid in ("PAYEMS", "PCEC96", "GDPC1")
+        }
+        self.assertEqual(latest, {"PAYEMS": "2026-06-01", "PCEC96": "2026-05-01", "GDPC1": "2026-01-01"})
+
+        vintages = universe.observations(
+            "PAYEMS", observation_start="2026-04-01", realtime_start="1776-07-04", realtime_end="9999-12-31"
+        )["observations"]
+        april = [row for row in vintages if row["date"] == "2026-04-01"]
+        self.assertEqual([row["realtime_start"] for row in april], ["2026-05-07", "2026-06-06"])
+        self.assertEqual(april[0]["realtime_end"], "2026-06-05")
+        self.assertNotEqual(april[0]["value"], april[1]["value"])
+
+        as_of = universe.observations("PAYEMS", realtime_start="2026-05-20", sort_order="desc")
+        self.assertEqual(as_of["observations"][0]["date"], "2026-04-01")
+        self.assertEqual(as_of["observations"][0]["value"], april[0]["value"])
+
+
+class FredStubServerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.universe = SyntheticUniverse(n_indicators=4, years=30)
+        cls.server = FredStubServer(cls.universe).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_fetcher_reads_the_stub_through_fred_base_url(self):
+        with patch.dict(os.environ, {"FRED_BASE_URL": self.server.base_url, "FRED_API_KEY": "test"}):
+            series = MacroDataFetcher().fetch_series("UNRATE", limit=24)
+
+        expected = self.universe.observations("UNRATE", sort_order="desc", limit=24)
+        self.assertEqual(len(series), 24)
+        self.assertEqual(series.frequency, "M")
+        self.assertEqual(str(series.dates[-1]), expected["observations"][0]["date"])
+
+    def test_errors_follow_the_fred_contract(self):
+        url = f"{self.server.base_url}/series/observations"
+        unknown = requests.get(url, params={"series_id": "NOPE", "api_key": "k", "file_type": "json"})
+        no_key = requests.get(url, params={"series_id": "DFF", "file_type": "json"})
+
+        self.assertEqual(unknown.status_code, 400)
+        self.assertIn("does not exist", unknown.json()["error_message"])
+        self.assertEqual(no_key.status_code, 400)
+
+    def test_nowcast_runs_end_to_end_on_synthetic_indicators(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = {"FRED_BASE_URL": self.server.base_url, "ECONOMICS_ML_CACHE_DIR": tmp.name}
+        with patch.dict(os.environ, env), patch(
+            "src.engine.gdp_nowcast_engine.FRED_API_KEY", "test"
+        ):
+            engine = GDPCastNowEngine("US")
+            engine.indicators.update({sid: sid for sid in self.universe.indicators})
+            engine.pipeline = engine._build_pipeline()
+            engine.fetch_measurement_adjustment = lambda: 0.0
+            result = engine.run_nowcast()
+
+        self.assertTrue(np.isfinite(result["calibrated_val"]))
+        self.assertEqual(result["target_q"], "2026 Q2")
+
+
+if __name__ == "__main__":
+    unittest.main()
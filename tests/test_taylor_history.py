@@ -0,0 +1,97 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+
+from src.core.modeling_core import TaylorRuleModels
+from src.core.taylor_history import (
+    TaylorPathGenerator,
+    TaylorPathPanel,
+    deviation_stats,
+)
+
+
+def history_inputs(n_months=120, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2010-01-01", periods=n_months, freq="MS")
+    return pd.DataFrame(
+        {
+            "r_star": 0.6,
+            "inflation": 2.0 + np.cumsum(rng.normal(0, 0.2, n_months)),
+            "output_gap": rng.normal(0, 1.0, n_months),
+            "financial_stress": rng.normal(-0.3, 0.3, n_months),
+            "actual_rate": 2.0 + np.cumsum(rng.normal(0, 0.1, n_months)),
+        },
+        index=index,
+    )
+
+
+class TaylorHistoryTests(unittest.TestCase):
+    def test_paths_match_scalar_rules(self):
+        inputs = history_inputs(24)
+        panel = TaylorPathGenerator().evaluate(inputs)
+        models = TaylorRuleModels()
+
+        for i in range(1, len(inputs)):
+            row = inputs.iloc[i]
+            args = (row["r_star"], row["inflation"], row["output_gap"])
+            nonlinear = models.taylor_nonlinear(*args)
+            expected = {
+                "taylor_1993": models.taylor_1993(*args),
+                "taylor_1999": models.taylor_1999(*args),
+                "nonlinear": nonlinear,
+                "post_08": models.post_08_adjusted(*args, row["financial_stress"]),
+                "smoothed": models.apply_smoothing(
+                    nonlinear, inputs["actual_rate"].iloc[i - 1]
+                ),
+            }
+            for rule, value in expected.items():
+                self.assertAlmostEqual(panel[rule].iloc[i], value)
+        self.assertTrue(np.isnan(panel["smoothed"].iloc[0]))
+
+    def test_new_months_extend_the_cached_panel(self):
+        inputs = history_inputs(120)
+        cache = TaylorPathPanel()
+        cache.update(inputs.iloc[:100])
+        self.assertEqual(cache.rows_evaluated, 100)
+
+        cache.update(inputs.iloc[:100])
+        self.assertEqual(cache.rows_evaluated, 100)
+
+        panel = cache.update(inputs)
+        self.assertEqual(cache.rows_evaluated, 120)
+        pd.testing.assert_frame_equal(panel, TaylorPathGenerator().evaluate(inputs))
+
+    def test_revised_month_recomputes_from_the_revision(self):
+        inputs = history_inputs(60)
+        cache = TaylorPathPanel()
+        cache.update(inputs)
+
+        revised = inputs.copy()
+        revised.iloc[50, revised.columns.get_loc("inflation")] += 1.0
+        panel = cache.update(revised)
+
+        self.assertEqual(cache.rows_evaluated, 60 + 10)
+        pd.testing.assert_frame_equal(panel, TaylorPathGenerator().evaluate(revised))
+
+    def test_deviation_stats_summarise_actual_minus_rule(self):
+        inputs = history_inputs(36)
+        panel = TaylorPathGenerator().evaluate(inputs)
+
+        stats = deviation_stats(panel)
+        deviation = (panel["actual_rate"] - panel["taylor_1999"]) * 100
+
+        self.assertEqual(stats["taylor_1999"]["n"], 36)
+        self.assertEqual(stats["smoothed"]["n"], 35)
+        self.assertAlmostEqual(stats["taylor_1999"]["mean_bps"], deviation.mean())
+        self.assertAlmostEqual(stats["taylor_1999"]["latest_bps"], deviation.iloc[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
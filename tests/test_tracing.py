@@ -0,0 +1,133 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from macro_fixtures import synthetic_fred_frames
+
+from src.core import tracing
+
+
+class TracingTests(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(tracing.disable)
+
+    def test_disabled_spans_are_a_shared_no_op(self):
+        calls = []
+
+        @tracing.traced("fetch")
+        def fetch():
+            calls.append(1)
+            return "ok"
+
+        self.assertIs(tracing.span("fetch", "a"), tracing.span("report", "b"))
+        self.assertEqual(fetch(), "ok")
+        self.assertEqual(fetch.__name__, "fetch")
+        self.assertIsNone(tracing.current())
+
+    def test_nested_spans_split_self_time_by_stage(self):
+        tracer = tracing.enable()
+
+        with tracing.span("regression", "outer"):
+            time.sleep(0.02)
+            with tracing.span("fetch", "inner", series="GDPC1"):
+                time.sleep(0.03)
+
+        outer, inner = sorted(tracer.spans, key=lambda record: record["start_ms"])
+        self.assertEqual(inner["parent"], outer["id"])
+        self.assertEqual(inner["attrs"], {"series": "GDPC1"})
+        totals = tracer.stage_totals()
+        self.assertAlmostEqual(
+            totals["regression"]["self_ms"],
+            outer["duration_ms"] - inner["duration_ms"],
+        )
+        self.assertGreaterEqual(totals["fetch"]["self_ms"], 25.0)
+        self.assertIn("regression", tracer.format_summary())
+
+    def test_threads_keep_separate_parent_stacks(self):
+        tracer = tracing.enable()
+
+        def worker():
+            with tracing.span("fetch", "worker"):
+                pass
+
+        with tracing.span("task", "main"):
+            thread = threading.Thread(target=tracing.propagate(worker), name="fetch-worker")
+            thread.start()
+            thread.join()
+        with tracing.span("task", "sibling"):
+            pass
+
+        main = next(record for record in tracer.spans if record["name"] == "main")
+        sibling = next(record for record in tracer.spans if record["name"] == "sibling")
+        worker_span = next(record for record in tracer.spans if record["name"] == "worker")
+        self.assertEqual(worker_span["parent"], main["id"])
+        self.assertIsNone(sibling["parent"])
+        self.assertEqual(worker_span["thread"], "fetch-worker")
+
+    def test_pool_work_is_not_counted_again_in_the_waiting_parent(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        tracer = tracing.enable()
+
+        def fetch(_):
+            with tracing.span("fetch", "series"):
+                time.sleep(0.05)
+
+        with tracing.span("task", "main"):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(tracing.propagate(fetch), range(4)))
+
+        totals = tracer.stage_totals()
+        main = next(record for record in tracer.spans if record["name"] == "main")
+        self.assertLess(totals["task"]["self_ms"], 0.5 * main["duration_ms"])
+        self.assertGreaterEqual(totals["task"]["self_ms"], 0.0)
+        self.assertGreaterEqual(totals["fetch"]["self_ms"], 190.0)
+
+    def test_chrome_trace_uses_complete_events_in_microseconds(self):
+        tracer = tracing.enable()
+        with tracing.span("plot", "chart"):
+            time.sleep(0.01)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = tracer.write(os.path.join(tmp, "trace.json"), fmt="chrome")
+            with open(path, encoding="utf-8") as handle:
+                trace = json.load(handle)
+
+        event = next(event for event in trace["traceEvents"] if event["ph"] == "X")
+        self.assertEqual((event["name"], event["cat"]), ("chart", "plot"))
+        self.assertGreaterEqual(event["dur"], 10000)
+        self.assertTrue(any(event["ph"] == "M" for event in trace["traceEvents"]))
+
+    def test_nowcast_records_each_stage(self):
+        from src.engine.gdp_nowcast_engine import GDPCastNowEngine
+
+        frames = synthetic_fred_frames(n_months=200)
+        engine = GDPCastNowEngine("US")
+        tracer = tracing.enable()
+        with mock.patch.object(
+            GDPCastNowEngine,
+            "fetch_fred",
+            tracing.traced("fetch")(lambda _engine, sid, limit=160: frames[sid].copy()),
+        ):
+            engine._fit_bridge(engine._fetch_inputs())
+
+        stages = tracer.stage_totals()
+        for stage in ("fetch", "transform", "factor", "regression", "calibration", "simulation"):
+            self.assertIn(stage, stages)
+        self.assertEqual(stages["fetch"]["count"], len(engine.indicators) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
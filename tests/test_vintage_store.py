@@ -0,0 +1,114 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+SKILL_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "economics-ml"))
+if SKILL_ROOT not in sys.path:
+    sys.path.insert(0, SKILL_ROOT)
+
+from backtest_engine import BacktestEngine
+from src.data_utils.synthetic_fred import FredStubServer, SyntheticUniverse
+from src.data_utils.vintage_store import REALTIME_END, REALTIME_START, VintageSeries
+
+
+def row(date, start, end, value):
+    return {"date": date, "realtime_start": start, "realtime_end": end, "value": value}
+
+
+class VintageSeriesTests(unittest.TestCase):
+    def test_as_of_returns_the_value_published_on_each_day(self):
+        vintages = VintageSeries.from_records(
+            [
+                row("2024-02-01", "2024-03-08", "9999-12-31", "."),
+                row("2024-01-01", "2024-03-08", "9999-12-31", "3.2"),
+                row("2024-01-01", "2024-02-02", "2024-03-07", "3.0"),
+                row("2024-02-01", "2024-04-05", "9999-12-31", "3.4"),
+            ],
+            "UNRATE",
+        )
+
+        def published(day):
+            series = vintages.as_of(day)
+            return dict(zip(series.dates.astype(str).tolist(), series.values.tolist()))
+
+        self.assertEqual(published("2024-02-01"), {})
+        self.assertEqual(published("2024-02-02"), {"2024-01-01": 3.0})
+        self.assertEqual(published("2024-03-08"), {"2024-01-01": 3.2})
+        self.assertEqual(published("2030-01-01"), {"2024-01-01": 3.2, "2024-02-01": 3.4})
+        self.assertEqual(vintages.vintage_dates.astype(str).tolist(), ["2024-02-02", "2024-03-08", "2024-04-05"])
+
+    def test_as_of_matches_a_scan_of_the_synthetic_vintages(self):
+        universe = SyntheticUniverse(years=25)
+        for sid in ("PAYEMS", "GDPC1", "ICSA"):
+            payload = universe.observations(sid, realtime_start=REALTIME_START, realtime_end=REALTIME_END)
+            vintages = VintageSeries.from_records(payload["observations"], sid)
+            for day in ("2003-02-10", "2026-05-20", "2026-07-10"):
+                expected = [
+                    obs
+                    for obs in universe.observations(sid, realtime_start=day)["observations"]
+                    if obs["value"] != "."
+                ]
+                series = vintages.as_of(day)
+                self.assertEqual(series.dates.astype(str).tolist(), [obs["date"] for obs in expected])
+                np.testing.assert_allclose(series.values, [float(obs["value"]) for obs in expected])
+
+    def test_update_splices_newer_vintages_into_stored_ones(self):
+        universe = SyntheticUniverse(years=25)
+        full = universe.observations("PAYEMS", realtime_start=REALTIME_START, realtime_end=REALTIME_END)
+        full = VintageSeries.from_records(full["observations"], "PAYEMS")
+        stored = universe.observations("PAYEMS", realtime_start=REALTIME_START, realtime_end="2026-05-20")
+        newer = universe.observations("PAYEMS", realtime_start="2026-05-21", realtime_end=REALTIME_END)
+
+        stored = VintageSeries.from_state(
+            VintageSeries.from_records(stored["observations"], "PAYEMS").to_state(), "PAYEMS"
+        )
+        updated = stored.update(VintageSeries.from_records(newer["observations"]), "2026-05-21")
+
+        self.assertEqual(len(updated), len(full))
+        np.testing.assert_array_equal(updated.keys, full.keys)
+        np.testing.assert_array_equal(updated.realtime_end, full.realtime_end)
+        for day in ("2026-05-20", "2026-06-10", "2026-07-10"):
+            np.testing.assert_allclose(updated.as_of(day).values, full.as_of(day).values)
+
+
+class RealTimeBacktestTests(unittest.TestCase):
+    def test_expanding_window_trains_on_published_vintages(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = {"FRED_API_KEY": "test", "ECONOMICS_ML_CACHE_DIR": tmp.name}
+        with FredStubServer(SyntheticUniverse(years=30)) as server, patch.dict(
+            os.environ, dict(env, FRED_BASE_URL=server.base_url)
+        ):
+            engine = BacktestEngine()
+            engine.countries["US"]["aux_indicators"] = {}
+            engine.vintage_page_limit = 200
+            bundle = engine.prepare_data("US")
+            latest_requests = server.requests
+
+            real_time = engine.run_expanding_window("US", data_bundle=bundle, real_time=True)
+            paged_requests = server.requests - latest_requests
+            revised = BacktestEngine().run_expanding_window("US", data_bundle=bundle)
+
+            # A later run reads the stored vintages and asks only for newer ones.
+            latest_requests = server.requests
+            again = BacktestEngine()
+            again.countries["US"]["aux_indicators"] = {}
+            store = again.load_vintages("US")
+            topped_up_requests = server.requests - latest_requests
+
+        self.assertNotIn("vintages", bundle)
+        self.assertEqual(sorted(store.series), ["GDPC1", "INDPRO", "PAYEMS", "PCEC96", "RSAFS", "UNRATE"])
+        self.assertGreater(paged_requests, 12)
+        self.assertLessEqual(topped_up_requests, len(store))
+        self.assertEqual(real_time["real_time_quarters"], len(real_time["df"]))
+        self.assertEqual(revised["real_time_quarters"], 0)
+        np.testing.assert_allclose(real_time["df"]["Actual"], revised["df"]["Actual"])
+        self.assertFalse(np.allclose(real_time["df"]["Predicted"], revised["df"]["Predicted"]))
+
+
+if __name__ == "__main__":
+    unittest.main()